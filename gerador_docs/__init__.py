@@ -1,2 +1,26 @@
-from gerador_docs.tipos import CPF, DadosPessoais, Endereco, RG
-from gerador_docs.tipos._typing import DadosPessoaisDict, EnderecoDict
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gerador_docs.tipos import CPF, DadosPessoais, Endereco, RG
+    from gerador_docs.tipos._typing import DadosPessoaisDict, EnderecoDict
+
+# Os tipos são importados sob demanda para que a CLI ('docgen --help', por exemplo) não pague por eles.
+_LAZY_ATTRIBUTES = {
+    'CPF': 'gerador_docs.tipos',
+    'DadosPessoais': 'gerador_docs.tipos',
+    'Endereco': 'gerador_docs.tipos',
+    'RG': 'gerador_docs.tipos',
+    'DadosPessoaisDict': 'gerador_docs.tipos._typing',
+    'EnderecoDict': 'gerador_docs.tipos._typing',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
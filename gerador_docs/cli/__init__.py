@@ -1,16 +1,46 @@
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError, RawDescriptionHelpFormatter
 from textwrap import dedent
 
-from rich_argparse import RawDescriptionRichHelpFormatter
-
 from gerador_docs.cli.parsers import config_subparsers as config_parser
 from gerador_docs.cli._types import NamespaceMapper
 
+class DocgenArgumentParser(ArgumentParser):
+    """
+    ArgumentParser que só importa o rich_argparse (e o rich) quando precisa exibir a ajuda
+    ou uma mensagem de uso/erro. A análise dos argumentos usa o formatter da biblioteca padrão.
+    """
+
+    def format_usage(self) -> str:
+        return self._format_with_rich(super().format_usage)
+
+    def format_help(self) -> str:
+        return self._format_with_rich(super().format_help)
+
+    def _format_with_rich(self, format_method) -> str:
+        from rich_argparse import RawDescriptionRichHelpFormatter
+
+        formatter_class = self.formatter_class
+        self.formatter_class = RawDescriptionRichHelpFormatter
+        try:
+            return format_method()
+        finally:
+            self.formatter_class = formatter_class
+
+def _destino_perfil(valor: str) -> str:
+    """Arquivo de saída do perfil: a extensão define o formato (.pstats ou .json)."""
+    from pathlib import Path
+
+    from gerador_docs.perfil import FORMATOS
+
+    if Path(valor).suffix.lower() not in FORMATOS:
+        raise ArgumentTypeError(f"formato de perfil não suportado: '{valor}' (use {' ou '.join(FORMATOS)})")
+    return valor
+
 def _create_parser() -> ArgumentParser:
     """
     Create and return an instance of ArgumentParser with the necessary subcommands.
     """
-    parser = ArgumentParser(
+    parser = DocgenArgumentParser(
         'docgen',
         description=dedent("""
             Gerador de Documentação para a emissão de CAF e Declarações de Agricultor
@@ -18,9 +48,41 @@ def _create_parser() -> ArgumentParser:
         """
         ),
         epilog='Use "docgen <comando> -h/--help" para mais informações sobre cada comando.',
-        formatter_class=RawDescriptionRichHelpFormatter,
+        formatter_class=RawDescriptionHelpFormatter,
     )
     
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=(
+            "Mede o tempo de cada etapa (comando, banco de dados, validação, renderização) e exibe um resumo ao final "
+            "(o mesmo que DOCGEN_PROFILE=1)."
+        ),
+    )
+    parser.add_argument(
+        '--profile-saida',
+        type=_destino_perfil,
+        metavar='ARQUIVO',
+        help=(
+            "Com --profile, grava também o cProfile da execução (ARQUIVO.pstats) ou os spans no formato "
+            "Chrome trace (ARQUIVO.json); implica --profile (o mesmo que DOCGEN_PROFILE=ARQUIVO)."
+        ),
+    )
+    parser.add_argument(
+        '--log-format',
+        choices=['rich', 'json'],
+        default=None,
+        help=(
+            "Ativa os logs em stderr: 'rich' (terminal) ou 'json', um evento JSON por linha para pipelines de logs, "
+            "terminando com o valor dos contadores de métricas. Sem esta opção os eventos não são exibidos."
+        ),
+    )
+    parser.add_argument(
+        '--metricas',
+        action='store_true',
+        help="Exibe ao final os contadores de métricas (documentos gerados, falhas de validação, cache, bytes gravados).",
+    )
+
     # Add subcommands
     config_parser(parser)
     
@@ -39,13 +101,19 @@ def main() -> None:
         clear()  # Clear the console before displaying the help message
         args = parser.parse_args(namespace=NamespaceMapper())
 
-        print(
-            dedent(f"""
-            Comando: {args.command}
-            Argumentos: {args.to_dict()}
-            """
+        if args.log_format is not None:
+            # só configura (e importa o rich, no formato 'rich') quando os logs são pedidos
+            from gerador_docs.logger import configurar_log
+
+            configurar_log(args.log_format)
+        if args.log_format != 'json':
+            print(
+                dedent(f"""
+                Comando: {args.command}
+                Argumentos: {args.to_dict()}
+                """
+                )
             )
-        )
         
         # Here you would handle the parsed arguments and execute the corresponding actions
         # For now, we just print the parsed arguments
@@ -56,6 +124,41 @@ def main() -> None:
         return
     else:
         from gerador_docs.cli.runners import DefaultRunner
+        from gerador_docs.perfil import destino_do_ambiente, perfilar
 
         default_runner = DefaultRunner()
-        getattr(default_runner, args.command)(vars(args))
+        destino_perfil = args.profile_saida or ('' if args.profile else destino_do_ambiente())
+        if destino_perfil and not args.profile_saida:
+            # o arquivo vindo de DOCGEN_PROFILE não passou pela validação do argparse
+            try:
+                _destino_perfil(destino_perfil)
+            except ArgumentTypeError as e:
+                parser.error(f"DOCGEN_PROFILE: {e}")
+        try:
+            if destino_perfil is None:
+                _executar(default_runner, args)
+            else:
+                with perfilar(destino_perfil or None):
+                    _executar(default_runner, args)
+        finally:
+            if args.log_format == 'json' or args.metricas:
+                from gerador_docs.logger import registrar_metricas
+
+                registrar_metricas(args.log_format or 'rich')
+
+def _executar(runner, args: NamespaceMapper) -> None:
+    """Executa o comando, registrando no log o início, a duração e o resultado."""
+    import time
+
+    from gerador_docs.logger import obter_logger
+
+    logger = obter_logger('cli')
+    logger.info('comando iniciado', extra={'dados': {'comando': args.command, 'argumentos': vars(args)}})
+    inicio = time.perf_counter()
+    try:
+        getattr(runner, args.command)(vars(args))
+    except Exception:
+        segundos = round(time.perf_counter() - inicio, 3)
+        logger.exception('comando falhou', extra={'dados': {'comando': args.command, 'segundos': segundos}})
+        raise
+    logger.info('comando concluído', extra={'dados': {'comando': args.command, 'segundos': round(time.perf_counter() - inicio, 3)}})
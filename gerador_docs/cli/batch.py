@@ -0,0 +1,126 @@
+"Execução de vários comandos do docgen, listados num manifesto, num único processo."
+import csv
+import json
+from argparse import ArgumentParser
+from contextlib import redirect_stderr
+from dataclasses import dataclass
+from io import StringIO
+from pathlib import Path
+from typing import Iterator, List, Optional, TextIO, Tuple, Union
+
+from gerador_docs.cli._types import NamespaceMapper
+
+
+@dataclass(slots=True)
+class ResultadoLinha:
+    """Resultado da execução de uma linha do manifesto."""
+    linha: int
+    comando: str
+    sucesso: bool
+    erro: Optional[str] = None
+
+
+def ler_manifesto(caminho: Union[str, Path]) -> Iterator[Tuple[int, List[str], Optional[str]]]:
+    """Lê o manifesto linha a linha, retornando (número da linha, argv, erro).
+    Linhas que não podem ser interpretadas (JSON inválido ou sem comando) vêm com argv vazio e o motivo em `erro`,
+    para que sejam registradas como falhas sem interromper o lote.
+    :raises ValueError: Se a extensão não for .jsonl/.csv.
+    :raises OSError: Se o manifesto não puder ser aberto (ex.: arquivo inexistente).
+    """
+    caminho = Path(caminho)
+    sufixo = caminho.suffix.lower()
+    if sufixo not in ('.jsonl', '.csv'):
+        raise ValueError(f"Manifesto deve ser .jsonl ou .csv: {caminho}.")
+    # aberto aqui, e não no gerador, para que um arquivo inexistente seja informado antes de executar o lote
+    fp = open(caminho, encoding='utf-8', newline='')
+    return _ler_csv(fp) if sufixo == '.csv' else _ler_jsonl(fp)
+
+
+def _ler_csv(fp: TextIO) -> Iterator[Tuple[int, List[str], Optional[str]]]:
+    with fp:
+        for numero_linha, linha in enumerate(csv.reader(fp), start=1):
+            argv = [valor for valor in linha if valor.strip()]
+            if argv:
+                yield numero_linha, argv, None
+
+
+def _ler_jsonl(fp: TextIO) -> Iterator[Tuple[int, List[str], Optional[str]]]:
+    with fp:
+        for numero_linha, linha in enumerate(fp, start=1):
+            if not linha.strip():
+                continue
+            try:
+                yield numero_linha, _argv(json.loads(linha)), None
+            except json.JSONDecodeError as e:
+                yield numero_linha, [], f"JSON inválido: {e}"
+            except ValueError as e:
+                yield numero_linha, [], str(e)
+
+
+def _argv(registro) -> List[str]:
+    """argv de uma linha JSON: uma lista ["comando", "arg", ...] ou {"command": ..., "args": [...]}.
+    :raises ValueError: Se a linha não tiver esse formato.
+    """
+    if isinstance(registro, dict):
+        if 'command' not in registro:
+            raise ValueError("objeto sem o campo 'command'")
+        argumentos = registro.get('args', [])
+        if not isinstance(argumentos, list):
+            raise ValueError("o campo 'args' deve ser uma lista")
+        registro = [registro['command'], *argumentos]
+    elif not isinstance(registro, list):
+        raise ValueError('a linha deve ser uma lista ["comando", ...] ou um objeto {"command": ..., "args": [...]}')
+    if not registro:
+        raise ValueError('linha sem comando')
+    return [str(valor) for valor in registro]
+
+
+def executar_manifesto(
+    caminho: Union[str, Path],
+    parser: Optional[ArgumentParser] = None,
+    runner=None,
+    parar_no_erro: bool = False,
+) -> List[ResultadoLinha]:
+    """Analisa e executa cada linha do manifesto reaproveitando o mesmo parser e o mesmo runner.
+    Falhas (linhas mal formadas, argumentos inválidos ou exceções do comando) são registradas por linha e não
+    interrompem o lote, a menos que `parar_no_erro` seja True.
+    :raises ValueError: Se a extensão do manifesto não for .jsonl/.csv.
+    :raises OSError: Se o manifesto não puder ser aberto.
+    """
+    if parser is None:
+        from gerador_docs.cli import _create_parser
+        parser = _create_parser()
+    if runner is None:
+        from gerador_docs.cli.runners import DefaultRunner
+        runner = DefaultRunner()
+
+    resultados = []
+    for numero_linha, argv, erro in ler_manifesto(caminho):
+        if erro is None:
+            resultado = _executar_linha(parser, runner, numero_linha, argv)
+        else:
+            resultado = ResultadoLinha(numero_linha, argv[0] if argv else '', False, erro)
+        resultados.append(resultado)
+        if parar_no_erro and not resultado.sucesso:
+            break
+    return resultados
+
+
+def _executar_linha(parser: ArgumentParser, runner, numero_linha: int, argv: List[str]) -> ResultadoLinha:
+    comando = argv[0]
+    if comando == 'batch':
+        return ResultadoLinha(numero_linha, comando, False, "o comando 'batch' não pode ser usado dentro de um manifesto")
+
+    erros = StringIO()
+    try:
+        with redirect_stderr(erros):
+            args = parser.parse_args(argv, namespace=NamespaceMapper())
+    except SystemExit:
+        mensagem = erros.getvalue().strip().splitlines()
+        return ResultadoLinha(numero_linha, comando, False, mensagem[-1] if mensagem else 'argumentos inválidos')
+
+    try:
+        getattr(runner, args.command)(vars(args))
+    except Exception as e:
+        return ResultadoLinha(numero_linha, comando, False, f"{type(e).__name__}: {e}")
+    return ResultadoLinha(numero_linha, comando, True)
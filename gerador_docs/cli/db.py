@@ -0,0 +1,90 @@
+"Ações do comando `db` (add, update, remove, list) sobre os registros tipados pelo esquema de cada tabela."
+from typing import List, Optional
+
+from gerador_docs.errors import DuplicateRecordError, RecordFormatError
+from gerador_docs.esquemas import Esquema, separar_dados
+from gerador_docs.repository import IRepository
+from gerador_docs.tipos.documents import formatar_cpf
+
+# Campos aceitos como filtro em '--action list' (ver IRepository.query)
+FILTROS_LIST = ('nome_completo', 'bairro')
+
+
+def executar_acao(esquema: Esquema, acao: Optional[str], dados: Optional[List[List[str]]], repositorio: IRepository) -> List[str]:
+    """Executa a ação sobre a tabela do esquema.
+    :param dados: Argumentos de `--dados`, como recebidos do argparse (uma lista por ocorrência).
+    :return: Mensagens a exibir.
+    :raises RecordFormatError: Se a ação ou os dados não corresponderem ao esquema.
+    """
+    if acao not in _ACOES:
+        raise RecordFormatError("Informe a ação com '--action' (add, remove, update ou list).")
+    registros, identificadores = separar_dados(dados)
+    return _ACOES[acao](esquema, registros, identificadores, repositorio)
+
+def _registros(esquema: Esquema, registros):
+    """Converte os registros de --dados, identificando na mensagem de erro qual --dados falhou."""
+    for posicao, registro in enumerate(registros, start=1):
+        try:
+            yield esquema.registro(registro)
+        except RecordFormatError as e:
+            raise RecordFormatError(f"--dados nº {posicao}: {e}") from None
+
+def _add(esquema: Esquema, registros, identificadores, repositorio: IRepository) -> List[str]:
+    if identificadores or not registros:
+        raise RecordFormatError("Em '--action add' cada '--dados' deve conter pares campo:valor.")
+    pessoas = list(_registros(esquema, registros))
+    try:
+        quantidade = repositorio.add_many(pessoas)
+    except DuplicateRecordError as e:
+        return [f"Nenhum registro adicionado: {e}"]
+    return [f"{quantidade} registro(s) adicionado(s) em '{esquema.tabela}'."]
+
+def _update(esquema: Esquema, registros, identificadores, repositorio: IRepository) -> List[str]:
+    """Atualização parcial: os campos informados substituem os do registro existente (identificado pela chave)."""
+    if identificadores or not registros:
+        raise RecordFormatError(f"Em '--action update' cada '--dados' deve conter '{esquema.chave}:...' e os campos a alterar.")
+    parciais = []
+    for posicao, registro in enumerate(registros, start=1):
+        valores = esquema.valores(registro, parcial=True)
+        if esquema.chave not in valores:
+            raise RecordFormatError(f"--dados nº {posicao}: informe o campo '{esquema.chave}' do registro a atualizar.")
+        parciais.append((formatar_cpf(valores[esquema.chave]), registro))
+
+    existentes = repositorio.get_many(chave for chave, _ in parciais)
+    mensagens, atualizados = [], 0
+    for chave, registro in parciais:
+        if chave not in existentes:
+            mensagens.append(f"Registro não encontrado: {chave}.")
+            continue
+        try:
+            atualizado = esquema.atualizar(existentes[chave], registro)
+        except RecordFormatError as e:
+            raise RecordFormatError(f"Registro {chave}: {e}") from None
+        atualizados += repositorio.update(atualizado)
+    mensagens.append(f"{atualizados} registro(s) atualizado(s) em '{esquema.tabela}'.")
+    return mensagens
+
+def _remove(esquema: Esquema, registros, identificadores, repositorio: IRepository) -> List[str]:
+    chaves = [*identificadores]
+    for registro in registros:
+        valores = esquema.valores(registro, parcial=True)
+        if esquema.chave not in valores or len(valores) > 1:
+            raise RecordFormatError(f"Em '--action remove' informe apenas '{esquema.chave}:...' ou o identificador.")
+        chaves.append(valores[esquema.chave])
+    if not chaves:
+        raise RecordFormatError("Informe os identificadores dos registros a remover em '--dados'.")
+    quantidade = repositorio.remove_many(formatar_cpf(chave) for chave in chaves)
+    return [f"{quantidade} registro(s) removido(s) de '{esquema.tabela}'."]
+
+def _list(esquema: Esquema, registros, identificadores, repositorio: IRepository) -> List[str]:
+    filtros = {}
+    for registro in registros:
+        filtros.update(esquema.valores(registro, parcial=True))
+    if identificadores or set(filtros).difference(FILTROS_LIST):
+        raise RecordFormatError(f"Em '--action list' os filtros aceitos são: {', '.join(FILTROS_LIST)}.")
+
+    pessoas = repositorio.query(**filtros) if filtros else repositorio.list()
+    linhas = [' | '.join(esquema.achatar(pessoa).get(campo, '') for campo in ('cpf', 'nome_completo', 'rg', 'bairro')) for pessoa in pessoas]
+    return [*linhas, f"{len(linhas)} registro(s) em '{esquema.tabela}'."]
+
+_ACOES = {'add': _add, 'update': _update, 'remove': _remove, 'list': _list}
@@ -5,12 +5,17 @@ from .parser_pocos import poco_subparser
 from .parser_caf import caf_subparser
 from .parser_declaracao import declaracao_subparser
 from .parser_pag import pagamento_subparser
+from .parser_batch import batch_subparser
+from .parser_dev import dev_subparser
 
 def config_subparsers(parser: ArgumentParser) -> None: 
-    subparser = parser.add_subparsers(dest="command", required=True,)
+    # 'prog' explícito evita instanciar um formatter só para montar o nome do programa
+    subparser = parser.add_subparsers(dest="command", required=True, prog=parser.prog)
 
     db_subparser(subparser, parser.formatter_class)
-    poco_subparser(subparser)
-    caf_subparser(subparser)
-    declaracao_subparser(subparser)
-    pagamento_subparser(subparser)
+    poco_subparser(subparser, parser.formatter_class)
+    caf_subparser(subparser, parser.formatter_class)
+    declaracao_subparser(subparser, parser.formatter_class)
+    pagamento_subparser(subparser, parser.formatter_class)
+    batch_subparser(subparser, parser.formatter_class)
+    dev_subparser(subparser, parser.formatter_class)
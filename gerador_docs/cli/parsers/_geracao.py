@@ -0,0 +1,68 @@
+from argparse import ArgumentParser, ArgumentTypeError
+
+def _jobs(valor: str) -> int:
+    """Número de processos: inteiro maior ou igual a zero (0 = todos os núcleos)."""
+    try:
+        jobs = int(valor)
+    except ValueError:
+        raise ArgumentTypeError(f"número de processos inválido: '{valor}'") from None
+    if jobs < 0:
+        raise ArgumentTypeError(f"o número de processos não pode ser negativo: {jobs}")
+    return jobs
+
+def add_generation_arguments(parser: ArgumentParser) -> None:
+    """Argumentos comuns aos comandos que geram documentos (caf, dec, poco e pagamento)."""
+    parser.add_argument(
+        "--pessoas",
+        default=None,
+        metavar="ARQUIVO",
+        help="Arquivo JSON Lines com os beneficiários (um registro de DadosPessoais.to_dict() por linha).",
+    )
+
+    parser.add_argument(
+        "--saida",
+        default="documentos",
+        metavar="DIRETORIO",
+        help="Diretório onde os documentos serão gravados (padrão: ./documentos).",
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=_jobs,
+        default=1,
+        metavar="N",
+        help="Número de processos usados na renderização (padrão: 1; 0 usa todos os núcleos).",
+    )
+
+    parser.add_argument(
+        "--template",
+        default=None,
+        metavar="ARQUIVO",
+        help="Template .docx a ser usado no lugar do template padrão do comando.",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Gera apenas os documentos cujos dados ou template mudaram desde a última execução.",
+    )
+
+def add_merge_arguments(parser: ArgumentParser) -> None:
+    """Argumentos dos comandos que podem gerar um único documento para o lote (dec e caf)."""
+    parser.add_argument(
+        "--mesclar",
+        action="store_true",
+        help="Gera um único documento com todos os beneficiários, um por página (<comando>_lote.docx).",
+    )
+
+    parser.add_argument(
+        "--indice",
+        action="store_true",
+        help="Com --mesclar, grava também <comando>_lote.csv com a ordem de cada beneficiário no documento.",
+    )
+
+    parser.add_argument(
+        "--pdf",
+        action="store_true",
+        help="Com --mesclar, converte o documento para PDF (requer o LibreOffice instalado).",
+    )
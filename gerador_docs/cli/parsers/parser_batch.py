@@ -0,0 +1,38 @@
+from argparse import ArgumentParser, _SubParsersAction
+
+import textwrap
+
+def batch_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentParser:
+    batch_parser: ArgumentParser = subparser.add_parser(
+        "batch",
+        formatter_class=formatter_class,
+        description=textwrap.dedent(
+            """
+            Executa vários comandos do docgen, listados num manifesto, num único processo.
+
+            Formatos aceitos (pela extensão do arquivo):
+                - .jsonl: uma linha por comando, como lista de argumentos
+                    ["caf", ...] ou objeto {"command": "db", "args": ["pessoas", "--action", "list"]}
+                - .csv: uma linha por comando; a primeira coluna é o comando e as demais, os argumentos.
+            Linhas vazias são ignoradas. Ao final é exibido o resultado (sucesso/falha) de cada linha;
+            se alguma linha falhar (inclusive por estar mal formada), o docgen termina com status 1.
+            """
+        ),
+        help="Executa vários comandos a partir de um manifesto (JSON Lines ou CSV) num único processo."
+    )
+
+    batch_parser.set_defaults(command="batch")
+
+    batch_parser.add_argument(
+        "manifesto",
+        help="Arquivo .jsonl ou .csv com um comando por linha.",
+        metavar="MANIFESTO",
+    )
+
+    batch_parser.add_argument(
+        "--parar-no-erro",
+        action="store_true",
+        help="Interrompe a execução na primeira linha que falhar.",
+    )
+
+    return batch_parser
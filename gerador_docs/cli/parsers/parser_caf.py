@@ -1,11 +1,12 @@
 from argparse import ArgumentParser, _SubParsersAction
-from rich_argparse import RawDescriptionRichHelpFormatter
 
-def caf_subparser(subparser: _SubParsersAction) -> ArgumentParser:
+from ._geracao import add_generation_arguments, add_merge_arguments
+
+def caf_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentParser:
 
     caf_subparser: ArgumentParser = subparser.add_parser(
         "caf",
-        formatter_class=RawDescriptionRichHelpFormatter,
+        formatter_class=formatter_class,
         help="Comandos relacionados à emissão dos documentos relacionados ao CAF."
     )
 
@@ -13,4 +14,7 @@ def caf_subparser(subparser: _SubParsersAction) -> ArgumentParser:
         command="caf",
     )
 
+    add_generation_arguments(caf_subparser)
+    add_merge_arguments(caf_subparser)
+
     return caf_subparser
\ No newline at end of file
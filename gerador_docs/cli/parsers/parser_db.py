@@ -17,10 +17,15 @@ def db_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentPa
                 - remove: Remove dados da tabela.
                 - update: Atualiza dados existentes na tabela.
                 - list: Lista os dados da tabela, ou os nomes das tabelas + descrição disponíveis (em estudo de viabilização).
+                - dedup: Sugere registros que provavelmente são a mesma pessoa (nome, RG e bairro semelhantes),
+                  no banco de dados e, com '--from', também na planilha/JSON Lines informada.
             Cada ação requer que você forneça os dados necessários através do argumento '--dados'.
             
             [yellow]IMPORTANTE: O argumento '--dados' pode ser usado múltiplas vezes para fornecer vários valores.[/]
             
+            Para importar muitos beneficiários de uma vez, use [green]'--from ARQUIVO.csv|ARQUIVO.xlsx'[/] com [green]'--action add'[/]:
+            as linhas são validadas e gravadas em lotes, e as rejeitadas vão para '<ARQUIVO>.rejeitadas.csv'.
+
             [red]ATENÇÃO[/]: 
                 ao utilizar [green]'--action remove'[/] -> [green]'--dados'[/] deve receber um identificador ou vários identificadores 
                 que permita identificar o dado no banco de dados. Em caso de dúvidas sobre o identificador utilize: [green]'--action list'[/].
@@ -40,6 +45,9 @@ def db_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentPa
                     - %(prog)s NOME_TABELA --action list
                 4. Listar todas as tabelas disponiveis
                     - %(prog)s --action list (em estudo de viabilização)
+                5. Importar beneficiários de uma planilha
+                    - %(prog)s pessoas --from agricultores.csv --action add
+                    - %(prog)s pessoas --from agricultores.xlsx --action add --db sqlite:///dados.db --lote 5000
             """
         ),
         help="Comandos relacionados à manipulação dos dados dos poços e seus responsáveis (CRUD)."
@@ -69,11 +77,48 @@ def db_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentPa
     db_parser.add_argument(
         "--action",
         metavar='ACTION',
-        choices=["add", "remove", "update", "list"],
+        choices=["add", "remove", "update", "list", "dedup"],
         help="Ação a ser executada na tabela."
     )
 
+    db_parser.add_argument(
+        "--from",
+        dest="origem",
+        default=None,
+        metavar="ARQUIVO",
+        help="Planilha (.csv ou .xlsx) com os registros a importar ('--action add') ou a comparar ('--action dedup', aceita também .jsonl).",
+    )
+
+    db_parser.add_argument(
+        "--db",
+        default="docgen.json",
+        metavar="URI",
+        help="Banco de dados (ex.: sqlite:///dados.db ou tinydb://dados.json; padrão: docgen.json, em ./instance).",
+    )
+
+    db_parser.add_argument(
+        "--lote",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="Quantidade de linhas validadas e gravadas por transação na importação (padrão: 1000).",
+    )
+
+    db_parser.add_argument(
+        "--limiar",
+        type=float,
+        default=0.8,
+        metavar="PONTUACAO",
+        help="Pontuação mínima (0 a 1) para sugerir a mesclagem de dois registros em '--action dedup' (padrão: 0.8).",
+    )
+
+    db_parser.add_argument(
+        "--rejeitados",
+        default=None,
+        metavar="ARQUIVO",
+        help="CSV onde as linhas rejeitadas na importação são gravadas (padrão: <ARQUIVO>.rejeitadas.csv).",
+    )
+
     return db_parser
 
-# todo: função de validação dos dados para cada ação.
 # todo: add rich elements for terminal exibition
\ No newline at end of file
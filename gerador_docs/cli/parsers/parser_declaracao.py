@@ -1,11 +1,12 @@
 from argparse import ArgumentParser, _SubParsersAction
-from rich_argparse import RawDescriptionRichHelpFormatter
 
-def declaracao_subparser(subparser: _SubParsersAction) -> ArgumentParser:
+from ._geracao import add_generation_arguments, add_merge_arguments
+
+def declaracao_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentParser:
 
     declaracao_subparser: ArgumentParser = subparser.add_parser(
         "dec",
-        formatter_class=RawDescriptionRichHelpFormatter,
+        formatter_class=formatter_class,
         help="Comandos relacionados à emissão das declarações de pescador/agricultor."
     )
 
@@ -13,4 +14,7 @@ def declaracao_subparser(subparser: _SubParsersAction) -> ArgumentParser:
         command="dec",
     )
 
+    add_generation_arguments(declaracao_subparser)
+    add_merge_arguments(declaracao_subparser)
+
     return declaracao_subparser
\ No newline at end of file
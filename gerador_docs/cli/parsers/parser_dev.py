@@ -0,0 +1,74 @@
+from argparse import ArgumentParser, _SubParsersAction
+
+import textwrap
+
+def dev_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentParser:
+    dev_parser: ArgumentParser = subparser.add_parser(
+        "dev",
+        formatter_class=formatter_class,
+        help="Ferramentas de desenvolvimento (dados sintéticos para testes de carga).",
+    )
+
+    dev_parser.set_defaults(command="dev")
+
+    acoes = dev_parser.add_subparsers(dest="acao", required=True, prog=dev_parser.prog)
+
+    fake_parser: ArgumentParser = acoes.add_parser(
+        "fake",
+        formatter_class=formatter_class,
+        description=textwrap.dedent(
+            """
+            Gera beneficiários sintéticos, porém válidos (CPFs com dígitos verificadores corretos,
+            RGs e endereços em Feira Nova), de forma determinística a partir da semente (--seed).
+            Os registros são gravados em JSON Lines (--saida) ou diretamente num banco de dados (--db), em lotes.
+            Com --car, cada beneficiário recebe também um número de CAR sintético (requer --db com SQLite).
+            """
+        ),
+        help="Gera beneficiários sintéticos para testes de carga.",
+    )
+
+    fake_parser.add_argument(
+        "--count", "-n",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="Quantidade de beneficiários (padrão: 1000).",
+    )
+
+    fake_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        metavar="SEMENTE",
+        help="Semente do gerador; a mesma semente gera os mesmos dados (padrão: 0).",
+    )
+
+    destino = fake_parser.add_mutually_exclusive_group()
+    destino.add_argument(
+        "--saida",
+        default="pessoas.jsonl",
+        metavar="ARQUIVO",
+        help="Arquivo JSON Lines de saída (padrão: ./pessoas.jsonl).",
+    )
+    destino.add_argument(
+        "--db",
+        default=None,
+        metavar="URI",
+        help="Grava no banco de dados em vez do arquivo (ex.: sqlite:///dados.db ou tinydb://dados.json).",
+    )
+
+    fake_parser.add_argument(
+        "--lote",
+        type=int,
+        default=5000,
+        metavar="N",
+        help="Tamanho dos lotes gravados no banco de dados com --db (padrão: 5000).",
+    )
+
+    fake_parser.add_argument(
+        "--car",
+        action="store_true",
+        help="Vincula um número de CAR sintético a cada beneficiário, na tabela de documentos (requer --db sqlite:///...).",
+    )
+
+    return dev_parser
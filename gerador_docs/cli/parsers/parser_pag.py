@@ -1,10 +1,11 @@
 from argparse import ArgumentParser, _SubParsersAction
-from rich_argparse import RawDescriptionRichHelpFormatter
 
-def pagamento_subparser(subparser: _SubParsersAction) -> ArgumentParser:
+from ._geracao import add_generation_arguments
+
+def pagamento_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentParser:
     declaracao_subparser: ArgumentParser = subparser.add_parser(
         "pagamento",
-        formatter_class=RawDescriptionRichHelpFormatter,
+        formatter_class=formatter_class,
         help="Comandos relacionados à emissão das solicitações de pagamento emitidas pela secretaria."
     )
 
@@ -12,4 +13,6 @@ def pagamento_subparser(subparser: _SubParsersAction) -> ArgumentParser:
         command="pagamento",
     )
 
+    add_generation_arguments(declaracao_subparser)
+
     return declaracao_subparser
\ No newline at end of file
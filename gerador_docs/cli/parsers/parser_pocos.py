@@ -1,13 +1,13 @@
 from argparse import ArgumentParser, _SubParsersAction
 from argparse import ONE_OR_MORE
 
-from rich_argparse import RawDescriptionRichHelpFormatter
+from ._geracao import add_generation_arguments
 
-def poco_subparser(subparser: _SubParsersAction) -> ArgumentParser:
+def poco_subparser(subparser: _SubParsersAction, /, formatter_class) -> ArgumentParser:
 
     poco_subparser: ArgumentParser = subparser.add_parser(
         "poco",
-        formatter_class=RawDescriptionRichHelpFormatter,
+        formatter_class=formatter_class,
         help="Comandos relacionados à emissão das solicitações de pagamento dos poços."
     )
 
@@ -15,4 +15,6 @@ def poco_subparser(subparser: _SubParsersAction) -> ArgumentParser:
         command="poco",
     )
 
+    add_generation_arguments(poco_subparser)
+
     return poco_subparser
\ No newline at end of file
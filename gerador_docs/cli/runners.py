@@ -1,18 +1,210 @@
 from argparse import Namespace
 
+from gerador_docs.perfil import instrumentar
+
+@instrumentar('cli')
 class DefaultRunner:
     def poco(self, args: Namespace) -> None:
-        print(f"Executando comando 'poco' com os argumentos: {args}")
+        self._gerar('poco', args)
 
     def db(self, args: Namespace) -> None:
-        print(f"Executando comando 'db' com os argumentos: {args}")
+        if args['action'] == 'dedup':
+            self._deduplicar(args)
+            return
+        if args.get('origem'):
+            self._importar(args)
+            return
+
+        from gerador_docs.cli.db import executar_acao
+        from gerador_docs.errors import RecordFormatError
+        from gerador_docs.esquemas import obter_esquema
+        from gerador_docs.repository import create_engine
+
+        try:
+            esquema = obter_esquema(args['table'])
+            with create_engine(args['db']) as repositorio:
+                mensagens = executar_acao(esquema, args['action'], args.get('dados'), repositorio)
+        except RecordFormatError as e:
+            print(f"Erro: {e}")
+            return
+        print('\n'.join(mensagens))
 
     def dec(self, args: Namespace) -> None:
-        print(f"Executando comando 'dec' com os argumentos: {args}")
+        self._gerar('dec', args)
     
     def pagamento(self, args: Namespace) -> None:
-        print(f"Executando comando 'pagamento' com os argumentos: {args}")
+        self._gerar('pagamento', args)
     
     def caf(self, args: Namespace) -> None:
-        print(f"Executando comando 'caf' com os argumentos: {args}")
+        self._gerar('caf', args)
+
+    def batch(self, args: Namespace) -> None:
+        from dataclasses import asdict
+
+        from gerador_docs.cli.batch import executar_manifesto
+        from gerador_docs.logger import obter_logger
+
+        logger = obter_logger('batch')
+        try:
+            resultados = executar_manifesto(args['manifesto'], runner=self, parar_no_erro=args['parar_no_erro'])
+        except (OSError, ValueError) as e:
+            print(f"Erro: não foi possível ler o manifesto: {e}")
+            raise SystemExit(1) from None
+        for resultado in resultados:
+            situacao = 'ok' if resultado.sucesso else f'falhou ({resultado.erro})'
+            print(f"[linha {resultado.linha}] {resultado.comando or '-'}: {situacao}")
+            (logger.info if resultado.sucesso else logger.warning)('linha do manifesto', extra={'dados': asdict(resultado)})
+
+        falhas = sum(not resultado.sucesso for resultado in resultados)
+        print(f"{len(resultados)} comando(s) executado(s): {len(resultados) - falhas} com sucesso, {falhas} com falha.")
+        if falhas:
+            # status de saída diferente de zero para scripts e agendadores que chamam o docgen
+            raise SystemExit(1)
+
+    def _deduplicar(self, args: Namespace) -> None:
+        """Sugere mesclagens entre as pessoas do banco de dados (e da planilha de --from, se houver)."""
+        import time
+        from itertools import chain
+
+        from gerador_docs.deduplicacao import sugerir_mesclagens
+        from gerador_docs.importacao import ler_pessoas
+        from gerador_docs.repository import create_engine
+
+        inicio = time.perf_counter()
+        with create_engine(args['db']) as repositorio:
+            pessoas = repositorio.list()
+            if args.get('origem'):
+                pessoas = chain(pessoas, ler_pessoas(args['origem']))
+            resultado = sugerir_mesclagens(pessoas, limiar=args['limiar'])
+
+        for sugestao in resultado.sugestoes:
+            (cpf_a, cpf_b), (nome_a, nome_b) = sugestao.cpfs, sugestao.nomes
+            print(f"{sugestao.pontuacao:.2f} | {cpf_a} {nome_a} <-> {cpf_b} {nome_b} | {', '.join(sugestao.motivos)}")
+        for bloco in resultado.blocos_ignorados:
+            print(f"Bloco ignorado ({bloco.tamanho} registros, grande demais para comparar): {' / '.join(map(str, bloco.chave))}")
+        print(
+            f"{len(resultado.sugestoes)} sugestão(ões) de mesclagem entre {resultado.pessoas} registro(s) "
+            f"({resultado.pares_comparados} par(es) comparado(s), {len(resultado.blocos_ignorados)} bloco(s) grande(s) ignorado(s)) "
+            f"em {time.perf_counter() - inicio:.2f}s."
+        )
+
+    def _importar(self, args: Namespace) -> None:
+        """Importa os beneficiários de uma planilha (--from) em lotes validados."""
+        if args['action'] != 'add' or args['table'] != 'pessoas':
+            print("A importação de planilhas (--from) só é suportada com 'db pessoas --action add'.")
+            return
+
+        from gerador_docs.importacao import importar_planilha
+        from gerador_docs.repository import create_engine
+
+        with create_engine(args['db']) as repositorio:
+            relatorio = importar_planilha(args['origem'], repositorio, args['lote'], args.get('rejeitados'))
+
+        print(
+            f"{relatorio.lidas} linha(s) lida(s): {relatorio.gravadas} gravada(s), {relatorio.rejeitadas} rejeitada(s) "
+            f"em {relatorio.segundos:.2f}s ({relatorio.linhas_por_segundo:,.0f} linhas/s)."
+        )
+        if relatorio.arquivo_rejeitadas is not None:
+            print(f"Linhas rejeitadas gravadas em {relatorio.arquivo_rejeitadas}.")
+
+    def dev(self, args: Namespace) -> None:
+        getattr(self, f"_dev_{args['acao']}")(args)
+
+    def _dev_fake(self, args: Namespace) -> None:
+        """Gera --count beneficiários sintéticos em JSON Lines ou, com --db, no banco de dados em lotes."""
+        from gerador_docs.sintetico import em_lotes, gerar_cars, gerar_pessoas
+
+        pessoas = gerar_pessoas(args['count'], semente=args['seed'])
+        if not args.get('db'):
+            if args.get('car'):
+                print("Erro: --car requer --db (os números de CAR ficam na tabela de documentos do SQLite).")
+                return
+            from gerador_docs.serializacao import escrever_jsonl
+
+            quantidade = escrever_jsonl(pessoas, args['saida'])
+            print(f"{quantidade} beneficiário(s) sintético(s) gravado(s) em {args['saida']}.")
+            return
+
+        from gerador_docs.repository import create_engine
+
+        quantidade = cars = 0
+        with create_engine(args['db']) as repositorio:
+            if args.get('car') and not hasattr(repositorio, 'add_documentos'):
+                print(f"Erro: o banco {args['db']} não guarda documentos (CAF/CAR); use --car com sqlite:///...")
+                return
+            if not args.get('car'):
+                for lote in em_lotes(pessoas, args['lote']):
+                    quantidade += repositorio.add_many(lote)
+            else:
+                for lote in em_lotes(gerar_cars(pessoas, semente=args['seed']), args['lote']):
+                    quantidade += repositorio.add_many([pessoa for pessoa, _ in lote])
+                    cars += repositorio.add_documentos((pessoa.numero_cpf, 'CAR', car) for pessoa, car in lote)
+        print(f"{quantidade} beneficiário(s) sintético(s) gravado(s) em {args['db']}" + (f", com {cars} CAR(s)." if cars else "."))
+
+    def _gerar(self, comando: str, args: Namespace) -> None:
+        """Gera um documento por beneficiário do arquivo --pessoas, em paralelo (--jobs),
+        ou um único documento para todo o lote (--mesclar).
+        """
+        import os
+        from pathlib import Path
+
+        # valida os argumentos antes de importar o pipeline (docx, pool de processos), que é caro
+        if not args.get('pessoas'):
+            print(f"Nenhum beneficiário informado para o comando '{comando}' (use --pessoas ARQUIVO.jsonl).")
+            return
+        pessoas = Path(args['pessoas'])
+        if not pessoas.is_file() or not os.access(pessoas, os.R_OK):
+            print(f"Erro: não foi possível ler o arquivo de beneficiários '{pessoas}'.")
+            return
+
+        from gerador_docs.docx.pipeline import TEMPLATES_PADRAO, carregar_template_com_campos, gerar_documentos
+        from gerador_docs.errors import TemplateFieldError
+        from gerador_docs.serializacao import ler_jsonl
+
+        template = args.get('template') or TEMPLATES_PADRAO.get(comando)
+        if template is None:
+            print(f"O comando '{comando}' ainda não possui template padrão (use --template ARQUIVO.docx).")
+            return
+        try:
+            carregar_template_com_campos(template)
+        except TemplateFieldError as e:
+            print(f"Erro: {e}")
+            return
+
+        if args.get('mesclar'):
+            self._mesclar(comando, template, args)
+            return
+
+        resultados = gerar_documentos(
+            ler_jsonl(args['pessoas']), template, args['saida'], prefixo=comando, jobs=args['jobs'],
+            incremental=args.get('incremental', False),
+        )
+        for resultado in resultados:
+            if resultado.em_dia:
+                situacao = f'{resultado.caminho} (em dia)'
+            else:
+                situacao = str(resultado.caminho) if resultado.sucesso else f'falhou ({resultado.erro})'
+            print(f"[{resultado.indice + 1}] {resultado.cpf}: {situacao}")
+
+        falhas = sum(not resultado.sucesso for resultado in resultados)
+        em_dia = sum(resultado.em_dia for resultado in resultados)
+        print(
+            f"{len(resultados)} documento(s): {len(resultados) - falhas - em_dia} gerado(s), "
+            f"{em_dia} em dia, {falhas} com falha."
+        )
+
+    def _mesclar(self, comando: str, template: str, args: Namespace) -> None:
+        """Gera um único documento, uma página por beneficiário, opcionalmente com índice e PDF."""
+        from pathlib import Path
+
+        from gerador_docs.docx.merge import converter_pdf
+        from gerador_docs.docx.pipeline import gerar_documento_mesclado
+        from gerador_docs.serializacao import ler_jsonl
 
+        resultados = gerar_documento_mesclado(
+            ler_jsonl(args['pessoas']), template, args['saida'], prefixo=comando, indice=args['indice'],
+        )
+        caminho = Path(args['saida']) / f'{comando}_lote.docx'
+        print(f"{len(resultados)} documento(s) mesclado(s) em {caminho}.")
+        if args['pdf']:
+            print(f"PDF gerado em {converter_pdf(caminho)}.")
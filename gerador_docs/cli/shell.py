@@ -1,8 +1,13 @@
-import os
+import sys
 
 def clear():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen.
+
+    Uses ANSI escape sequences instead of spawning a `clear`/`cls` subprocess, and does
+    nothing when stdout is not a terminal (e.g. when docgen is called from scripts).
+    """
+    if sys.stdout.isatty():
+        sys.stdout.write('\033[2J\033[H')
+        sys.stdout.flush()
     
     return
-
@@ -0,0 +1,214 @@
+"""
+Detecção de pessoas duplicadas entre cadastros (ex.: listas de associações que se sobrepõem).
+
+Os nomes são normalizados (`normalizar_texto`) e reduzidos a uma chave fonética simplificada
+para o português. Em vez de comparar todos os pares (O(n²)), as pessoas são agrupadas em
+blocos de candidatos, e só pares dentro de um mesmo bloco são pontuados:
+
+    - mesmo CPF;
+    - mesma chave fonética do nome;
+    - mesmo bairro e mesma chave fonética do primeiro e do último nome.
+
+A pontuação combina a semelhança dos nomes (`difflib`), o RG (apenas dígitos) e o bairro;
+pares com o mesmo CPF são sempre sugeridos. Cada par é pontuado uma única vez, mesmo que
+apareça em vários blocos. Blocos muito grandes (nomes muito comuns) são divididos pelo bairro
+e pela chave fonética do nome completo; os que continuam grandes demais são ignorados, para
+manter o custo previsível, e informados em `ResultadoDeduplicacao.blocos_ignorados`.
+"""
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from gerador_docs.logger import obter_logger
+from gerador_docs.perfil import medir, medir_iteracao
+from gerador_docs.tipos import DadosPessoais
+from gerador_docs.tipos._texto import normalizar_texto
+
+LIMIAR_PADRAO = 0.8
+MAX_TAMANHO_BLOCO = 500
+
+# Pesos da pontuação de um par (somam 1)
+PESO_NOME = 0.55
+PESO_RG = 0.30
+PESO_BAIRRO = 0.15
+
+_PARTICULAS = frozenset(('da', 'das', 'de', 'di', 'do', 'dos', 'du', 'e'))
+
+# Regras aplicadas em ordem a cada palavra (já sem acentos e em minúsculas); 'cao'/'coes' no fim
+# da palavra são tratados como 'ção'/'ções' digitados sem cedilha
+_REGRAS_FONETICAS = tuple((re.compile(padrao), substituto) for padrao, substituto in (
+    (r'[^a-z]', ''),
+    (r'ph', 'f'),
+    (r'lh', 'l'),
+    (r'nh', 'n'),
+    (r'[cs]h', 'x'),
+    (r'q[u]?', 'k'),
+    (r'c(?=[ei]|ao$|oes$)', 's'),
+    (r'g(?=[ei])', 'j'),
+    (r'gu(?=[ei])', 'g'),
+    (r'c', 'k'),
+    (r'y', 'i'),
+    (r'w', 'v'),
+    (r'z', 's'),
+    (r'h', ''),
+    (r'(?<=.)[aeiou]', ''),
+    (r'(.)\1+', r'\1'),
+))
+
+
+@dataclass(frozen=True, slots=True)
+class SugestaoMesclagem:
+    """Par de registros que provavelmente são a mesma pessoa (`indices` referem-se à ordem de entrada)."""
+    indices: Tuple[int, int]
+    cpfs: Tuple[str, str]
+    nomes: Tuple[str, str]
+    pontuacao: float
+    motivos: Tuple[str, ...]
+
+
+class BlocoIgnorado(NamedTuple):
+    """Bloco de candidatos grande demais para ser comparado, mesmo após a divisão pela chave secundária."""
+    chave: tuple
+    tamanho: int
+
+
+class _Registro(NamedTuple):
+    cpf: str
+    nome: str
+    rg: str
+    bairro: str
+
+
+@lru_cache(maxsize=65536)
+def _fonetizar(palavra: str) -> str:
+    for padrao, substituto in _REGRAS_FONETICAS:
+        palavra = padrao.sub(substituto, palavra)
+    return palavra
+
+def chave_fonetica(nome: str) -> str:
+    """Chave fonética do nome: cada palavra (exceto 'da', 'de', 'dos'...) reduzida à inicial e às consoantes.
+    Ex.: 'José da Conceição', 'JOSE DA CONCEICAO' e 'Jose da Conseiçao' -> 'js kns'
+    """
+    # o 'ç' vira 'c' na normalização; antes disso, ele soa como 's'
+    nome = normalizar_texto(nome.replace('ç', 's').replace('Ç', 'S'))
+    return ' '.join(_fonetizar(palavra) for palavra in nome.split() if palavra not in _PARTICULAS)
+
+def _registro(pessoa: DadosPessoais) -> _Registro:
+    residencial = pessoa.endereco['residencial']
+    return _Registro(
+        cpf=pessoa.numero_cpf,
+        nome=normalizar_texto(pessoa.nome_completo),
+        rg=pessoa.numero_rg.partition(' ')[0],
+        bairro=normalizar_texto(residencial[0].bairro) if residencial else '',
+    )
+
+def _chaves_bloco(registro: _Registro) -> Tuple[List[tuple], tuple]:
+    """Chaves dos blocos do registro e a chave secundária, usada para dividir os blocos grandes demais."""
+    chaves = [('cpf', registro.cpf)]
+    fonetica = chave_fonetica(registro.nome).split()
+    if fonetica:
+        chaves.append(('nome', ' '.join(fonetica)))
+        if registro.bairro:
+            chaves.append(('bairro', registro.bairro, fonetica[0], fonetica[-1]))
+    return chaves, (registro.bairro, ' '.join(fonetica))
+
+def _dividir_bloco(
+    chave: tuple, indices: List[int], secundarias: List[tuple], maximo: int, ignorados: List[BlocoIgnorado],
+) -> Iterator[List[int]]:
+    """Blocos a comparar: o próprio bloco ou, se for grande demais, suas partes por chave secundária."""
+    if len(indices) <= maximo:
+        yield indices
+        return
+    partes: Dict[tuple, List[int]] = defaultdict(list)
+    for indice in indices:
+        partes[secundarias[indice]].append(indice)
+    for secundaria, parte in partes.items():
+        if len(parte) > maximo:
+            ignorados.append(BlocoIgnorado((*chave, *secundaria), len(parte)))
+        elif len(parte) > 1:
+            yield parte
+
+def pontuar(a: _Registro, b: _Registro, limiar: float = 0.0) -> Optional[Tuple[float, Tuple[str, ...]]]:
+    """Pontua um par; retorna None se a pontuação não puder alcançar `limiar`."""
+    if a.cpf == b.cpf:
+        return 1.0, ('mesmo CPF',)
+
+    motivos = []
+    parcial = 0.0
+    if a.rg and a.rg == b.rg:
+        parcial += PESO_RG
+        motivos.append('mesmo RG')
+    if a.bairro and a.bairro == b.bairro:
+        parcial += PESO_BAIRRO
+        motivos.append('mesmo bairro')
+
+    # limites superiores da semelhança, do mais barato ao mais caro
+    if parcial + PESO_NOME < limiar:
+        return None
+    comparador = SequenceMatcher(None, a.nome, b.nome, autojunk=False)
+    if parcial + PESO_NOME * comparador.real_quick_ratio() < limiar or parcial + PESO_NOME * comparador.quick_ratio() < limiar:
+        return None
+    semelhanca = comparador.ratio()
+    pontuacao = parcial + PESO_NOME * semelhanca
+    if pontuacao < limiar:
+        return None
+    motivos.insert(0, 'mesmo nome' if semelhanca == 1.0 else f'nomes {semelhanca:.0%} semelhantes')
+    return round(pontuacao, 4), tuple(motivos)
+
+
+@dataclass(slots=True)
+class ResultadoDeduplicacao:
+    sugestoes: List[SugestaoMesclagem]
+    pessoas: int
+    pares_comparados: int
+    blocos_ignorados: List[BlocoIgnorado]
+
+
+def sugerir_mesclagens(
+    pessoas: Iterable[DadosPessoais],
+    limiar: float = LIMIAR_PADRAO,
+    max_tamanho_bloco: int = MAX_TAMANHO_BLOCO,
+) -> ResultadoDeduplicacao:
+    """Procura pares de registros que provavelmente são a mesma pessoa.
+    :param limiar: Pontuação mínima (0 a 1) para sugerir a mesclagem.
+    :param max_tamanho_bloco: Blocos com mais registros que isso são divididos pela chave secundária
+        (bairro e nome completo); as partes ainda maiores são ignoradas e informadas no resultado.
+    :return: Sugestões em ordem decrescente de pontuação, com estatísticas da execução.
+    """
+    registros = [_registro(pessoa) for pessoa in medir_iteracao('leitura', pessoas)]
+    with medir('deduplicacao.blocos'):
+        blocos: Dict[tuple, List[int]] = defaultdict(list)
+        secundarias: List[tuple] = []
+        for indice, registro in enumerate(registros):
+            chaves, secundaria = _chaves_bloco(registro)
+            secundarias.append(secundaria)
+            for chave in chaves:
+                blocos[chave].append(indice)
+
+    with medir('deduplicacao.pontuacao'):
+        # um mesmo par pode estar em vários blocos (ex.: mesmo nome e mesmo bairro); só é pontuado uma vez
+        comparados = set()
+        sugestoes = []
+        ignorados: List[BlocoIgnorado] = []
+        for chave, indices in blocos.items():
+            if len(indices) < 2:
+                continue
+            for bloco in _dividir_bloco(chave, indices, secundarias, max_tamanho_bloco, ignorados):
+                for par in combinations(bloco, 2):
+                    if par in comparados:
+                        continue
+                    comparados.add(par)
+                    a, b = registros[par[0]], registros[par[1]]
+                    resultado = pontuar(a, b, limiar)
+                    if resultado is not None:
+                        sugestoes.append(SugestaoMesclagem(par, (a.cpf, b.cpf), (a.nome, b.nome), *resultado))
+
+    logger = obter_logger('deduplicacao')
+    for bloco in ignorados:
+        logger.warning('bloco ignorado', extra={'dados': {'chave': list(bloco.chave), 'tamanho': bloco.tamanho}})
+    sugestoes.sort(key=lambda sugestao: (-sugestao.pontuacao, sugestao.indices))
+    return ResultadoDeduplicacao(sugestoes, len(registros), len(comparados), ignorados)
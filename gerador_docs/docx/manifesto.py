@@ -0,0 +1,67 @@
+"""
+Manifesto de geração incremental.
+
+Para cada documento gerado, o manifesto (`.docgen-manifesto.json`, no diretório de saída)
+guarda o hash das entradas que o produziram: os dados da pessoa (`DadosPessoais.to_dict()`
+em JSON canônico), o hash do template e `VERSAO_GERADOR`. Numa nova execução, documentos
+cujo hash não mudou (e cujo arquivo ainda existe) não precisam ser gerados novamente.
+
+A data do documento não faz parte do hash: um documento já emitido mantém a data de emissão.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Union
+
+from gerador_docs.tipos import DadosPessoais
+
+ARQUIVO_MANIFESTO = '.docgen-manifesto.json'
+
+# Incrementar sempre que a saída do gerador mudar para as mesmas entradas (campos, renderização...)
+VERSAO_GERADOR = 1
+
+def hash_entradas(pessoa: DadosPessoais, hash_template: str) -> str:
+    """SHA-256 dos dados da pessoa, do template e da versão do gerador."""
+    dados = json.dumps(pessoa.to_dict(), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    conteudo = f'{VERSAO_GERADOR}\n{hash_template}\n{dados}'
+    return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+
+
+class ManifestoGeracao:
+    """Hashes das entradas de cada documento de um diretório de saída, indexados pelo nome do arquivo."""
+
+    def __init__(self, diretorio: Union[str, Path]) -> None:
+        self.diretorio = Path(diretorio)
+        self.caminho = self.diretorio / ARQUIVO_MANIFESTO
+        self._hashes: Dict[str, str] = {}
+        try:
+            with open(self.caminho, encoding='utf-8') as arquivo:
+                self._hashes = json.load(arquivo)
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            # manifesto corrompido: tudo será gerado novamente
+            self._hashes = {}
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def atualizado(self, nome: str, hash: str) -> bool:
+        """Indica se o documento `nome` existe e foi gerado a partir das mesmas entradas."""
+        return self._hashes.get(nome) == hash and (self.diretorio / nome).is_file()
+
+    def registrar(self, nome: str, hash: str) -> None:
+        self._hashes[nome] = hash
+
+    def gravar(self) -> None:
+        """Grava o manifesto de forma atômica (arquivo temporário + rename)."""
+        fd, temporario = tempfile.mkstemp(dir=self.diretorio, prefix=ARQUIVO_MANIFESTO, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as arquivo:
+                json.dump(self._hashes, arquivo, sort_keys=True, indent=0)
+            os.replace(temporario, self.caminho)
+        except BaseException:
+            Path(temporario).unlink(missing_ok=True)
+            raise
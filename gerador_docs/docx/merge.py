@@ -0,0 +1,167 @@
+"""
+Geração de um único documento com os documentos de vários beneficiários.
+
+O corpo do template (entre `<w:body>` e a `<w:sectPr>` final) é repetido para cada
+pessoa, separado por quebras de página, dentro de um único `word/document.xml`. O
+documento é gerado em uma única passagem e escrito em fluxo, como em `renderizar_docx`.
+
+Identificadores que o Word exige únicos no documento (`w:id`/`w:name` dos marcadores e `id`
+de `wp:docPr`) são renumerados em cada cópia do corpo a partir da segunda (ver `CorpoNumerado`).
+"""
+import csv
+import re
+import shutil
+import subprocess
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from gerador_docs.docx.template import DOCUMENTO_PRINCIPAL, TemplateCompilado, carregar_template
+from gerador_docs.docx.zipstream import ZipStreamWriter
+from gerador_docs.errors import TemplateFieldError
+
+QUEBRA_DE_PAGINA = b'<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+# Elementos cujos identificadores precisam ser únicos no documento mesclado
+_PADRAO_TAG_COM_ID = re.compile(r'<(?:w:bookmarkStart|w:bookmarkEnd|wp:docPr)\b[^>]*>')
+_PADRAO_ID = re.compile(r'(\s(?:w:)?id=")(\d+)(")')
+_PADRAO_NOME_MARCADOR = re.compile(r'(\sw:name=")([^"]*)(")')
+# O Word limita o nome de um marcador a 40 caracteres
+_TAMANHO_MAXIMO_NOME = 40
+
+
+@dataclass(frozen=True, slots=True)
+class EntradaIndice:
+    """Posição de um beneficiário no documento mesclado (1 = primeiro documento)."""
+    ordem: int
+    cpf: str
+    nome_completo: str
+
+
+def dividir_corpo(compilado: TemplateCompilado) -> Tuple[bytes, TemplateCompilado, bytes]:
+    """Separa o documento principal em cabeçalho, corpo (repetível) e rodapé.
+    O rodapé começa na última `<w:sectPr>` do corpo, que é mantida uma única vez no documento mesclado.
+    :return: (cabeçalho, template contendo apenas o corpo, rodapé).
+    :raises TemplateFieldError: Se houver campos fora do corpo do documento.
+    """
+    primeiro, ultimo = compilado.trechos[0], compilado.trechos[-1]
+    inicio = primeiro.find('<w:body')
+    fim = max(ultimo.rfind('<w:sectPr>'), ultimo.rfind('<w:sectPr '))
+    if fim < 0:
+        fim = ultimo.rfind('</w:body>')
+    if inicio < 0 or fim < 0:
+        raise TemplateFieldError("O template só pode ter campos dentro do corpo do documento (<w:body>).")
+    inicio = primeiro.index('>', inicio) + 1
+
+    if len(compilado.trechos) == 1:
+        if fim < inicio:
+            raise TemplateFieldError("O template não possui corpo de documento (<w:body>).")
+        trechos = (primeiro[inicio:fim],)
+    else:
+        trechos = (primeiro[inicio:], *compilado.trechos[1:-1], ultimo[:fim])
+    corpo = replace(compilado, trechos=trechos)
+    return primeiro[:inicio].encode('utf-8'), corpo, ultimo[fim:].encode('utf-8')
+
+class CorpoNumerado:
+    """Corpo do template com as tags de marcadores e desenhos separadas dos trechos estáticos,
+    para que cada cópia receba identificadores próprios sem reanalisar o XML.
+    Na cópia `n` (0 = primeira, mantida como no template) os ids são somados a `n * deslocamento`
+    e os nomes dos marcadores recebem o sufixo '_<n>'.
+    """
+
+    def __init__(self, corpo: TemplateCompilado) -> None:
+        self.corpo = corpo
+        # cada trecho vira (texto, tag, texto, tag, ..., texto)
+        self._partes = tuple(tuple(_PADRAO_TAG_COM_ID.split(trecho)) for trecho in corpo.trechos)
+        self._tags = tuple(tuple(_PADRAO_TAG_COM_ID.findall(trecho)) for trecho in corpo.trechos)
+        ids = [int(id) for tags in self._tags for tag in tags for _, id, _ in _PADRAO_ID.findall(tag)]
+        self.deslocamento = max(ids, default=-1) + 1
+
+    def para_copia(self, copia: int) -> TemplateCompilado:
+        if copia == 0 or not any(self._tags):
+            return self.corpo
+        trechos = []
+        for partes, tags in zip(self._partes, self._tags):
+            if not tags:
+                trechos.append(partes[0])
+                continue
+            pedacos = [partes[0]]
+            for tag, texto in zip(tags, partes[1:]):
+                pedacos.append(self._renumerar(tag, copia))
+                pedacos.append(texto)
+            trechos.append(''.join(pedacos))
+        return replace(self.corpo, trechos=tuple(trechos))
+
+    def _renumerar(self, tag: str, copia: int) -> str:
+        tag = _PADRAO_ID.sub(lambda m: f'{m[1]}{int(m[2]) + copia * self.deslocamento}{m[3]}', tag)
+        if tag.startswith('<w:bookmarkStart'):
+            sufixo = f'_{copia}'
+            tag = _PADRAO_NOME_MARCADOR.sub(lambda m: f'{m[1]}{m[2][:_TAMANHO_MAXIMO_NOME - len(sufixo)]}{sufixo}{m[3]}', tag)
+        return tag
+
+
+def mesclar_docx(
+    template: Union[str, Path],
+    campos: Iterable[Mapping[str, str]],
+    destino: Union[str, Path],
+    indice: Optional[List[EntradaIndice]] = None,
+) -> int:
+    """Gera um único .docx com um documento por item de `campos`, separados por quebras de página.
+    Os itens são consumidos à medida que o documento é escrito.
+    :param indice: Lista que, se informada, recebe a posição de cada beneficiário no documento.
+    :return: Número de documentos mesclados.
+    :raises TemplateFieldError: Se o template usar um campo que não foi fornecido.
+    """
+    compilado = carregar_template(template)
+    cabecalho, corpo, rodape = dividir_corpo(compilado)
+    corpo = CorpoNumerado(corpo)
+    destino = Path(destino)
+    total = 0
+
+    def pedacos() -> Iterator[bytes]:
+        nonlocal total
+        yield cabecalho
+        for valores in campos:
+            if total:
+                yield QUEBRA_DE_PAGINA
+            yield from corpo.para_copia(total).iterar_documento(valores)
+            total += 1
+            if indice is not None:
+                indice.append(EntradaIndice(total, valores.get('cpf', ''), valores.get('nome_completo', '')))
+        yield rodape
+
+    try:
+        with open(destino, 'wb') as fp, ZipStreamWriter(fp) as saida:
+            for parte in compilado.partes:
+                if parte.nome == DOCUMENTO_PRINCIPAL:
+                    saida.write_stream(parte.nome, parte.data_hora, pedacos())
+                else:
+                    saida.write_raw(parte.nome, parte.data_hora, parte.compressao, parte.crc, parte.tamanho, parte.dados)
+    except BaseException:
+        destino.unlink(missing_ok=True)
+        raise
+    return total
+
+def gravar_indice(indice: Iterable[EntradaIndice], destino: Union[str, Path]) -> Path:
+    """Grava o índice do documento mesclado em CSV (ordem, cpf, nome_completo)."""
+    destino = Path(destino)
+    with open(destino, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(('ordem', 'cpf', 'nome_completo'))
+        escritor.writerows((entrada.ordem, entrada.cpf, entrada.nome_completo) for entrada in indice)
+    return destino
+
+def converter_pdf(caminho: Union[str, Path]) -> Path:
+    """Converte um .docx em PDF (no mesmo diretório) usando o LibreOffice em modo headless.
+    :raises FileNotFoundError: Se o LibreOffice não estiver instalado.
+    :raises subprocess.CalledProcessError: Se a conversão falhar.
+    """
+    caminho = Path(caminho)
+    executavel = shutil.which('soffice') or shutil.which('libreoffice')
+    if executavel is None:
+        raise FileNotFoundError("A conversão para PDF requer o LibreOffice (soffice) instalado.")
+    subprocess.run(
+        [executavel, '--headless', '--convert-to', 'pdf', '--outdir', str(caminho.parent), str(caminho)],
+        check=True, capture_output=True,
+    )
+    return caminho.with_suffix('.pdf')
@@ -0,0 +1,218 @@
+"""
+Pipeline de geração de documentos em lote.
+
+Os campos de cada beneficiário são montados no processo principal e a renderização é
+distribuída entre processos (`ProcessPoolExecutor`). Os nomes dos arquivos dependem
+apenas do CPF, e o relatório mantém a ordem de entrada.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from gerador_docs.docx.manifesto import ManifestoGeracao, hash_entradas
+from gerador_docs.docx.merge import EntradaIndice, gravar_indice, mesclar_docx
+from gerador_docs.docx.render import renderizar_docx
+from gerador_docs.docx.template import TemplateCompilado, carregar_template, hash_template
+from gerador_docs.errors import TemplateFieldError
+from gerador_docs.metricas import incrementar
+from gerador_docs.perfil import medir, medir_iteracao
+from gerador_docs.tipos import DadosPessoais
+
+_TEMPLATES_PATH = Path(__file__).parent.parent / 'templates'
+
+# Template padrão de cada comando; 'poco' e 'pagamento' ainda não têm template e exigem --template.
+# Os templates incluídos ainda não têm campos {{...}}: enquanto não forem convertidos, a geração
+# falha com uma mensagem clara (ver `carregar_template_com_campos`) e é preciso usar --template
+TEMPLATES_PADRAO: Dict[str, Path] = {
+    'dec': _TEMPLATES_PATH / 'declaracao' / 'declaracao.docx',
+    'caf': _TEMPLATES_PATH / 'autodeclaracao' / 'renda.docx',
+}
+
+_MESES = (
+    'Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho',
+    'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro',
+)
+
+
+@dataclass(slots=True)
+class ResultadoDocumento:
+    """Resultado da geração do documento de um beneficiário."""
+    indice: int
+    cpf: str
+    caminho: Optional[Path]
+    sucesso: bool
+    erro: Optional[str] = None
+    # o documento já estava em dia (geração incremental) e não foi gerado novamente
+    em_dia: bool = False
+    # bytes gravados (0 se o documento não foi gerado)
+    tamanho: int = 0
+
+
+class _Tarefa(NamedTuple):
+    indice: int
+    cpf: str
+    campos: Dict[str, str]
+    template: Path
+    destino: Path
+
+
+def campos_documento(pessoa: DadosPessoais, data: Optional[date] = None) -> Dict[str, str]:
+    """Campos disponíveis nos templates ({{nome_completo}}, {{cpf}}, {{data_extenso}}...).
+    Os campos de endereço vêm do primeiro endereço residencial (ou de trabalho, na falta dele).
+    """
+    data = data or date.today()
+    enderecos = [*pessoa.endereco.get('residencial', ()), *pessoa.endereco.get('trabalho', ())]
+    endereco = enderecos[0] if enderecos else None
+    return {
+        'nome_completo': pessoa.nome_completo,
+        'cpf': pessoa.numero_cpf,
+        'rg': pessoa.numero_rg,
+        'genero': pessoa.genero,
+        'estado_civil': pessoa.estado_civil,
+        'profissao': pessoa.profissao,
+        'nacionalidade': pessoa.nacionalidade,
+        'endereco': '' if endereco is None else str(endereco),
+        'logradouro': '' if endereco is None else endereco.logradouro,
+        'numero': '' if endereco is None else endereco.numero,
+        'bairro': '' if endereco is None else endereco.bairro,
+        'cidade': '' if endereco is None else endereco.cidade,
+        'estado': '' if endereco is None else endereco.estado,
+        'cep': '' if endereco is None else endereco.cep,
+        'data': data.strftime('%d/%m/%Y'),
+        'data_extenso': f'{data.day} de {_MESES[data.month - 1]} de {data.year}',
+    }
+
+def carregar_template_com_campos(template: Union[str, Path]) -> TemplateCompilado:
+    """Carrega o template exigindo ao menos um campo {{...}}; sem campos, todo documento seria uma cópia idêntica do modelo.
+    :raises TemplateFieldError: Se o template não tiver nenhum campo.
+    """
+    compilado = carregar_template(template)
+    if not compilado.campos:
+        raise TemplateFieldError(
+            f"O template {template} não possui campos {{{{...}}}} (ex.: {{{{nome_completo}}}}); "
+            "todos os documentos seriam idênticos. Converta o template ou informe outro com --template."
+        )
+    return compilado
+
+def nome_arquivo(prefixo: str, pessoa: DadosPessoais) -> str:
+    """Nome determinístico do documento: '<prefixo>_<cpf apenas dígitos>.docx'."""
+    return f"{prefixo}_{pessoa.numero_cpf.replace('.', '').replace('-', '')}.docx"
+
+def gerar_documentos(
+    pessoas: Iterable[DadosPessoais],
+    template: Union[str, Path],
+    saida: Union[str, Path],
+    prefixo: str,
+    jobs: int = 1,
+    data: Optional[date] = None,
+    incremental: bool = False,
+) -> List[ResultadoDocumento]:
+    """Gera um documento por pessoa a partir do template.
+    :param jobs: Número de processos; 1 gera no próprio processo e 0 usa todos os núcleos.
+    :param incremental: Pula os documentos cujas entradas não mudaram desde a última geração
+        (ver `gerador_docs.docx.manifesto`); eles são reportados com `em_dia=True`.
+    :return: Um resultado por pessoa, na ordem de entrada; falhas não interrompem o lote.
+        Como o nome do arquivo depende só do CPF, um CPF repetido na entrada é reportado como falha
+        (apenas a primeira ocorrência é gerada).
+    :raises TemplateFieldError: Se o template não tiver nenhum campo.
+    """
+    carregar_template_com_campos(template)
+    saida = Path(saida)
+    saida.mkdir(parents=True, exist_ok=True)
+    data = data or date.today()
+    manifesto = ManifestoGeracao(saida) if incremental else None
+    hash_do_template = hash_template(template) if incremental else ''
+
+    resultados: Dict[int, ResultadoDocumento] = {}
+    hashes: Dict[int, str] = {}
+    tarefas = []
+    # nome do arquivo -> posição (1-based) da primeira pessoa que o gera
+    primeira_ocorrencia: Dict[str, int] = {}
+    for indice, pessoa in enumerate(medir_iteracao('leitura', pessoas)):
+        destino = saida / nome_arquivo(prefixo, pessoa)
+        anterior = primeira_ocorrencia.setdefault(destino.name, indice + 1)
+        if anterior != indice + 1:
+            resultados[indice] = ResultadoDocumento(
+                indice, pessoa.numero_cpf, None, False, f"CPF repetido na entrada (mesmo documento da posição {anterior})",
+            )
+            continue
+        if manifesto is not None:
+            hashes[indice] = hash_entradas(pessoa, hash_do_template)
+            if manifesto.atualizado(destino.name, hashes[indice]):
+                resultados[indice] = ResultadoDocumento(indice, pessoa.numero_cpf, destino, True, em_dia=True)
+                continue
+        tarefas.append(_Tarefa(indice, pessoa.numero_cpf, campos_documento(pessoa, data), Path(template), destino))
+
+    with medir('renderizacao'):
+        gerados = _executar(tarefas, jobs)
+    for resultado in gerados:
+        resultados[resultado.indice] = resultado
+        if manifesto is not None and resultado.sucesso:
+            manifesto.registrar(resultado.caminho.name, hashes[resultado.indice])
+
+    if manifesto is not None and tarefas:
+        manifesto.gravar()
+    ordenados = [resultados[indice] for indice in sorted(resultados)]
+    _contabilizar(prefixo, ordenados)
+    return ordenados
+
+def gerar_documento_mesclado(
+    pessoas: Iterable[DadosPessoais],
+    template: Union[str, Path],
+    saida: Union[str, Path],
+    prefixo: str,
+    data: Optional[date] = None,
+    indice: bool = False,
+) -> List[ResultadoDocumento]:
+    """Gera um único documento '<prefixo>_lote.docx' com todas as pessoas, uma por página.
+    :param indice: Se verdadeiro, grava também '<prefixo>_lote.csv' com a ordem de cada pessoa no documento.
+    :return: Um resultado por pessoa, todos apontando para o documento mesclado.
+    :raises TemplateFieldError: Se o template não tiver nenhum campo.
+    """
+    carregar_template_com_campos(template)
+    saida = Path(saida)
+    saida.mkdir(parents=True, exist_ok=True)
+    data = data or date.today()
+    destino = saida / f'{prefixo}_lote.docx'
+    entradas: List[EntradaIndice] = []
+
+    # o tempo de leitura/validação das pessoas é separado do tempo de renderização
+    campos = (campos_documento(pessoa, data) for pessoa in medir_iteracao('leitura', pessoas))
+    with medir('renderizacao'):
+        mesclar_docx(template, campos, destino, indice=entradas)
+    if indice:
+        gravar_indice(entradas, destino.with_suffix('.csv'))
+    incrementar('documentos.gerados', len(entradas), tipo=prefixo)
+    incrementar('documentos.bytes', destino.stat().st_size, tipo=prefixo)
+    return [ResultadoDocumento(entrada.ordem - 1, entrada.cpf, destino, True) for entrada in entradas]
+
+def _executar(tarefas: List[_Tarefa], jobs: int) -> List[ResultadoDocumento]:
+    if jobs < 0:
+        raise ValueError(f"O número de processos não pode ser negativo: {jobs}.")
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tarefas) <= 1:
+        return [_gerar_documento(tarefa) for tarefa in tarefas]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tarefas))) as executor:
+        # map mantém a ordem de entrada; blocos maiores reduzem o custo de comunicação entre processos
+        chunksize = max(1, len(tarefas) // (jobs * 4))
+        return list(executor.map(_gerar_documento, tarefas, chunksize=chunksize))
+
+def _contabilizar(prefixo: str, resultados: List[ResultadoDocumento]) -> None:
+    """Atualiza as métricas de geração no processo principal (os processos filhos não as compartilham)."""
+    em_dia = sum(resultado.em_dia for resultado in resultados)
+    falhas = sum(not resultado.sucesso for resultado in resultados)
+    incrementar('documentos.gerados', len(resultados) - em_dia - falhas, tipo=prefixo)
+    incrementar('documentos.em_dia', em_dia, tipo=prefixo)
+    incrementar('documentos.falhas', falhas, tipo=prefixo)
+    incrementar('documentos.bytes', sum(resultado.tamanho for resultado in resultados), tipo=prefixo)
+
+def _gerar_documento(tarefa: _Tarefa) -> ResultadoDocumento:
+    try:
+        caminho = renderizar_docx(tarefa.template, tarefa.campos, tarefa.destino)
+    except Exception as e:
+        return ResultadoDocumento(tarefa.indice, tarefa.cpf, None, False, f"{type(e).__name__}: {e}")
+    return ResultadoDocumento(tarefa.indice, tarefa.cpf, caminho, True, tamanho=caminho.stat().st_size)
@@ -0,0 +1,36 @@
+"Renderização de templates .docx com campos no formato {{nome_do_campo}}."
+from contextlib import nullcontext
+from pathlib import Path
+from typing import BinaryIO, Mapping, Union
+
+from gerador_docs.docx.template import DOCUMENTO_PRINCIPAL, carregar_template
+from gerador_docs.docx.zipstream import ZipStreamWriter
+
+def renderizar_docx(
+    template: Union[str, Path], campos: Mapping[str, str], destino: Union[str, Path, BinaryIO]
+) -> Union[Path, BinaryIO]:
+    """Gera um .docx a partir do template, substituindo os campos de `word/document.xml`.
+
+    O template é compilado uma única vez e reaproveitado (ver `gerador_docs.docx.template`).
+    O documento é escrito em fluxo: as demais partes do template são copiadas já comprimidas,
+    byte a byte, e apenas o documento principal é gerado e comprimido, em pedaços.
+    :param destino: Caminho do arquivo ou objeto de arquivo binário (não precisa suportar seek).
+    :return: O destino.
+    :raises TemplateFieldError: Se o template usar um campo que não foi fornecido.
+    """
+    compilado = carregar_template(template)
+    compilado.validar_campos(campos)
+
+    caminho = None if hasattr(destino, 'write') else Path(destino)
+    try:
+        with (nullcontext(destino) if caminho is None else open(caminho, 'wb')) as fp, ZipStreamWriter(fp) as saida:
+            for parte in compilado.partes:
+                if parte.nome == DOCUMENTO_PRINCIPAL:
+                    saida.write_stream(parte.nome, parte.data_hora, compilado.iterar_documento(campos))
+                else:
+                    saida.write_raw(parte.nome, parte.data_hora, parte.compressao, parte.crc, parte.tamanho, parte.dados)
+    except BaseException:
+        if caminho is not None:
+            caminho.unlink(missing_ok=True)
+        raise
+    return destino if caminho is None else caminho
@@ -0,0 +1,157 @@
+"""
+Templates .docx pré-compilados.
+
+Um template é lido e analisado uma única vez: `word/document.xml` é dividido em trechos
+estáticos de XML intercalados com os nomes dos campos, e as demais partes do pacote são
+guardadas como estão. O resultado fica em cache na memória e em disco, indexado pelo hash
+SHA-256 do arquivo, de modo que cada novo documento só precisa intercalar os valores.
+"""
+import hashlib
+import os
+import pickle
+import re
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Mapping, Optional, Tuple, Union
+from xml.sax.saxutils import escape
+from zipfile import ZipFile, ZipInfo
+
+from gerador_docs.errors import TemplateFieldError
+
+DOCUMENTO_PRINCIPAL = 'word/document.xml'
+
+# O campo precisa estar inteiro dentro de um mesmo trecho de texto (w:t) do template
+PADRAO_CAMPO = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# Incrementar sempre que o formato de TemplateCompilado mudar, invalidando o cache em disco
+VERSAO_CACHE = 2
+
+
+@dataclass(frozen=True, slots=True)
+class ParteDocx:
+    """Uma parte (entrada do zip) do template, copiada byte a byte (já comprimida) para cada documento.
+    A parte do documento principal é mantida (sem dados) apenas para preservar a ordem das entradas.
+    """
+    nome: str
+    data_hora: Tuple[int, int, int, int, int, int]
+    compressao: int
+    crc: int
+    tamanho: int
+    dados: bytes
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateCompilado:
+    """Template analisado: trechos estáticos do documento principal, campos e demais partes."""
+    hash: str
+    trechos: Tuple[str, ...]
+    campos: Tuple[str, ...]
+    partes: Tuple[ParteDocx, ...]
+
+    def validar_campos(self, valores: Mapping[str, str]) -> None:
+        """:raises TemplateFieldError: Se algum campo do template não tiver valor."""
+        for campo in self.campos:
+            if campo not in valores:
+                raise TemplateFieldError(f"Campo não fornecido para o template: {campo}.")
+
+    def iterar_documento(self, valores: Mapping[str, str]) -> Iterator[bytes]:
+        """Produz o XML do documento principal (UTF-8) em pedaços: trechos estáticos e valores escapados."""
+        self.validar_campos(valores)
+        yield self.trechos[0].encode('utf-8')
+        for campo, trecho in zip(self.campos, self.trechos[1:]):
+            yield escape(str(valores[campo])).encode('utf-8')
+            yield trecho.encode('utf-8')
+
+    def renderizar_documento(self, valores: Mapping[str, str]) -> str:
+        """Monta o XML completo do documento principal intercalando os trechos estáticos com os valores (escapados).
+        :raises TemplateFieldError: Se algum campo do template não tiver valor.
+        """
+        return b''.join(self.iterar_documento(valores)).decode('utf-8')
+
+
+_CACHE: Dict[str, TemplateCompilado] = {}
+# (caminho, mtime, tamanho) -> hash, para não reler o arquivo a cada documento
+_HASH_POR_ARQUIVO: Dict[Tuple[str, int, int], str] = {}
+
+def diretorio_cache() -> Path:
+    """Diretório do cache em disco: $DOCGEN_CACHE_DIR, ou $XDG_CACHE_HOME/docgen/templates, ou ~/.cache/docgen/templates."""
+    if os.environ.get('DOCGEN_CACHE_DIR'):
+        return Path(os.environ['DOCGEN_CACHE_DIR'])
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'docgen' / 'templates'
+
+def hash_template(caminho: Union[str, Path]) -> str:
+    """SHA-256 do arquivo do template (memorizado enquanto o arquivo não mudar)."""
+    caminho = Path(caminho)
+    info = caminho.stat()
+    chave = (str(caminho.resolve()), info.st_mtime_ns, info.st_size)
+    if chave not in _HASH_POR_ARQUIVO:
+        _HASH_POR_ARQUIVO[chave] = hashlib.sha256(caminho.read_bytes()).hexdigest()
+    return _HASH_POR_ARQUIVO[chave]
+
+def compilar_template(caminho: Union[str, Path], hash: Optional[str] = None) -> TemplateCompilado:
+    """Analisa o template sem usar cache."""
+    partes = []
+    documento = None
+    with open(caminho, 'rb') as fp, ZipFile(fp) as docx:
+        for item in docx.infolist():
+            if item.filename == DOCUMENTO_PRINCIPAL:
+                documento = docx.read(item).decode('utf-8')
+                partes.append(ParteDocx(item.filename, item.date_time, item.compress_type, item.CRC, item.file_size, b''))
+            else:
+                partes.append(ParteDocx(
+                    item.filename, item.date_time, item.compress_type, item.CRC, item.file_size, _ler_comprimido(fp, item),
+                ))
+    if documento is None:
+        raise ValueError(f"Template sem {DOCUMENTO_PRINCIPAL}: {caminho}.")
+
+    # split com um grupo de captura alterna trecho, campo, trecho, ..., trecho
+    pedacos = PADRAO_CAMPO.split(documento)
+    return TemplateCompilado(
+        hash=hash or hash_template(caminho),
+        trechos=tuple(pedacos[0::2]),
+        campos=tuple(pedacos[1::2]),
+        partes=tuple(partes),
+    )
+
+def _ler_comprimido(fp: BinaryIO, item: ZipInfo) -> bytes:
+    """Lê os bytes comprimidos de uma entrada, exatamente como estão gravados no zip."""
+    fp.seek(item.header_offset)
+    cabecalho = fp.read(30)
+    tamanho_nome, tamanho_extra = struct.unpack('<HH', cabecalho[26:30])
+    fp.seek(tamanho_nome + tamanho_extra, os.SEEK_CUR)
+    return fp.read(item.compress_size)
+
+def carregar_template(caminho: Union[str, Path]) -> TemplateCompilado:
+    """Retorna o template compilado, usando o cache em memória, depois o cache em disco e, por fim, compilando."""
+    hash = hash_template(caminho)
+    template = _CACHE.get(hash)
+    if template is not None:
+        return template
+
+    arquivo_cache = diretorio_cache() / f'{hash}.v{VERSAO_CACHE}.pickle'
+    template = _ler_cache(arquivo_cache, hash)
+    if template is None:
+        template = compilar_template(caminho, hash)
+        _gravar_cache(arquivo_cache, template)
+    _CACHE[hash] = template
+    return template
+
+def _ler_cache(arquivo: Path, hash: str) -> Optional[TemplateCompilado]:
+    try:
+        with open(arquivo, 'rb') as fp:
+            template = pickle.load(fp)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+        return None
+    return template if isinstance(template, TemplateCompilado) and template.hash == hash else None
+
+def _gravar_cache(arquivo: Path, template: TemplateCompilado) -> None:
+    """Grava de forma atômica (arquivo temporário + rename); falhas de escrita apenas desativam o cache em disco."""
+    try:
+        arquivo.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=arquivo.parent, delete=False) as fp:
+            pickle.dump(template, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fp.name, arquivo)
+    except OSError:
+        pass
@@ -0,0 +1,114 @@
+"""
+Escrita sequencial de arquivos zip (o formato dos .docx).
+
+Diferente de `zipfile.ZipFile`, permite copiar entradas já comprimidas byte a byte
+(sem descomprimir e recomprimir) e não precisa de `seek`: as entradas geradas usam
+o "data descriptor" do formato zip, de modo que a saída pode ser qualquer objeto com
+`write` (arquivo, socket, BytesIO...).
+"""
+import struct
+import zlib
+from typing import BinaryIO, Iterable, List, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
+_ASSINATURA_LOCAL = 0x04034B50
+_ASSINATURA_DESCRITOR = 0x08074B50
+_ASSINATURA_CENTRAL = 0x02014B50
+_ASSINATURA_FIM = 0x06054B50
+_VERSAO = 20
+_FLAG_DESCRITOR = 0x08
+_FLAG_UTF8 = 0x800
+_LIMITE_ZIP32 = 0xFFFFFFFF
+
+DataHora = Tuple[int, int, int, int, int, int]
+
+
+def _dos(data_hora: DataHora) -> Tuple[int, int]:
+    ano, mes, dia, hora, minuto, segundo = data_hora
+    return (hora << 11) | (minuto << 5) | (segundo // 2), ((ano - 1980) << 9) | (mes << 5) | dia
+
+
+class ZipStreamWriter:
+    """Escreve um zip sequencialmente em `fp`; chame `close()` para gravar o diretório central."""
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        self._posicao = 0
+        self._central: List[bytes] = []
+
+    def __enter__(self) -> 'ZipStreamWriter':
+        return self
+
+    def __exit__(self, tipo, *exc_info) -> None:
+        if tipo is None:
+            self.close()
+
+    def write_raw(self, nome: str, data_hora: DataHora, compressao: int, crc: int, tamanho: int, dados: bytes) -> None:
+        """Copia uma entrada já comprimida (como está no zip de origem), sem recomprimir."""
+        flags = self._flags_nome(nome)
+        cabecalho = self._cabecalho_local(nome, flags, compressao, data_hora, crc, len(dados), tamanho)
+        self._registrar(nome, flags, compressao, data_hora, crc, len(dados), tamanho)
+        self._escrever(cabecalho)
+        self._escrever(dados)
+
+    def write_stream(self, nome: str, data_hora: DataHora, pedacos: Iterable[bytes], nivel: int = 6) -> None:
+        """Comprime (deflate) e grava os pedaços à medida que são produzidos.
+        CRC e tamanhos vão no data descriptor, após os dados, então nada precisa ficar em memória.
+        """
+        flags = self._flags_nome(nome) | _FLAG_DESCRITOR
+        offset = self._posicao
+        self._escrever(self._cabecalho_local(nome, flags, ZIP_DEFLATED, data_hora, 0, 0, 0))
+
+        compressor = zlib.compressobj(nivel, zlib.DEFLATED, -15)
+        crc = tamanho = comprimido = 0
+        for pedaco in pedacos:
+            crc = zlib.crc32(pedaco, crc)
+            tamanho += len(pedaco)
+            saida = compressor.compress(pedaco)
+            comprimido += len(saida)
+            self._escrever(saida)
+        saida = compressor.flush()
+        comprimido += len(saida)
+        self._escrever(saida)
+
+        self._escrever(struct.pack('<IIII', _ASSINATURA_DESCRITOR, crc, comprimido, tamanho))
+        self._registrar(nome, flags, ZIP_DEFLATED, data_hora, crc, comprimido, tamanho, offset)
+
+    def close(self) -> None:
+        """Grava o diretório central e o registro de fim do zip."""
+        inicio = self._posicao
+        for registro in self._central:
+            self._escrever(registro)
+        tamanho = self._posicao - inicio
+        if len(self._central) > 0xFFFF or self._posicao > _LIMITE_ZIP32:
+            raise ValueError("Documento grande demais para zip sem ZIP64.")
+        self._escrever(struct.pack('<IHHHHIIH', _ASSINATURA_FIM, 0, 0, len(self._central), len(self._central), tamanho, inicio, 0))
+
+    @staticmethod
+    def _flags_nome(nome: str) -> int:
+        return 0 if nome.isascii() else _FLAG_UTF8
+
+    @staticmethod
+    def _cabecalho_local(nome: str, flags: int, compressao: int, data_hora: DataHora, crc: int, comprimido: int, tamanho: int) -> bytes:
+        hora, data = _dos(data_hora)
+        nome_bytes = nome.encode('utf-8')
+        return struct.pack(
+            '<IHHHHHIIIHH', _ASSINATURA_LOCAL, _VERSAO, flags, compressao, hora, data, crc, comprimido, tamanho, len(nome_bytes), 0,
+        ) + nome_bytes
+
+    def _registrar(self, nome: str, flags: int, compressao: int, data_hora: DataHora, crc: int, comprimido: int, tamanho: int, offset: int = None) -> None:
+        if compressao not in (ZIP_STORED, ZIP_DEFLATED):
+            raise ValueError(f"Compressão não suportada na entrada {nome}: {compressao}.")
+        if max(comprimido, tamanho) > _LIMITE_ZIP32:
+            raise ValueError(f"Entrada grande demais para zip sem ZIP64: {nome}.")
+        hora, data = _dos(data_hora)
+        nome_bytes = nome.encode('utf-8')
+        self._central.append(struct.pack(
+            '<IHHHHHHIIIHHHHHII', _ASSINATURA_CENTRAL, _VERSAO, _VERSAO, flags, compressao, hora, data,
+            crc, comprimido, tamanho, len(nome_bytes), 0, 0, 0, 0, 0, self._posicao if offset is None else offset,
+        ) + nome_bytes)
+
+    def _escrever(self, dados: bytes) -> None:
+        if dados:
+            self._fp.write(dados)
+            self._posicao += len(dados)
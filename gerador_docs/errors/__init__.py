@@ -1,47 +1,64 @@
-class CPFInvalidError(Exception):
+class ValidationError(Exception):
+    """Base class for value validation errors."""
+    pass
+
+class CPFInvalidError(ValidationError):
     """Exception raised for invalid CPF numbers."""
     pass
 
-class CPFFormatError(Exception):
+class CPFFormatError(ValidationError):
     """Exception raised for invalid CPF format."""
     pass
 
-class CPFLengthError(Exception):
+class CPFLengthError(ValidationError):
     """Exception raised for invalid CPF length."""
     pass
 
-class RGFormatError(Exception):
+class RGFormatError(ValidationError):
     """Exception raised for invalid RG format."""
     pass
 
-class GenderError(Exception):
+class GenderError(ValidationError):
     """Exception raised for invalid gender."""
     pass
 
-class MaritalStatusError(Exception):
+class MaritalStatusError(ValidationError):
     """Exception raised for invalid marital status."""
     pass
 
-class CARNumberFormatError(Exception):
+class CARNumberFormatError(ValidationError):
     """Exception raised for invalid car number format."""
     pass
 
-class CARNumberLengthError(Exception):
+class CARNumberLengthError(ValidationError):
     """Exception raised for invalid car number length."""
     pass
 
-class CARNumberInvalidError(Exception):
+class CARNumberInvalidError(ValidationError):
     """Exception raised for invalid car number."""
     pass
 
-class CAFNumberFormatError(Exception):
+class CAFNumberFormatError(ValidationError):
     """Exception raised for invalid CAF number format."""
     pass
 
-class CAFNumberLengthError(Exception):
+class CAFNumberLengthError(ValidationError):
     """Exception raised for invalid CAF number length."""
     pass
 
-class CAFNumberInvalidError(Exception):
+class CAFNumberInvalidError(ValidationError):
     """Exception raised for invalid CAF number."""
-    pass
\ No newline at end of file
+    pass
+
+class DuplicateRecordError(Exception):
+    """Exception raised when a record with the same unique key already exists."""
+    pass
+
+class TemplateFieldError(Exception):
+    """Exception raised when a document template uses a field that was not provided."""
+    pass
+
+
+class RecordFormatError(Exception):
+    """Exception raised when a record does not match the schema of its table."""
+    pass
@@ -0,0 +1,257 @@
+"""
+Esquemas das tabelas manipuladas pelo comando `db` e pela importação de planilhas.
+
+Cada tabela registra uma única vez os seus campos (nome, apelidos, obrigatoriedade e
+conversão) e a função que monta o registro tipado (ex.: `DadosPessoais`). O esquema é
+compilado no registro: a tabela de nomes normalizados -> campo e o conjunto de campos
+obrigatórios são calculados uma vez, e cada registro é então convertido em uma passagem.
+
+Formas aceitas em `--dados` (cada ocorrência de `--dados` é um registro):
+    --dados nome_completo:"José da Silva" cpf:52998224725 ...
+    --dados nome_completo:José,cpf:52998224725,...
+Valores sem 'chave:' são identificadores (ex.: os CPFs em `--action remove`).
+"""
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from gerador_docs.errors import RecordFormatError
+from gerador_docs.metricas import registrar_falha_validacao
+from gerador_docs.tipos import CPF, RG, DadosPessoais, Endereco
+from gerador_docs.tipos._texto import normalizar_texto
+
+
+def normalizar_chave(nome: str) -> str:
+    """'Nome Completo' -> 'nome_completo', 'Estado Civil ' -> 'estado_civil', 'Gênero' -> 'genero'."""
+    return '_'.join(normalizar_texto(nome).split())
+
+
+@dataclass(frozen=True, slots=True)
+class Campo:
+    """Campo de um esquema: o valor (texto) é convertido por `converter` antes de montar o registro."""
+    nome: str
+    obrigatorio: bool = False
+    converter: Callable[[str], Any] = str
+    apelidos: Tuple[str, ...] = ()
+
+
+class Esquema:
+    """Esquema compilado de uma tabela."""
+
+    def __init__(
+        self,
+        tabela: str,
+        campos: Iterable[Campo],
+        construir: Callable[[Dict[str, Any]], Any],
+        chave: str,
+        achatar: Callable[[Any], Dict[str, str]],
+        preservar: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> None:
+        """
+        :param construir: Monta (e valida) o registro tipado a partir dos valores convertidos.
+        :param chave: Campo que identifica o registro (ex.: 'cpf').
+        :param achatar: Inverso de `construir`: valores em texto de um registro existente (usado em atualizações).
+        :param preservar: Em atualizações, recebe (existente, novo) e devolve o novo registro com o que
+            o esquema não representa (ex.: endereços adicionais) copiado do existente.
+        """
+        self.tabela = tabela
+        self.campos = tuple(campos)
+        self.chave = chave
+        self.construir = construir
+        self.achatar = achatar
+        self.preservar = preservar
+        self._por_nome: Dict[str, Campo] = {}
+        for campo in self.campos:
+            for nome in (campo.nome, *campo.apelidos):
+                self._por_nome[normalizar_chave(nome)] = campo
+        self._obrigatorios = frozenset(campo.nome for campo in self.campos if campo.obrigatorio)
+
+    def valores(self, dados: Mapping[str, str], *, parcial: bool = False, ignorar_desconhecidos: bool = False) -> Dict[str, Any]:
+        """Converte os valores (em texto) de um registro, indexados pelo nome canônico de cada campo.
+        Valores vazios são tratados como ausentes.
+        :param parcial: Não exige os campos obrigatórios (ex.: filtros e atualizações).
+        :raises RecordFormatError: Campo desconhecido, repetido, obrigatório ausente ou valor inválido.
+        """
+        convertidos, vistos = {}, set()
+        for nome, valor in dados.items():
+            campo = self._por_nome.get(normalizar_chave(nome))
+            if campo is None:
+                if ignorar_desconhecidos:
+                    continue
+                raise RecordFormatError(
+                    f"Campo desconhecido para a tabela '{self.tabela}': '{nome}'. "
+                    f"Campos aceitos: {', '.join(campo.nome for campo in self.campos)}."
+                )
+            if campo.nome in vistos:
+                raise RecordFormatError(f"Campo '{campo.nome}' informado mais de uma vez (como '{nome}').")
+            vistos.add(campo.nome)
+            valor = valor.strip()
+            if not valor:
+                continue
+            try:
+                convertidos[campo.nome] = campo.converter(valor)
+            except Exception as e:
+                raise RecordFormatError(f"Valor inválido para '{campo.nome}': {valor!r} ({e}).") from e
+
+        if not parcial and (ausentes := self._obrigatorios.difference(convertidos)):
+            ausentes = [campo.nome for campo in self.campos if campo.nome in ausentes]
+            raise RecordFormatError(f"Campo(s) obrigatório(s) ausente(s): {', '.join(ausentes)}.")
+        return convertidos
+
+    def registro(self, dados: Mapping[str, str], *, ignorar_desconhecidos: bool = False) -> Any:
+        """Converte e valida os valores e monta o registro tipado.
+        :raises RecordFormatError: Se os dados não corresponderem ao esquema ou não passarem na validação dos tipos.
+        """
+        valores = self.valores(dados, ignorar_desconhecidos=ignorar_desconhecidos)
+        try:
+            return self.construir(valores)
+        except RecordFormatError:
+            raise
+        except Exception as e:
+            registrar_falha_validacao(e)
+            raise RecordFormatError(str(e)) from e
+
+    def atualizar(self, existente: Any, dados: Mapping[str, str]) -> Any:
+        """Aplica uma atualização parcial: os campos informados substituem os do registro existente.
+        :raises RecordFormatError: Se o registro resultante não for válido.
+        """
+        # os campos informados (por nome ou apelido) substituem os valores do registro pelo nome canônico
+        alterados = {}
+        for nome, valor in dados.items():
+            campo = self._por_nome.get(normalizar_chave(nome))
+            canonico = nome if campo is None else campo.nome
+            if canonico in alterados:
+                raise RecordFormatError(f"Campo '{canonico}' informado mais de uma vez (como '{nome}').")
+            alterados[canonico] = valor
+        novo = self.registro({**self.achatar(existente), **alterados})
+        return novo if self.preservar is None else self.preservar(existente, novo)
+
+
+_ESQUEMAS: Dict[str, Esquema] = {}
+
+def registrar_esquema(esquema: Esquema) -> Esquema:
+    _ESQUEMAS[esquema.tabela] = esquema
+    return esquema
+
+def obter_esquema(tabela: str) -> Esquema:
+    """:raises RecordFormatError: Se a tabela não tiver esquema registrado."""
+    try:
+        return _ESQUEMAS[tabela]
+    except KeyError:
+        raise RecordFormatError(
+            f"Tabela desconhecida: '{tabela}'. Tabelas disponíveis: {', '.join(sorted(_ESQUEMAS))}."
+        ) from None
+
+def tabelas() -> List[str]:
+    return sorted(_ESQUEMAS)
+
+def separar_dados(dados: Optional[List[List[str]]]) -> Tuple[List[Dict[str, str]], List[str]]:
+    """Separa os argumentos de `--dados` em registros ('chave:valor') e identificadores (valores soltos).
+    Em 'a:1,b:2' as vírgulas separam pares; vírgulas dentro de um valor ('logradouro:Rua A, 10') são mantidas.
+    :return: (um dicionário por ocorrência de --dados que tenha pares, identificadores).
+    :raises RecordFormatError: Se um campo se repetir no mesmo registro ou se um valor vier sem o nome do campo.
+    """
+    registros, identificadores = [], []
+    for ocorrencia in dados or ():
+        registro: Dict[str, str] = {}
+        for argumento in ocorrencia:
+            if ':' not in argumento:
+                identificadores.extend(valor for valor in argumento.split(',') if valor)
+                continue
+            pares: List[List[str]] = []
+            for parte in argumento.split(','):
+                if ':' in parte:
+                    pares.append(parte.split(':', 1))
+                elif pares:
+                    pares[-1][1] += ',' + parte
+                else:
+                    raise RecordFormatError(f"Valor sem o nome do campo em '{argumento}' (use campo:valor).")
+            for chave, valor in pares:
+                if chave in registro:
+                    raise RecordFormatError(f"Campo repetido no mesmo registro: '{chave}'.")
+                registro[chave] = valor
+        if registro:
+            registros.append(registro)
+    return registros, identificadores
+
+
+# Tabela 'pessoas' -----------------------------------------------------------------------
+
+_CAMPOS_ENDERECO = ('bairro', 'logradouro', 'numero', 'complemento', 'cidade', 'estado', 'cep')
+
+def _digitos_cpf(valor: str) -> str:
+    """CPF apenas com dígitos; planilhas costumam perder os zeros à esquerda de CPFs numéricos (ex.: 012...)."""
+    cpf = valor.replace('.', '').replace('-', '')
+    return cpf.zfill(11) if cpf.isdigit() and len(cpf) >= 9 else cpf
+
+def _pessoa(valores: Dict[str, Any]) -> DadosPessoais:
+    # o CPF pode chegar já validado (ex.: pela validação em lote da importação)
+    cpf = valores['cpf']
+    if not isinstance(cpf, CPF):
+        cpf = CPF(cpf)
+
+    rg = valores['rg']
+    if ' ' in rg:
+        rg = RG.from_dict({'numero': rg})
+    else:
+        rg = RG.intern(rg, valores.get('emissor', 'SSP'), valores.get('uf', 'PE'))
+
+    enderecos = []
+    if 'logradouro' in valores or 'bairro' in valores:
+        campos = {campo: valores[campo] for campo in _CAMPOS_ENDERECO if campo in valores}
+        enderecos.append(Endereco.intern(tag='residencial', **{'bairro': '', 'logradouro': '', **campos}))
+
+    return DadosPessoais(
+        nome_completo=valores['nome_completo'],
+        cpf=cpf,
+        rg=rg,
+        genero=valores['genero'],
+        estado_civil=valores['estado_civil'],
+        profissao=valores['profissao'],
+        endereco=enderecos,
+    )
+
+def _pessoa_achatada(pessoa: DadosPessoais) -> Dict[str, str]:
+    valores = {
+        'nome_completo': pessoa.nome_completo,
+        'cpf': pessoa.numero_cpf,
+        'rg': pessoa.numero_rg,
+        'genero': pessoa.genero,
+        'estado_civil': pessoa.estado_civil,
+        'profissao': pessoa.profissao,
+    }
+    if pessoa.endereco['residencial']:
+        endereco = pessoa.endereco['residencial'][0]
+        valores.update({campo: getattr(endereco, campo) or '' for campo in _CAMPOS_ENDERECO})
+    return valores
+
+def _preservar_enderecos(existente: DadosPessoais, nova: DadosPessoais) -> DadosPessoais:
+    """Mantém os endereços residenciais adicionais e os de trabalho, que o esquema não representa."""
+    residencial = (*nova.endereco['residencial'], *existente.endereco['residencial'][1:])
+    return replace(nova, endereco={'residencial': residencial, 'trabalho': existente.endereco['trabalho']})
+
+ESQUEMA_PESSOAS = registrar_esquema(Esquema(
+    'pessoas',
+    (
+        Campo('nome_completo', True, lambda valor: ' '.join(valor.split()), apelidos=('nome',)),
+        Campo('cpf', True, _digitos_cpf),
+        # '1047991 SSP/PE' ou apenas o número, com emissor e uf à parte (padrão: SSP/PE)
+        Campo('rg', True),
+        Campo('emissor', apelidos=('orgao_emissor',)),
+        Campo('uf', apelidos=('uf_rg',)),
+        Campo('genero', True, str.upper, apelidos=('sexo',)),
+        Campo('estado_civil', True, normalizar_texto),
+        Campo('profissao', True),
+        # endereço residencial
+        Campo('bairro'),
+        Campo('logradouro', apelidos=('endereco', 'rua')),
+        Campo('numero', apelidos=('no', 'n')),
+        Campo('complemento'),
+        Campo('cidade', apelidos=('municipio',)),
+        Campo('estado'),
+        Campo('cep'),
+    ),
+    construir=_pessoa,
+    chave='cpf',
+    achatar=_pessoa_achatada,
+    preservar=_preservar_enderecos,
+))
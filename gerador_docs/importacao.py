@@ -0,0 +1,237 @@
+"""
+Importação em massa de beneficiários a partir de planilhas (CSV ou XLSX).
+
+As linhas são lidas sob demanda e processadas em lotes: cada lote tem os CPFs validados de
+uma vez (`validate_cpf_array`), as demais validações são feitas pelos próprios tipos
+(RG, gênero, estado civil) e as pessoas válidas são gravadas numa única transação
+(`IRepository.add_many`). Linhas rejeitadas vão para um arquivo CSV à parte, com o motivo.
+
+As colunas são as do esquema da tabela 'pessoas' (`gerador_docs.esquemas.ESQUEMA_PESSOAS`),
+com os nomes normalizados: 'Nome Completo' e 'nome_completo' são a mesma coluna.
+"""
+import csv
+import time
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from gerador_docs.errors import RecordFormatError
+from gerador_docs.esquemas import ESQUEMA_PESSOAS
+from gerador_docs.metricas import incrementar, registrar_falha_validacao
+from gerador_docs.perfil import medir
+from gerador_docs.repository import IRepository
+from gerador_docs.tipos import CPF, CPFErro, DadosPessoais, validate_cpf_array
+from gerador_docs.tipos.documents import _MENSAGENS_ERRO_CPF, formatar_cpf
+
+Linha = Dict[str, str]
+
+TAMANHO_LOTE = 1000
+
+
+@dataclass(slots=True)
+class LinhaRejeitada:
+    """Linha da planilha que não foi importada (`linha` conta a partir do cabeçalho = 1)."""
+    linha: int
+    dados: Linha
+    motivo: str
+
+
+@dataclass(slots=True)
+class RelatorioImportacao:
+    """Resumo de uma importação."""
+    lidas: int = 0
+    gravadas: int = 0
+    rejeitadas: int = 0
+    segundos: float = 0.0
+    arquivo_rejeitadas: Optional[Path] = None
+
+    @property
+    def linhas_por_segundo(self) -> float:
+        return self.lidas / self.segundos if self.segundos else 0.0
+
+
+class _ArquivoRejeitadas:
+    """CSV das linhas rejeitadas (linha, motivo e as colunas originais), criado apenas na primeira rejeição."""
+
+    def __init__(self, caminho: Optional[Union[str, Path]], colunas: Optional[Sequence[str]] = None) -> None:
+        """
+        :param colunas: Colunas do cabeçalho da planilha; se não informadas (ou vazias), são usadas
+            as colunas das linhas do primeiro lote rejeitado.
+        """
+        self.caminho = None if caminho is None else Path(caminho)
+        self.criado = False
+        self._colunas = colunas
+        self._arquivo = None
+        self._escritor = None
+
+    def __enter__(self) -> '_ArquivoRejeitadas':
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self._arquivo is not None:
+            self._arquivo.close()
+
+    def gravar(self, rejeitadas: List[LinhaRejeitada]) -> None:
+        if self.caminho is None or not rejeitadas:
+            return
+        if self._escritor is None:
+            self._arquivo = open(self.caminho, 'w', encoding='utf-8', newline='')
+            self._escritor = csv.writer(self._arquivo)
+            if not self._colunas:
+                self._colunas = list(dict.fromkeys(coluna for rejeitada in rejeitadas for coluna in rejeitada.dados))
+            self._escritor.writerow(['linha', 'motivo', *self._colunas])
+            self.criado = True
+        for rejeitada in rejeitadas:
+            self._escritor.writerow([rejeitada.linha, rejeitada.motivo, *(rejeitada.dados.get(coluna, '') for coluna in self._colunas)])
+
+
+def ler_planilha(origem: Union[str, Path], colunas: Optional[List[str]] = None) -> Iterator[Tuple[int, Linha]]:
+    """Lê as linhas de um .csv (separado por ',' ou ';') ou .xlsx (primeira aba), uma por vez.
+    :param colunas: Lista que, se informada, recebe as colunas do cabeçalho assim que ele é lido.
+    :return: Pares (número da linha, valores por coluna); linhas vazias são ignoradas.
+    :raises ValueError: Se a extensão não for suportada.
+    """
+    origem = Path(origem)
+    sufixo = origem.suffix.lower()
+    if colunas is None:
+        colunas = []
+    if sufixo == '.csv':
+        return _ler_csv(origem, colunas)
+    if sufixo == '.xlsx':
+        return _ler_xlsx(origem, colunas)
+    raise ValueError(f"Formato de planilha não suportado: '{origem.suffix}' (use .csv ou .xlsx).")
+
+def _ler_csv(origem: Path, colunas: List[str]) -> Iterator[Tuple[int, Linha]]:
+    with open(origem, encoding='utf-8-sig', newline='') as arquivo:
+        amostra = arquivo.read(4096)
+        arquivo.seek(0)
+        try:
+            dialeto = csv.Sniffer().sniff(amostra, delimiters=',;')
+        except csv.Error:
+            dialeto = csv.excel
+        leitor = csv.reader(arquivo, dialeto)
+        colunas.extend(coluna.strip() for coluna in next(leitor, []))
+        for numero, valores in enumerate(leitor, start=2):
+            if any(valor.strip() for valor in valores):
+                yield numero, dict(zip(colunas, (valor.strip() for valor in valores)))
+
+def _ler_xlsx(origem: Path, colunas: List[str]) -> Iterator[Tuple[int, Linha]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError("A leitura de planilhas .xlsx requer o pacote 'openpyxl' (pip install openpyxl).") from None
+
+    planilha = load_workbook(origem, read_only=True, data_only=True)
+    try:
+        linhas = planilha.worksheets[0].iter_rows(values_only=True)
+        colunas.extend(str(coluna or '').strip() for coluna in next(linhas, ()))
+        for numero, valores in enumerate(linhas, start=2):
+            valores = ['' if valor is None else str(valor).strip() for valor in valores]
+            if any(valores):
+                yield numero, dict(zip(colunas, valores))
+    finally:
+        planilha.close()
+
+def validar_lote(linhas: List[Tuple[int, Linha]]) -> Tuple[List[Tuple[int, Linha, DadosPessoais]], List[LinhaRejeitada]]:
+    """Valida um lote de linhas: os CPFs de uma só vez e, para os válidos, o restante dos dados
+    (pelo esquema da tabela 'pessoas'; colunas desconhecidas são ignoradas).
+    :return: (pessoas válidas com o número e os valores da linha, linhas rejeitadas).
+    """
+    with medir('validacao'):
+        return _validar_lote(linhas)
+
+def _validar_lote(linhas: List[Tuple[int, Linha]]) -> Tuple[List[Tuple[int, Linha, DadosPessoais]], List[LinhaRejeitada]]:
+    convertidas, rejeitadas = [], []
+    for numero, linha in linhas:
+        try:
+            convertidas.append((numero, linha, ESQUEMA_PESSOAS.valores(linha, ignorar_desconhecidos=True)))
+        except RecordFormatError as e:
+            registrar_falha_validacao(e)
+            rejeitadas.append(LinhaRejeitada(numero, linha, str(e)))
+
+    validas = []
+    cpfs = [valores['cpf'] for _, _, valores in convertidas]
+    for (numero, linha, valores), cpf, erro in zip(convertidas, cpfs, validate_cpf_array(cpfs).erros):
+        if erro is not CPFErro.VALIDO:
+            # a validação em lote não lança exceções; a falha é contabilizada como um CPFInvalidError
+            incrementar('validacao.falhas', erro='CPFInvalidError')
+            rejeitadas.append(LinhaRejeitada(numero, linha, _MENSAGENS_ERRO_CPF[erro].format(numero=cpf)))
+            continue
+        # o CPF já foi validado acima: a pessoa é montada sem revalidá-lo
+        valores['cpf'] = CPF.from_trusted_dict({'numero': formatar_cpf(cpf)})
+        try:
+            validas.append((numero, linha, ESQUEMA_PESSOAS.construir(valores)))
+        except Exception as e:
+            registrar_falha_validacao(e)
+            rejeitadas.append(LinhaRejeitada(numero, linha, str(e)))
+    return validas, rejeitadas
+
+def ler_pessoas(origem: Union[str, Path], tamanho_lote: int = TAMANHO_LOTE) -> Iterator[DadosPessoais]:
+    """Pessoas válidas de uma planilha (.csv/.xlsx) ou de um arquivo JSON Lines, sem gravá-las; linhas inválidas são ignoradas."""
+    if Path(origem).suffix.lower() == '.jsonl':
+        from gerador_docs.serializacao import ler_jsonl
+
+        yield from ler_jsonl(origem)
+        return
+    linhas = ler_planilha(origem)
+    while lote := list(islice(linhas, tamanho_lote)):
+        yield from (pessoa for _, _, pessoa in validar_lote(lote)[0])
+
+def importar_pessoas(
+    linhas: Iterable[Tuple[int, Linha]],
+    repositorio: IRepository,
+    tamanho_lote: int = TAMANHO_LOTE,
+    arquivo_rejeitadas: Optional[Union[str, Path]] = None,
+    colunas: Optional[Sequence[str]] = None,
+) -> RelatorioImportacao:
+    """Valida e grava as linhas em lotes de `tamanho_lote` (uma transação por lote).
+    CPFs repetidos no arquivo ou já cadastrados são rejeitados, sem afetar o restante do lote.
+    :param arquivo_rejeitadas: CSV onde as linhas rejeitadas são gravadas (criado só se houver alguma).
+    :param colunas: Colunas da planilha de origem, na ordem do cabeçalho, repetidas no CSV das rejeitadas.
+    """
+    relatorio = RelatorioImportacao()
+    vistos = set()
+    inicio = time.perf_counter()
+    iterador = iter(linhas)
+
+    with _ArquivoRejeitadas(arquivo_rejeitadas, colunas) as saida_rejeitadas:
+        while lote := list(islice(iterador, tamanho_lote)):
+            relatorio.lidas += len(lote)
+            validas, rejeitadas = validar_lote(lote)
+
+            existentes = repositorio.get_many(pessoa.numero_cpf for _, _, pessoa in validas)
+            novas = []
+            for numero, linha, pessoa in validas:
+                if pessoa.numero_cpf in existentes:
+                    rejeitadas.append(LinhaRejeitada(numero, linha, 'CPF já cadastrado'))
+                elif pessoa.numero_cpf in vistos:
+                    rejeitadas.append(LinhaRejeitada(numero, linha, 'CPF repetido no arquivo'))
+                else:
+                    vistos.add(pessoa.numero_cpf)
+                    novas.append(pessoa)
+
+            if novas:
+                relatorio.gravadas += repositorio.add_many(novas)
+            relatorio.rejeitadas += len(rejeitadas)
+            incrementar('importacao.gravadas', len(novas))
+            incrementar('importacao.rejeitadas', len(rejeitadas))
+            saida_rejeitadas.gravar(sorted(rejeitadas, key=lambda rejeitada: rejeitada.linha))
+
+    relatorio.segundos = time.perf_counter() - inicio
+    relatorio.arquivo_rejeitadas = saida_rejeitadas.caminho if saida_rejeitadas.criado else None
+    return relatorio
+
+def importar_planilha(
+    origem: Union[str, Path],
+    repositorio: IRepository,
+    tamanho_lote: int = TAMANHO_LOTE,
+    arquivo_rejeitadas: Optional[Union[str, Path]] = None,
+) -> RelatorioImportacao:
+    """Importa um .csv/.xlsx (ver `importar_pessoas`); por padrão as rejeitadas vão para '<origem>.rejeitadas.csv'."""
+    origem = Path(origem)
+    if arquivo_rejeitadas is None:
+        arquivo_rejeitadas = origem.with_name(f'{origem.stem}.rejeitadas.csv')
+    # preenchida pelo leitor ao ler o cabeçalho, antes da primeira linha rejeitada
+    colunas: List[str] = []
+    return importar_pessoas(ler_planilha(origem, colunas), repositorio, tamanho_lote, arquivo_rejeitadas, colunas)
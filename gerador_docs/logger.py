@@ -1 +1,86 @@
-from rich.logging import RichHandler
+"""
+Configuração dos logs do docgen.
+
+Dois formatos: 'rich' (para o terminal) e 'json', uma linha JSON por evento em stderr, para
+alimentar pipelines de logs sem precisar interpretar a saída formatada. Campos extras de um
+evento são passados em `extra={'dados': {...}}` e aparecem no primeiro nível do JSON:
+
+    {"ts": "2025-01-31T12:00:00.123+00:00", "nivel": "INFO", "logger": "gerador_docs.cli",
+     "mensagem": "comando concluído", "comando": "caf", "segundos": 1.52}
+
+O rich só é importado quando o formato 'rich' é configurado.
+"""
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+from typing import Optional, TextIO
+
+from gerador_docs.metricas import METRICAS, RegistroMetricas
+
+LOGGER = 'gerador_docs'
+FORMATOS = ('rich', 'json')
+
+# Sem configuração (ex.: o docgen usado como biblioteca, ou a CLI no formato padrão) os eventos são descartados
+logging.getLogger(LOGGER).addHandler(logging.NullHandler())
+
+
+class JsonFormatter(logging.Formatter):
+    """Formata cada registro como um objeto JSON numa única linha."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        evento = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'nivel': record.levelname,
+            'logger': record.name,
+            'mensagem': record.getMessage(),
+        }
+        evento.update(getattr(record, 'dados', None) or {})
+        if record.exc_info:
+            evento['excecao'] = self.formatException(record.exc_info)
+        return json.dumps(evento, ensure_ascii=False, default=str)
+
+
+def obter_logger(nome: Optional[str] = None) -> logging.Logger:
+    """Logger 'gerador_docs' ou 'gerador_docs.<nome>'."""
+    return logging.getLogger(LOGGER if nome is None else f'{LOGGER}.{nome}')
+
+def configurar_log(formato: str = 'rich', nivel: int = logging.INFO, fluxo: Optional[TextIO] = None) -> logging.Logger:
+    """(Re)configura o logger do pacote com um único handler no formato escolhido.
+    :param fluxo: Destino dos logs (padrão: stderr).
+    :raises ValueError: Se o formato não for 'rich' ou 'json'.
+    """
+    if formato == 'json':
+        handler = logging.StreamHandler(fluxo or sys.stderr)
+        handler.setFormatter(JsonFormatter())
+    elif formato == 'rich':
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        handler = RichHandler(console=Console(file=fluxo or sys.stderr), show_path=False)
+    else:
+        raise ValueError(f"Formato de log não suportado: '{formato}' (use {' ou '.join(FORMATOS)}).")
+
+    logger = obter_logger()
+    for anterior in logger.handlers[:]:
+        logger.removeHandler(anterior)
+    logger.addHandler(handler)
+    logger.setLevel(nivel)
+    logger.propagate = False
+    return logger
+
+def registrar_metricas(formato: str = 'rich', metricas: RegistroMetricas = METRICAS, fluxo: Optional[TextIO] = None) -> None:
+    """Emite o valor final dos contadores: um evento 'metricas' (JSON) ou uma tabela do rich."""
+    if formato == 'json':
+        obter_logger('metricas').info('metricas', extra={'dados': {'metricas': metricas.registros()}})
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    tabela = Table(title='Métricas', title_justify='left')
+    tabela.add_column('Contador', no_wrap=True)
+    tabela.add_column('Valor', justify='right')
+    for chave, valor in metricas.instantaneo().items():
+        tabela.add_row(chave, f'{valor:,}')
+    Console(file=fluxo or sys.stderr).print(tabela)
@@ -0,0 +1,99 @@
+"""
+Contadores operacionais do docgen (documentos gerados, falhas de validação, cache, bytes gravados).
+
+Os contadores não usam locks: cada thread soma numa célula própria (um inteiro, indexado pelo
+identificador da thread), que só ela altera, e a leitura soma as células. O número de células é o
+de threads que já usaram o contador, não o de incrementos. Assim eles podem ser atualizados nos
+caminhos quentes e por várias threads sem custo perceptível. Cada contador é identificado pelo
+nome e pelos rótulos:
+
+    incrementar('documentos.gerados', tipo='caf')
+    incrementar('documentos.bytes', 48_213, tipo='caf')
+    METRICAS.instantaneo()  # {'documentos.bytes{tipo=caf}': 48213, 'documentos.gerados{tipo=caf}': 1}
+
+Contadores atualizados em processos filhos (`--jobs` > 1) não chegam ao processo principal;
+por isso a geração contabiliza os documentos a partir dos resultados devolvidos pelos processos.
+"""
+from threading import get_ident
+from typing import Dict, List, Tuple
+
+Rotulos = Tuple[Tuple[str, str], ...]
+
+
+class Contador:
+    """Contador monotônico, seguro entre threads sem locks."""
+    __slots__ = ('nome', 'rotulos', '_celulas')
+
+    def __init__(self, nome: str, rotulos: Rotulos = ()) -> None:
+        self.nome = nome
+        self.rotulos = rotulos
+        self._celulas: Dict[int, List[int]] = {}
+
+    def incrementar(self, quantidade: int = 1) -> None:
+        thread = get_ident()
+        celula = self._celulas.get(thread)
+        if celula is None:
+            # setdefault é atômico; a célula de uma thread só é alterada por ela mesma
+            celula = self._celulas.setdefault(thread, [0])
+        celula[0] += quantidade
+
+    @property
+    def valor(self) -> int:
+        return sum(celula[0] for celula in list(self._celulas.values()))
+
+    @property
+    def chave(self) -> str:
+        """Nome com os rótulos, ex.: 'validacao.falhas{erro=CPFInvalidError}'."""
+        if not self.rotulos:
+            return self.nome
+        return f"{self.nome}{{{','.join(f'{rotulo}={valor}' for rotulo, valor in self.rotulos)}}}"
+
+
+class RegistroMetricas:
+    """Conjunto de contadores, criados sob demanda no primeiro uso."""
+
+    def __init__(self) -> None:
+        self._contadores: Dict[Tuple[str, Rotulos], Contador] = {}
+
+    def contador(self, nome: str, **rotulos: str) -> Contador:
+        chave = (nome, tuple(sorted((rotulo, str(valor)) for rotulo, valor in rotulos.items())))
+        contador = self._contadores.get(chave)
+        if contador is None:
+            # setdefault é atômico: duas threads criando o mesmo contador recebem a mesma instância
+            contador = self._contadores.setdefault(chave, Contador(*chave))
+        return contador
+
+    def incrementar(self, nome: str, quantidade: int = 1, **rotulos: str) -> None:
+        self.contador(nome, **rotulos).incrementar(quantidade)
+
+    def instantaneo(self) -> Dict[str, int]:
+        """Valores atuais por chave ('nome{rotulo=valor}'), em ordem alfabética."""
+        return dict(sorted((contador.chave, contador.valor) for contador in list(self._contadores.values())))
+
+    def registros(self) -> List[Dict[str, object]]:
+        """Valores atuais como registros {'nome', 'rotulos', 'valor'} (ex.: para logs JSON)."""
+        return [
+            {'nome': contador.nome, 'rotulos': dict(contador.rotulos), 'valor': contador.valor}
+            for contador in sorted(list(self._contadores.values()), key=lambda contador: contador.chave)
+        ]
+
+    def zerar(self) -> None:
+        self._contadores.clear()
+
+
+METRICAS = RegistroMetricas()
+
+def contador(nome: str, **rotulos: str) -> Contador:
+    """Contador do registro global (guarde-o para evitar a busca a cada incremento)."""
+    return METRICAS.contador(nome, **rotulos)
+
+def incrementar(nome: str, quantidade: int = 1, **rotulos: str) -> None:
+    """Incrementa um contador do registro global."""
+    METRICAS.incrementar(nome, quantidade, **rotulos)
+
+def registrar_falha_validacao(erro: BaseException) -> None:
+    """Conta um registro rejeitado em 'validacao.falhas', rotulado pela classe do erro.
+    Chamado onde a falha é tratada (importação, comando db), e não na criação da exceção,
+    para que exceções criadas e descartadas não sejam contadas.
+    """
+    METRICAS.incrementar('validacao.falhas', erro=type(erro).__name__)
@@ -0,0 +1,208 @@
+"""
+Instrumentação opcional de tempo (spans) para descobrir onde um lote gasta seu tempo.
+
+Desativada por padrão: `medir()` devolve um contexto vazio e o custo é o de uma chamada de
+função. Com `docgen --profile` (ou DOCGEN_PROFILE=1) os comandos do `DefaultRunner`, as chamadas
+ao repositório (`repositorio.*`), a validação e a renderização são medidos, e ao final é exibida
+uma tabela-resumo por etapa. Opcionalmente o resultado também é gravado em arquivo:
+
+    docgen --profile-saida perfil.pstats caf ...  cProfile de toda a execução (ver `python -m pstats`)
+    docgen --profile-saida perfil.json caf ...    spans no formato Chrome trace (chrome://tracing, Perfetto)
+    DOCGEN_PROFILE=perfil.json docgen ...         o mesmo, pela variável de ambiente
+
+Spans medidos em processos filhos (`--jobs` > 1) não são coletados; nesse caso a renderização
+aparece como um único span 'renderizacao' no processo principal.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterator, List, NamedTuple, Optional, TextIO, TypeVar, Union
+
+T = TypeVar('T')
+
+# Extensões aceitas para o arquivo de saída (ver `perfilar`)
+FORMATOS = ('.pstats', '.json')
+
+_ATIVO: Optional['Perfilador'] = None
+_VAZIO = nullcontext()
+
+
+@dataclass(slots=True)
+class Span:
+    """Intervalo medido; `inicio` e `duracao` em nanossegundos (`time.perf_counter_ns`)."""
+    nome: str
+    inicio: int
+    duracao: int
+    thread: int
+
+
+class LinhaResumo(NamedTuple):
+    nome: str
+    chamadas: int
+    total: float
+    medio: float
+    maximo: float
+
+
+class Perfilador:
+    """Coleta os spans de uma execução."""
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self.inicio = time.perf_counter_ns()
+        self.fim: Optional[int] = None
+
+    @contextmanager
+    def medir(self, nome: str) -> Iterator[None]:
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.registrar(nome, inicio, time.perf_counter_ns() - inicio)
+
+    def registrar(self, nome: str, inicio: int, duracao: int) -> None:
+        # list.append é atômico: spans de outras threads (ex.: AsyncRepository) podem ser registrados sem lock
+        self.spans.append(Span(nome, inicio, duracao, threading.get_ident()))
+
+    @property
+    def duracao(self) -> int:
+        return (self.fim or time.perf_counter_ns()) - self.inicio
+
+    def resumo(self) -> List[LinhaResumo]:
+        """Tempo por etapa (em segundos), da etapa mais demorada para a menos demorada."""
+        por_nome = {}
+        for span in self.spans:
+            por_nome.setdefault(span.nome, []).append(span.duracao)
+        linhas = [
+            LinhaResumo(nome, len(duracoes), sum(duracoes) / 1e9, sum(duracoes) / len(duracoes) / 1e9, max(duracoes) / 1e9)
+            for nome, duracoes in por_nome.items()
+        ]
+        return sorted(linhas, key=lambda linha: (-linha.total, linha.nome))
+
+    def imprimir_resumo(self, arquivo: Optional[TextIO] = None) -> None:
+        """Exibe o resumo como uma tabela do rich (em stderr, por padrão, para não misturar com a saída do comando)."""
+        from rich.console import Console
+        from rich.table import Table
+
+        total = self.duracao / 1e9
+        tabela = Table(title=f'Perfil da execução ({total:.3f}s)', title_justify='left')
+        tabela.add_column('Etapa', no_wrap=True, min_width=max((len(span.nome) for span in self.spans), default=5))
+        for coluna in ('Chamadas', 'Total (s)', 'Média (ms)', 'Máx. (ms)', '%'):
+            tabela.add_column(coluna, justify='right')
+        for linha in self.resumo():
+            tabela.add_row(
+                linha.nome, f'{linha.chamadas:,}', f'{linha.total:.3f}', f'{linha.medio * 1e3:.2f}',
+                f'{linha.maximo * 1e3:.2f}', f'{linha.total / total:.1%}' if total else '-',
+            )
+        Console(file=arquivo or sys.stderr).print(tabela)
+
+    def gravar_chrome_trace(self, caminho: Union[str, Path]) -> Path:
+        """Grava os spans no formato 'Trace Event' (eventos completos, 'ph': 'X', tempos em microssegundos)."""
+        pid = os.getpid()
+        eventos = [
+            {
+                'name': span.nome, 'cat': span.nome.partition('.')[0], 'ph': 'X', 'pid': pid, 'tid': span.thread,
+                'ts': (span.inicio - self.inicio) / 1e3, 'dur': span.duracao / 1e3,
+            }
+            for span in self.spans
+        ]
+        caminho = Path(caminho)
+        caminho.write_text(json.dumps({'traceEvents': eventos, 'displayTimeUnit': 'ms'}), encoding='utf-8')
+        return caminho
+
+
+def ativo() -> Optional[Perfilador]:
+    """Perfilador da execução atual, ou None se a instrumentação estiver desativada."""
+    return _ATIVO
+
+def medir(nome: str):
+    """Contexto que mede um span `nome` se a instrumentação estiver ativa (e não faz nada, caso contrário)."""
+    return _VAZIO if _ATIVO is None else _ATIVO.medir(nome)
+
+def medir_iteracao(nome: str, iteravel: Iterator[T]) -> Iterator[T]:
+    """Repassa os itens de `iteravel`, somando num único span `nome` apenas o tempo gasto em produzi-los."""
+    perfilador = _ATIVO
+    if perfilador is None:
+        yield from iteravel
+        return
+
+    iterador = iter(iteravel)
+    inicio = time.perf_counter_ns()
+    gasto = 0
+    try:
+        while True:
+            antes = time.perf_counter_ns()
+            try:
+                item = next(iterador)
+            except StopIteration:
+                return
+            finally:
+                gasto += time.perf_counter_ns() - antes
+            yield item
+    finally:
+        perfilador.registrar(nome, inicio, gasto)
+
+def instrumentar(prefixo: str) -> Callable[[type], type]:
+    """Decorador de classe: cada método público passa a ser medido como '<prefixo>.<método>'."""
+    def decorar(classe: type) -> type:
+        for nome, metodo in list(vars(classe).items()):
+            if not nome.startswith('_') and callable(metodo):
+                setattr(classe, nome, _medido(f'{prefixo}.{nome}', metodo))
+        return classe
+    return decorar
+
+def _medido(nome: str, funcao: Callable) -> Callable:
+    @wraps(funcao)
+    def medida(*args, **kwargs):
+        if _ATIVO is None:
+            return funcao(*args, **kwargs)
+        with _ATIVO.medir(nome):
+            return funcao(*args, **kwargs)
+    return medida
+
+def destino_do_ambiente() -> Optional[str]:
+    """Lê DOCGEN_PROFILE: None se não definida (ou '0'), '' para apenas o resumo ('1') ou o arquivo de saída."""
+    valor = os.environ.get('DOCGEN_PROFILE', '').strip()
+    if valor in ('', '0'):
+        return None
+    return '' if valor == '1' else valor
+
+@contextmanager
+def perfilar(destino: Optional[Union[str, Path]] = None, arquivo_resumo: Optional[TextIO] = None) -> Iterator[Perfilador]:
+    """Ativa a instrumentação durante o bloco; ao final exibe o resumo e grava `destino`, se informado.
+    :param destino: Arquivo '.pstats' (cProfile) ou '.json' (Chrome trace).
+    :raises ValueError: Se a extensão de `destino` não for suportada.
+    """
+    global _ATIVO
+
+    sufixo = Path(destino).suffix.lower() if destino else None
+    if sufixo is not None and sufixo not in FORMATOS:
+        raise ValueError(f"Formato de perfil não suportado: '{sufixo}' (use {' ou '.join(FORMATOS)}).")
+
+    perfilador, anterior = Perfilador(), _ATIVO
+    profile = None
+    if sufixo == '.pstats':
+        import cProfile
+        profile = cProfile.Profile()
+
+    _ATIVO = perfilador
+    if profile is not None:
+        profile.enable()
+    try:
+        yield perfilador
+    finally:
+        if profile is not None:
+            profile.disable()
+        _ATIVO = anterior
+        perfilador.fim = time.perf_counter_ns()
+        perfilador.imprimir_resumo(arquivo_resumo)
+        if profile is not None:
+            profile.dump_stats(destino)
+        elif sufixo == '.json':
+            perfilador.gravar_chrome_trace(destino)
@@ -1,7 +1,16 @@
 from pathlib import Path
 
-from tinydb import TinyDB, Query
-from tinydb.table import Document
+from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import JSONStorage
+
+from gerador_docs import perfil
+from gerador_docs.repository._abc import IRepository
+from gerador_docs.repository._async import AsyncRepository
+from gerador_docs.repository._cache import CachedRepository, CacheStats
+from gerador_docs.repository._perfil import MeasuredRepository
+from gerador_docs.repository._sqlite import SqliteRepository
+from gerador_docs.repository._tinydb import TinyDbRepository
 
 
 """
@@ -19,7 +28,7 @@ _INSTANCE_PATH = Path(__file__).parent / 'instance'
 if not _INSTANCE_PATH.exists():
     _INSTANCE_PATH.mkdir()
 
-def create_engine(db_path_or_uri: Path | str):
+def create_engine(db_path_or_uri: Path | str, cache_size: int = 0) -> IRepository | AsyncRepository:
     """Esta tem por proposito realizar configurações e instanciar o objeto de conexao com o banco de dados.
     Args:
         db_path_or_uri (Path | str): 
@@ -29,17 +38,55 @@ def create_engine(db_path_or_uri: Path | str):
     
             Ex.: db_path_or_uri='tinydb+aiotinydb://instance/dados.json'
             Ex.: db_path_or_uri='sgbd+extension://instance/dados.json'
+            Ex.: db_path_or_uri='sqlite:///dados.db' (relativo a './instance/') ou 'sqlite:////caminho/absoluto.db'
+
+            Os esquemas 'tinydb+aiotinydb' e 'sqlite+aiosqlite' retornam um AsyncRepository
+            (métodos async) sobre o respectivo backend.
+        cache_size (int):
+            se maior que zero, envolve o repositório num CachedRepository (cache LRU de leitura)
+            com até `cache_size` pessoas.
 
+    Com a instrumentação de `gerador_docs.perfil` ativa (docgen --profile), o backend é envolvido
+    num MeasuredRepository, que mede cada chamada ao banco (acertos do cache não contam).
     """
     global _INSTANCE_PATH
 
-    def select_repository(): 
+    def resolve_path(path: str) -> Path:
+        """Caminhos relativos são criados dentro de './instance/' (o prefixo 'instance/' é opcional)."""
+        resolved = Path(path)
+        if resolved.is_absolute():
+            return resolved
+        if resolved.parts and resolved.parts[0] == _INSTANCE_PATH.name:
+            resolved = Path(*resolved.parts[1:])
+        return _INSTANCE_PATH / resolved
+
+    def select_repository(scheme: str, path: str): 
         """Factory que retorna uma instancia de IRepository, especificada na URI de conexão, por padrão trabalha com o tinydb."""
-        pass
+        if scheme in ('tinydb+aiotinydb', 'sqlite+aiosqlite'):
+            return AsyncRepository(select_repository(scheme.partition('+')[0], path))
+        if cache_size > 0:
+            return CachedRepository(select_repository_backend(scheme, path), maxsize=cache_size)
+        return select_repository_backend(scheme, path)
 
+    def select_repository_backend(scheme: str, path: str) -> IRepository:
+        repository = open_backend(scheme, path)
+        return repository if perfil.ativo() is None else MeasuredRepository(repository)
 
+    def open_backend(scheme: str, path: str) -> IRepository:
+        if scheme == 'sqlite':
+            # como no sqlalchemy: 'sqlite:///relativo.db' e 'sqlite:////absoluto.db'
+            path = path[1:] if path.startswith('/') else path
+            return SqliteRepository(path if path == ':memory:' else resolve_path(path))
+        if scheme == 'tinydb':
+            # o CachingMiddleware mantém o JSON em memória; o repositório grava o arquivo uma vez por operação
+            storage = CachingMiddleware(JSONStorage)
+            storage.WRITE_CACHE_SIZE = float('inf')
+            return TinyDbRepository(TinyDB(resolve_path(path), storage=storage))
+        raise ValueError(f"Banco de dados não suportado: '{scheme}'.")
 
-class TinyDbRepository:
-    
-    def __init__(self, db: TinyDB) -> None:
-        self._db = db
\ No newline at end of file
+    uri = str(db_path_or_uri)
+    scheme, separator, path = uri.partition('://')
+    if not separator:
+        scheme, path = 'tinydb', uri
+
+    return select_repository(scheme, path)
\ No newline at end of file
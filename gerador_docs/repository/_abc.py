@@ -1,2 +1,93 @@
 from abc import abstractmethod, ABC
+from typing import Dict, Iterable, Iterator, List, Optional
 
+from gerador_docs.tipos import DadosPessoais
+from gerador_docs.tipos._texto import normalizar_texto
+
+
+class IRepository(ABC):
+    """
+    Interface comum aos repositórios de pessoas.
+
+    As pessoas são identificadas pelo CPF, aceito com ou sem pontuação. As operações em lote
+    (`*_many`) são atômicas: executam numa única transação (SQL) ou numa única escrita
+    do arquivo (TinyDB), de modo que importar N pessoas custa uma escrita, e não N.
+    """
+
+    def __enter__(self) -> 'IRepository':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Libera a conexão/arquivo do banco de dados."""
+        pass
+
+    @abstractmethod
+    def add(self, pessoa: DadosPessoais) -> int:
+        """Adiciona uma pessoa.
+        :return: Identificador do registro criado.
+        :raises DuplicateRecordError: Se já existir uma pessoa com o mesmo CPF.
+        """
+
+    @abstractmethod
+    def get(self, cpf: str) -> Optional[DadosPessoais]:
+        """Busca uma pessoa pelo CPF, retornando None se ela não existir."""
+
+    @abstractmethod
+    def update(self, pessoa: DadosPessoais) -> bool:
+        """Substitui os dados da pessoa com o mesmo CPF.
+        :return: False se a pessoa não existir.
+        """
+
+    @abstractmethod
+    def remove(self, cpf: str) -> bool:
+        """Remove a pessoa pelo CPF.
+        :return: False se a pessoa não existir.
+        """
+
+    @abstractmethod
+    def list(self) -> Iterator[DadosPessoais]:
+        """Percorre todas as pessoas em ordem de inserção."""
+
+    def query(self, *, nome_completo: Optional[str] = None, bairro: Optional[str] = None) -> List[DadosPessoais]:
+        """Busca pessoas pelo nome completo e/ou pelo bairro de algum dos seus endereços.
+        A comparação ignora acentos, maiúsculas e espaços extras (ver `normalizar_texto`).
+        A implementação padrão percorre `list()`; os backends podem sobrescrevê-la com índices.
+        """
+        nome = None if nome_completo is None else normalizar_texto(nome_completo)
+        bairro = None if bairro is None else normalizar_texto(bairro)
+        return [
+            pessoa
+            for pessoa in self.list()
+            if (nome is None or normalizar_texto(pessoa.nome_completo) == nome)
+            and (bairro is None or bairro in {
+                normalizar_texto(endereco.bairro) for enderecos in pessoa.endereco.values() for endereco in enderecos
+            })
+        ]
+
+    @abstractmethod
+    def add_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        """Adiciona várias pessoas de uma só vez; se alguma já existir (ou se repetir no lote), nada é gravado.
+        :return: Quantidade de pessoas adicionadas.
+        :raises DuplicateRecordError: Se algum CPF já estiver cadastrado ou aparecer duas vezes no lote.
+        """
+
+    @abstractmethod
+    def upsert_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        """Adiciona ou substitui várias pessoas de uma só vez (a última ocorrência de um CPF no lote prevalece).
+        :return: Quantidade de pessoas gravadas.
+        """
+
+    @abstractmethod
+    def remove_many(self, cpfs: Iterable[str]) -> int:
+        """Remove várias pessoas de uma só vez.
+        :return: Quantidade de pessoas removidas.
+        """
+
+    @abstractmethod
+    def get_many(self, cpfs: Iterable[str]) -> Dict[str, DadosPessoais]:
+        """Busca várias pessoas de uma só vez.
+        :return: Dicionário CPF formatado -> pessoa, apenas com as pessoas encontradas.
+        """
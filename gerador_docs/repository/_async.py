@@ -0,0 +1,114 @@
+"Fachada asyncio para os repositórios síncronos."
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from gerador_docs.errors import DuplicateRecordError
+from gerador_docs.repository._abc import IRepository
+from gerador_docs.tipos import DadosPessoais
+
+T = TypeVar('T')
+
+
+class AsyncRepository:
+    """
+    Repositório com interface asyncio sobre um IRepository síncrono.
+
+    Todo acesso ao banco roda numa única thread dedicada, fora do event loop, de modo que
+    um lote de geração de documentos possa sobrepor a leitura dos dados à renderização.
+    Chamadas concorrentes de `add` feitas no mesmo ciclo do event loop são agrupadas
+    numa única chamada de `add_many` (uma transação/escrita de arquivo).
+    """
+
+    def __init__(self, repository: IRepository) -> None:
+        self._repository = repository
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='docgen-db')
+        self._pendentes: List[Tuple[DadosPessoais, asyncio.Future]] = []
+        self._gravacao: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> 'AsyncRepository':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Aguarda as escritas pendentes (inclusive a regravação individual após um conflito) e fecha o repositório."""
+        while self._gravacao is not None:
+            await self._gravacao
+        await self._executar(self._repository.close)
+        self._executor.shutdown()
+
+    async def get(self, cpf: str) -> Optional[DadosPessoais]:
+        return await self._executar(self._repository.get, cpf)
+
+    async def get_many(self, cpfs: Iterable[str]) -> Dict[str, DadosPessoais]:
+        return await self._executar(self._repository.get_many, list(cpfs))
+
+    async def query(self, *, nome_completo: Optional[str] = None, bairro: Optional[str] = None) -> List[DadosPessoais]:
+        return await self._executar(partial(self._repository.query, nome_completo=nome_completo, bairro=bairro))
+
+    async def list(self) -> List[DadosPessoais]:
+        return await self._executar(lambda: [*self._repository.list()])
+
+    async def add(self, pessoa: DadosPessoais) -> None:
+        """Adiciona uma pessoa; as chamadas concorrentes são gravadas juntas.
+        Diferente de `IRepository.add`, não retorna o identificador do registro: a gravação
+        é feita em lote por `add_many`, que informa apenas a quantidade gravada.
+        :raises DuplicateRecordError: Se já existir uma pessoa com o mesmo CPF.
+        """
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendentes.append((pessoa, futuro))
+        if self._gravacao is None:
+            self._gravacao = asyncio.ensure_future(self._gravar_pendentes())
+        await futuro
+
+    async def update(self, pessoa: DadosPessoais) -> bool:
+        return await self._executar(self._repository.update, pessoa)
+
+    async def remove(self, cpf: str) -> bool:
+        return await self._executar(self._repository.remove, cpf)
+
+    async def _executar(self, funcao: Callable[..., T], *args) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(funcao, *args))
+
+    async def _gravar_pendentes(self) -> None:
+        # Cede o controle uma vez para que as demais corrotinas do mesmo ciclo enfileirem suas escritas
+        await asyncio.sleep(0)
+        try:
+            # Escritas enfileiradas enquanto um lote é gravado formam o lote seguinte, na mesma tarefa;
+            # `_gravacao` só volta a None quando não há mais nada pendente, para que `close()` a aguarde
+            while self._pendentes:
+                lote, self._pendentes = self._pendentes, []
+                await self._gravar_lote(lote)
+        finally:
+            self._gravacao = None
+
+    async def _gravar_lote(self, lote: List[Tuple[DadosPessoais, asyncio.Future]]) -> None:
+        try:
+            await self._executar(self._repository.add_many, [pessoa for pessoa, _ in lote])
+        except DuplicateRecordError:
+            # O lote é atômico: regrava uma a uma para que só quem causou o conflito receba o erro
+            for pessoa, futuro in lote:
+                try:
+                    await self._executar(self._repository.add, pessoa)
+                except Exception as e:
+                    self._resolver(futuro, erro=e)
+                else:
+                    self._resolver(futuro, None)
+        except Exception as e:
+            for _, futuro in lote:
+                self._resolver(futuro, erro=e)
+        else:
+            for _, futuro in lote:
+                self._resolver(futuro, None)
+
+    @staticmethod
+    def _resolver(futuro: asyncio.Future, resultado=None, erro: Optional[BaseException] = None) -> None:
+        if futuro.done():  # quem aguardava foi cancelado
+            return
+        if erro is not None:
+            futuro.set_exception(erro)
+        else:
+            futuro.set_result(resultado)
@@ -0,0 +1,135 @@
+"Cache LRU de leitura, em memória, na frente de qualquer IRepository."
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from gerador_docs.metricas import contador
+from gerador_docs.repository._abc import IRepository
+from gerador_docs.tipos import DadosPessoais
+from gerador_docs.tipos.documents import formatar_cpf
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Contadores do cache, exportáveis via `to_dict()`."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class CachedRepository(IRepository):
+    """
+    Envolve um repositório com um cache LRU de tamanho limitado, indexado pelo CPF formatado.
+
+    Leituras repetidas da mesma pessoa (membros de uma família, o responsável por um poço...)
+    não voltam ao arquivo/banco. Toda escrita passa direto para o repositório e invalida as
+    entradas afetadas, de modo que o cache nunca devolve dados desatualizados.
+
+    O cache é indexado apenas pelo CPF, e não também pelo identificador interno do registro
+    (doc_id do TinyDB, rowid do SQLite): o IRepository não oferece busca por esse identificador,
+    e o CPF é a chave única de todas as operações. Uma segunda chave só faz sentido quando
+    houver leituras por ID no repositório.
+    """
+
+    def __init__(self, repository: IRepository, maxsize: int = 1024) -> None:
+        self._repository = repository
+        self._maxsize = maxsize
+        self._cache: OrderedDict[str, DadosPessoais] = OrderedDict()
+        self.stats = CacheStats()
+        # contadores globais (gerador_docs.metricas), somados entre todos os caches do processo
+        self._hits = contador('repositorio.cache.hits')
+        self._misses = contador('repositorio.cache.misses')
+
+    def __getattr__(self, nome: str):
+        # Métodos específicos do backend (ex.: SqliteRepository.get_por_documento) passam direto
+        if nome == '_repository':
+            raise AttributeError(nome)
+        return getattr(self._repository, nome)
+
+    def close(self) -> None:
+        self._cache.clear()
+        self._repository.close()
+
+    def get(self, cpf: str) -> Optional[DadosPessoais]:
+        chave = formatar_cpf(cpf)
+        pessoa = self._cache.get(chave)
+        if pessoa is not None:
+            self._cache.move_to_end(chave)
+            self.stats.hits += 1
+            self._hits.incrementar()
+            return pessoa
+
+        self.stats.misses += 1
+        self._misses.incrementar()
+        pessoa = self._repository.get(chave)
+        if pessoa is not None:
+            self._guardar(chave, pessoa)
+        return pessoa
+
+    def get_many(self, cpfs: Iterable[str]) -> Dict[str, DadosPessoais]:
+        encontrados, faltantes = {}, []
+        for chave in {formatar_cpf(cpf) for cpf in cpfs}:
+            pessoa = self._cache.get(chave)
+            if pessoa is None:
+                faltantes.append(chave)
+            else:
+                self._cache.move_to_end(chave)
+                encontrados[chave] = pessoa
+        self.stats.hits += len(encontrados)
+        self.stats.misses += len(faltantes)
+        self._hits.incrementar(len(encontrados))
+        self._misses.incrementar(len(faltantes))
+
+        if faltantes:
+            for chave, pessoa in self._repository.get_many(faltantes).items():
+                self._guardar(chave, pessoa)
+                encontrados[chave] = pessoa
+        return encontrados
+
+    def list(self) -> Iterator[DadosPessoais]:
+        return self._repository.list()
+
+    def query(self, *, nome_completo: Optional[str] = None, bairro: Optional[str] = None) -> List[DadosPessoais]:
+        return self._repository.query(nome_completo=nome_completo, bairro=bairro)
+
+    def add(self, pessoa: DadosPessoais) -> int:
+        self._invalidar([pessoa.numero_cpf])
+        return self._repository.add(pessoa)
+
+    def update(self, pessoa: DadosPessoais) -> bool:
+        self._invalidar([pessoa.numero_cpf])
+        return self._repository.update(pessoa)
+
+    def remove(self, cpf: str) -> bool:
+        self._invalidar([cpf])
+        return self._repository.remove(cpf)
+
+    def add_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        pessoas = [*pessoas]
+        self._invalidar(pessoa.numero_cpf for pessoa in pessoas)
+        return self._repository.add_many(pessoas)
+
+    def upsert_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        pessoas = [*pessoas]
+        self._invalidar(pessoa.numero_cpf for pessoa in pessoas)
+        return self._repository.upsert_many(pessoas)
+
+    def remove_many(self, cpfs: Iterable[str]) -> int:
+        cpfs = [*cpfs]
+        self._invalidar(cpfs)
+        return self._repository.remove_many(cpfs)
+
+    def _guardar(self, chave: str, pessoa: DadosPessoais) -> None:
+        self._cache[chave] = pessoa
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _invalidar(self, cpfs: Iterable[str]) -> None:
+        for cpf in cpfs:
+            if self._cache.pop(formatar_cpf(cpf), None) is not None:
+                self.stats.invalidations += 1
@@ -0,0 +1,70 @@
+"Repositório que mede o tempo de cada chamada ao backend (ativado por `docgen --profile`)."
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from gerador_docs.perfil import medir, medir_iteracao
+from gerador_docs.repository._abc import IRepository
+from gerador_docs.tipos import DadosPessoais
+
+
+class MeasuredRepository(IRepository):
+    """
+    Envolve um repositório registrando cada chamada como um span 'repositorio.<método>'.
+
+    As entradas das operações em lote são materializadas antes do span, de modo que o tempo
+    de quem produz as pessoas (ex.: leitura e validação de um arquivo) não conta como E/S do banco.
+    """
+
+    def __init__(self, repository: IRepository) -> None:
+        self._repository = repository
+
+    def __getattr__(self, nome: str):
+        if nome == '_repository':
+            raise AttributeError(nome)
+        return getattr(self._repository, nome)
+
+    def close(self) -> None:
+        with medir('repositorio.close'):
+            self._repository.close()
+
+    def add(self, pessoa: DadosPessoais) -> int:
+        with medir('repositorio.add'):
+            return self._repository.add(pessoa)
+
+    def get(self, cpf: str) -> Optional[DadosPessoais]:
+        with medir('repositorio.get'):
+            return self._repository.get(cpf)
+
+    def update(self, pessoa: DadosPessoais) -> bool:
+        with medir('repositorio.update'):
+            return self._repository.update(pessoa)
+
+    def remove(self, cpf: str) -> bool:
+        with medir('repositorio.remove'):
+            return self._repository.remove(cpf)
+
+    def list(self) -> Iterator[DadosPessoais]:
+        return medir_iteracao('repositorio.list', self._repository.list())
+
+    def query(self, *, nome_completo: Optional[str] = None, bairro: Optional[str] = None) -> List[DadosPessoais]:
+        with medir('repositorio.query'):
+            return self._repository.query(nome_completo=nome_completo, bairro=bairro)
+
+    def add_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        pessoas = [*pessoas]
+        with medir('repositorio.add_many'):
+            return self._repository.add_many(pessoas)
+
+    def upsert_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        pessoas = [*pessoas]
+        with medir('repositorio.upsert_many'):
+            return self._repository.upsert_many(pessoas)
+
+    def remove_many(self, cpfs: Iterable[str]) -> int:
+        cpfs = [*cpfs]
+        with medir('repositorio.remove_many'):
+            return self._repository.remove_many(cpfs)
+
+    def get_many(self, cpfs: Iterable[str]) -> Dict[str, DadosPessoais]:
+        cpfs = [*cpfs]
+        with medir('repositorio.get_many'):
+            return self._repository.get_many(cpfs)
@@ -0,0 +1,273 @@
+"Repositório de pessoas persistido em SQLite."
+import sqlite3
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
+
+from gerador_docs.errors import DuplicateRecordError
+from gerador_docs.repository._abc import IRepository
+from gerador_docs.tipos import DadosPessoais
+from gerador_docs.tipos.documents import formatar_cpf
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pessoas (
+    id              INTEGER PRIMARY KEY,
+    cpf             TEXT NOT NULL,
+    nome_completo   TEXT NOT NULL,
+    genero          TEXT NOT NULL,
+    estado_civil    TEXT NOT NULL,
+    profissao       TEXT NOT NULL,
+    nacionalidade   TEXT NOT NULL,
+    rg              TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_pessoas_cpf ON pessoas (cpf);
+
+CREATE TABLE IF NOT EXISTS enderecos (
+    id              INTEGER PRIMARY KEY,
+    pessoa_id       INTEGER NOT NULL REFERENCES pessoas (id) ON DELETE CASCADE,
+    tag             TEXT NOT NULL CHECK (tag IN ('residencial', 'trabalho')),
+    bairro          TEXT NOT NULL,
+    logradouro      TEXT NOT NULL,
+    numero          TEXT NOT NULL,
+    complemento     TEXT,
+    cidade          TEXT NOT NULL,
+    estado          TEXT NOT NULL,
+    cep             TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_enderecos_pessoa ON enderecos (pessoa_id);
+
+CREATE TABLE IF NOT EXISTS documentos (
+    id              INTEGER PRIMARY KEY,
+    pessoa_id       INTEGER NOT NULL REFERENCES pessoas (id) ON DELETE CASCADE,
+    tipo            TEXT NOT NULL CHECK (tipo IN ('CAF', 'CAR')),
+    numero          TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_documentos_numero ON documentos (tipo, numero);
+CREATE INDEX IF NOT EXISTS ix_documentos_pessoa ON documentos (pessoa_id);
+"""
+
+# Comandos SQL fixos e parametrizados: o sqlite3 mantém cada um compilado no cache de statements da conexão.
+_COLUNAS_PESSOA = "id, cpf, nome_completo, genero, estado_civil, profissao, nacionalidade, rg"
+_COLUNAS_ENDERECO = "pessoa_id, tag, bairro, logradouro, numero, complemento, cidade, estado, cep"
+
+_SQL_INSERIR_PESSOA = (
+    "INSERT INTO pessoas (cpf, nome_completo, genero, estado_civil, profissao, nacionalidade, rg) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_ATUALIZAR_PESSOA = (
+    "UPDATE pessoas SET nome_completo = ?, genero = ?, estado_civil = ?, profissao = ?, nacionalidade = ?, rg = ? "
+    "WHERE cpf = ?"
+)
+_SQL_INSERIR_ENDERECO = f"INSERT INTO enderecos ({_COLUNAS_ENDERECO}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_SQL_REMOVER_ENDERECOS = "DELETE FROM enderecos WHERE pessoa_id = ?"
+_SQL_ID_POR_CPF = "SELECT id FROM pessoas WHERE cpf = ?"
+_SQL_PESSOA_POR_CPF = f"SELECT {_COLUNAS_PESSOA} FROM pessoas WHERE cpf = ?"
+_SQL_PESSOA_POR_DOCUMENTO = (
+    f"SELECT {', '.join('p.' + coluna for coluna in _COLUNAS_PESSOA.split(', '))} "
+    "FROM documentos d JOIN pessoas p ON p.id = d.pessoa_id WHERE d.tipo = ? AND d.numero = ?"
+)
+_SQL_ENDERECOS_POR_PESSOA = f"SELECT {_COLUNAS_ENDERECO} FROM enderecos WHERE pessoa_id = ? ORDER BY id"
+# Consultas em lote: o número de marcadores é fixo (lotes completados com NULL) para reaproveitar o statement compilado
+_TAMANHO_LOTE_SQL = 500
+_MARCADORES_LOTE = ', '.join('?' * _TAMANHO_LOTE_SQL)
+_SQL_PESSOAS_POR_CPFS = f"SELECT {_COLUNAS_PESSOA} FROM pessoas WHERE cpf IN ({_MARCADORES_LOTE})"
+_SQL_ENDERECOS_POR_PESSOAS = (
+    f"SELECT {_COLUNAS_ENDERECO} FROM enderecos WHERE pessoa_id IN ({_MARCADORES_LOTE}) ORDER BY pessoa_id, id"
+)
+_SQL_TODAS_PESSOAS = f"SELECT {_COLUNAS_PESSOA} FROM pessoas ORDER BY id"
+_SQL_TODOS_ENDERECOS = f"SELECT {_COLUNAS_ENDERECO} FROM enderecos ORDER BY pessoa_id, id"
+_SQL_REMOVER_PESSOA = "DELETE FROM pessoas WHERE cpf = ?"
+_SQL_INSERIR_DOCUMENTO = "INSERT INTO documentos (pessoa_id, tipo, numero) VALUES (?, ?, ?)"
+
+_CAMPOS_ENDERECO = _COLUNAS_ENDERECO.split(', ')[1:]
+
+
+class SqliteRepository(IRepository):
+    """
+    Repositório de pessoas em SQLite.
+
+    Pessoas, endereços e documentos (CAF/CAR) ficam em tabelas próprias; o CPF e os números
+    de CAF/CAR possuem índices únicos, então as buscas por essas chaves não dependem do
+    tamanho do cadastro. O banco é aberto em modo WAL e cada operação (inclusive as em lote)
+    roda numa única transação.
+    """
+
+    def __init__(self, db_path: Union[Path, str]) -> None:
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, cached_statements=64)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add(self, pessoa: DadosPessoais) -> int:
+        with self._conn:
+            return self._inserir(pessoa)
+
+    def get(self, cpf: str) -> Optional[DadosPessoais]:
+        linha = self._conn.execute(_SQL_PESSOA_POR_CPF, (formatar_cpf(cpf),)).fetchone()
+        if linha is None:
+            return None
+        return self._montar(linha, self._conn.execute(_SQL_ENDERECOS_POR_PESSOA, (linha[0],)))
+
+    def update(self, pessoa: DadosPessoais) -> bool:
+        with self._conn:
+            return self._atualizar(pessoa)
+
+    def remove(self, cpf: str) -> bool:
+        with self._conn:
+            return self._conn.execute(_SQL_REMOVER_PESSOA, (formatar_cpf(cpf),)).rowcount > 0
+
+    def list(self) -> Iterator[DadosPessoais]:
+        """Percorre todas as pessoas sem carregar o cadastro inteiro em memória."""
+        enderecos = groupby(self._conn.execute(_SQL_TODOS_ENDERECOS), key=lambda linha: linha[0])
+        pessoa_id_enderecos, grupo = next(enderecos, (None, iter(())))
+        for linha in self._conn.execute(_SQL_TODAS_PESSOAS):
+            # Avança o grupo de endereços até alcançar o id da pessoa atual (ambos ordenados por id)
+            while pessoa_id_enderecos is not None and pessoa_id_enderecos < linha[0]:
+                pessoa_id_enderecos, grupo = next(enderecos, (None, iter(())))
+            yield self._montar(linha, grupo if pessoa_id_enderecos == linha[0] else ())
+
+    def add_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        quantidade = 0
+        with self._conn:
+            for pessoa in pessoas:
+                self._inserir(pessoa)
+                quantidade += 1
+        return quantidade
+
+    def upsert_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        quantidade = 0
+        with self._conn:
+            for pessoa in pessoas:
+                if not self._atualizar(pessoa):
+                    self._inserir(pessoa)
+                quantidade += 1
+        return quantidade
+
+    def remove_many(self, cpfs: Iterable[str]) -> int:
+        with self._conn:
+            return self._conn.executemany(_SQL_REMOVER_PESSOA, [(formatar_cpf(cpf),) for cpf in cpfs]).rowcount
+
+    def get_many(self, cpfs: Iterable[str]) -> Dict[str, DadosPessoais]:
+        procurados = sorted({formatar_cpf(cpf) for cpf in cpfs})
+        encontrados = {}
+        for inicio in range(0, len(procurados), _TAMANHO_LOTE_SQL):
+            linhas = self._conn.execute(_SQL_PESSOAS_POR_CPFS, self._completar_lote(procurados[inicio:inicio + _TAMANHO_LOTE_SQL])).fetchall()
+            enderecos = {
+                pessoa_id: list(grupo)
+                for pessoa_id, grupo in groupby(
+                    self._conn.execute(_SQL_ENDERECOS_POR_PESSOAS, self._completar_lote([linha[0] for linha in linhas])),
+                    key=lambda linha: linha[0],
+                )
+            }
+            for linha in linhas:
+                encontrados[linha[1]] = self._montar(linha, enderecos.get(linha[0], ()))
+        return encontrados
+
+    def add_documento(self, cpf: str, tipo: Literal['CAF', 'CAR'], numero: str) -> None:
+        """Vincula um número de CAF ou CAR à pessoa.
+        :raises KeyError: Se a pessoa não existir.
+        :raises DuplicateRecordError: Se o número já estiver cadastrado.
+        """
+        with self._conn:
+            pessoa_id = self._id_por_cpf(formatar_cpf(cpf))
+            if pessoa_id is None:
+                raise KeyError(cpf)
+            try:
+                self._conn.execute(_SQL_INSERIR_DOCUMENTO, (pessoa_id, tipo, numero))
+            except sqlite3.IntegrityError as e:
+                raise DuplicateRecordError(f"{tipo} já cadastrado: {numero}.") from e
+
+    def add_documentos(self, documentos: Iterable[Tuple[str, Literal['CAF', 'CAR'], str]]) -> int:
+        """Vincula vários documentos (cpf, tipo, número) numa única transação; ou todos são gravados, ou nenhum.
+        :return: Quantidade de documentos gravados.
+        :raises KeyError: Se alguma pessoa não existir.
+        :raises DuplicateRecordError: Se algum número já estiver cadastrado.
+        """
+        quantidade = 0
+        with self._conn:
+            for cpf, tipo, numero in documentos:
+                pessoa_id = self._id_por_cpf(formatar_cpf(cpf))
+                if pessoa_id is None:
+                    raise KeyError(cpf)
+                try:
+                    self._conn.execute(_SQL_INSERIR_DOCUMENTO, (pessoa_id, tipo, numero))
+                except sqlite3.IntegrityError as e:
+                    raise DuplicateRecordError(f"{tipo} já cadastrado: {numero}.") from e
+                quantidade += 1
+        return quantidade
+
+    def get_por_documento(self, tipo: Literal['CAF', 'CAR'], numero: str) -> Optional[DadosPessoais]:
+        """Busca o titular de um número de CAF ou CAR através do índice único."""
+        linha = self._conn.execute(_SQL_PESSOA_POR_DOCUMENTO, (tipo, numero)).fetchone()
+        if linha is None:
+            return None
+        return self._montar(linha, self._conn.execute(_SQL_ENDERECOS_POR_PESSOA, (linha[0],)))
+
+    @staticmethod
+    def _completar_lote(valores: List) -> List:
+        return valores + [None] * (_TAMANHO_LOTE_SQL - len(valores))
+
+    def _id_por_cpf(self, cpf: str) -> Optional[int]:
+        linha = self._conn.execute(_SQL_ID_POR_CPF, (cpf,)).fetchone()
+        return None if linha is None else linha[0]
+
+    def _inserir(self, pessoa: DadosPessoais) -> int:
+        try:
+            cursor = self._conn.execute(_SQL_INSERIR_PESSOA, self._linha_pessoa(pessoa))
+        except sqlite3.IntegrityError as e:
+            raise DuplicateRecordError(f"CPF já cadastrado: {pessoa.numero_cpf}.") from e
+        self._inserir_enderecos(cursor.lastrowid, pessoa)
+        return cursor.lastrowid
+
+    def _atualizar(self, pessoa: DadosPessoais) -> bool:
+        cpf, *dados = self._linha_pessoa(pessoa)
+        if self._conn.execute(_SQL_ATUALIZAR_PESSOA, (*dados, cpf)).rowcount == 0:
+            return False
+        pessoa_id = self._id_por_cpf(cpf)
+        self._conn.execute(_SQL_REMOVER_ENDERECOS, (pessoa_id,))
+        self._inserir_enderecos(pessoa_id, pessoa)
+        return True
+
+    def _inserir_enderecos(self, pessoa_id: int, pessoa: DadosPessoais) -> None:
+        self._conn.executemany(
+            _SQL_INSERIR_ENDERECO,
+            [
+                (pessoa_id, end.tag, end.bairro, end.logradouro, end.numero, end.complemento, end.cidade, end.estado, end.cep)
+                for tag in ('residencial', 'trabalho')
+                for end in pessoa.endereco.get(tag, ())
+            ],
+        )
+
+    @staticmethod
+    def _linha_pessoa(pessoa: DadosPessoais) -> Tuple[str, ...]:
+        return (
+            formatar_cpf(pessoa.numero_cpf),
+            pessoa.nome_completo,
+            pessoa.genero,
+            pessoa.estado_civil,
+            pessoa.profissao,
+            pessoa.nacionalidade,
+            pessoa.numero_rg,
+        )
+
+    @staticmethod
+    def _montar(linha: Tuple, enderecos) -> DadosPessoais:
+        _, cpf, nome_completo, genero, estado_civil, profissao, nacionalidade, rg = linha
+        por_tag: Dict[str, List[dict]] = {'residencial': [], 'trabalho': []}
+        for endereco in enderecos:
+            dados = dict(zip(_CAMPOS_ENDERECO, endereco[1:]))
+            por_tag[dados['tag']].append(dados)
+        return DadosPessoais.from_trusted_dict({
+            'nome_completo': nome_completo,
+            'genero': genero,
+            'estado_civil': estado_civil,
+            'profissao': profissao,
+            'nacionalidade': nacionalidade,
+            'cpf': {'numero': cpf},
+            'rg': {'numero': rg},
+            'endereco': por_tag,
+        })
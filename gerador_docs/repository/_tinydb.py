@@ -0,0 +1,175 @@
+"Repositório de pessoas persistido em TinyDB (arquivo JSON)."
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set
+
+from tinydb import TinyDB
+
+from gerador_docs.errors import DuplicateRecordError
+from gerador_docs.repository._abc import IRepository
+from gerador_docs.tipos import DadosPessoais
+from gerador_docs.tipos._texto import normalizar_texto
+from gerador_docs.tipos.documents import formatar_cpf
+
+TABELA_PESSOAS = 'pessoas'
+
+
+class _IndicesSecundarios:
+    """Índices em memória (CPF, nome normalizado e bairro normalizado) -> doc_id."""
+    __slots__ = ('por_cpf', 'por_nome', 'por_bairro')
+
+    def __init__(self) -> None:
+        self.por_cpf: Dict[str, int] = {}
+        self.por_nome: Dict[str, Set[int]] = defaultdict(set)
+        self.por_bairro: Dict[str, Set[int]] = defaultdict(set)
+
+    def adicionar(self, doc_id: int, registro: Mapping) -> None:
+        self.por_cpf[registro['cpf']['numero']] = doc_id
+        self.por_nome[normalizar_texto(registro['nome_completo'])].add(doc_id)
+        for bairro in self._bairros(registro):
+            self.por_bairro[bairro].add(doc_id)
+
+    def remover(self, doc_id: int, registro: Mapping) -> None:
+        self.por_cpf.pop(registro['cpf']['numero'], None)
+        self._descartar(self.por_nome, normalizar_texto(registro['nome_completo']), doc_id)
+        for bairro in self._bairros(registro):
+            self._descartar(self.por_bairro, bairro, doc_id)
+
+    @staticmethod
+    def _bairros(registro: Mapping) -> Set[str]:
+        return {normalizar_texto(endereco['bairro']) for enderecos in registro['endereco'].values() for endereco in enderecos}
+
+    @staticmethod
+    def _descartar(indice: Dict[str, Set[int]], chave: str, doc_id: int) -> None:
+        ids = indice.get(chave)
+        if ids is not None:
+            ids.discard(doc_id)
+            if not ids:
+                del indice[chave]
+
+
+class TinyDbRepository(IRepository):
+    """
+    Repositório de pessoas em TinyDB.
+
+    Cada operação do TinyDB relê e reescreve o arquivo inteiro; por isso os lotes são aplicados
+    numa única operação de tabela e, quando o banco usa `CachingMiddleware` (como em
+    `create_engine`), o arquivo é gravado uma única vez ao final de cada método.
+
+    Buscas por CPF, nome e bairro usam índices secundários em memória, construídos na
+    primeira consulta e atualizados a cada escrita (pressupõe que só este processo altera o arquivo).
+    """
+    
+    def __init__(self, db: TinyDB) -> None:
+        self._db = db
+        self._table = db.table(TABELA_PESSOAS)
+        self._indices_cache: Optional[_IndicesSecundarios] = None
+
+    def close(self) -> None:
+        self._db.close()
+
+    def add(self, pessoa: DadosPessoais) -> int:
+        registro = pessoa.to_dict()
+        indices = self._indices()
+        if registro['cpf']['numero'] in indices.por_cpf:
+            raise DuplicateRecordError(f"CPF já cadastrado: {registro['cpf']['numero']}.")
+        doc_id = self._table.insert(registro)
+        indices.adicionar(doc_id, registro)
+        self._flush()
+        return doc_id
+
+    def get(self, cpf: str) -> Optional[DadosPessoais]:
+        doc_id = self._indices().por_cpf.get(formatar_cpf(cpf))
+        return None if doc_id is None else DadosPessoais.from_trusted_dict(self._table.get(doc_id=doc_id))
+
+    def update(self, pessoa: DadosPessoais) -> bool:
+        return self.upsert_many([pessoa], somente_existentes=True) > 0
+
+    def remove(self, cpf: str) -> bool:
+        return self.remove_many([cpf]) > 0
+
+    def list(self) -> Iterator[DadosPessoais]:
+        for documento in self._table:
+            yield DadosPessoais.from_trusted_dict(documento)
+
+    def query(self, *, nome_completo: Optional[str] = None, bairro: Optional[str] = None) -> List[DadosPessoais]:
+        if nome_completo is None and bairro is None:
+            return [*self.list()]
+        indices = self._indices()
+        candidatos = []
+        if nome_completo is not None:
+            candidatos.append(indices.por_nome.get(normalizar_texto(nome_completo), set()))
+        if bairro is not None:
+            candidatos.append(indices.por_bairro.get(normalizar_texto(bairro), set()))
+        return [
+            DadosPessoais.from_trusted_dict(self._table.get(doc_id=doc_id))
+            for doc_id in sorted(set.intersection(*candidatos))
+        ]
+
+    def add_many(self, pessoas: Iterable[DadosPessoais]) -> int:
+        registros = [pessoa.to_dict() for pessoa in pessoas]
+        indices = self._indices()
+        no_lote = set()
+        for registro in registros:
+            cpf = registro['cpf']['numero']
+            if cpf in indices.por_cpf or cpf in no_lote:
+                raise DuplicateRecordError(f"CPF já cadastrado: {cpf}.")
+            no_lote.add(cpf)
+
+        for doc_id, registro in zip(self._table.insert_multiple(registros), registros):
+            indices.adicionar(doc_id, registro)
+        self._flush()
+        return len(registros)
+
+    def upsert_many(self, pessoas: Iterable[DadosPessoais], *, somente_existentes: bool = False) -> int:
+        registros = {formatar_cpf(pessoa.numero_cpf): pessoa.to_dict() for pessoa in pessoas}
+        indices = self._indices()
+        ids = {cpf: indices.por_cpf[cpf] for cpf in registros if cpf in indices.por_cpf}
+
+        def substituir(documento: dict) -> None:
+            cpf = documento['cpf']['numero']
+            indices.remover(ids[cpf], documento)
+            documento.clear()
+            documento.update(registros[cpf])
+            indices.adicionar(ids[cpf], documento)
+
+        if ids:
+            self._table.update(substituir, doc_ids=[*ids.values()])
+        novos = [] if somente_existentes else [registro for cpf, registro in registros.items() if cpf not in ids]
+        if novos:
+            for doc_id, registro in zip(self._table.insert_multiple(novos), novos):
+                indices.adicionar(doc_id, registro)
+        self._flush()
+        return len(ids) + len(novos)
+
+    def remove_many(self, cpfs: Iterable[str]) -> int:
+        indices = self._indices()
+        ids = {indices.por_cpf[cpf] for cpf in map(formatar_cpf, cpfs) if cpf in indices.por_cpf}
+        if ids:
+            for doc_id in ids:
+                indices.remover(doc_id, self._table.get(doc_id=doc_id))
+            self._table.remove(doc_ids=[*ids])
+            self._flush()
+        return len(ids)
+
+    def get_many(self, cpfs: Iterable[str]) -> Dict[str, DadosPessoais]:
+        por_cpf = self._indices().por_cpf
+        return {
+            cpf: DadosPessoais.from_trusted_dict(self._table.get(doc_id=por_cpf[cpf]))
+            for cpf in {formatar_cpf(cpf) for cpf in cpfs}
+            if cpf in por_cpf
+        }
+
+    def _indices(self) -> _IndicesSecundarios:
+        """Constrói os índices na primeira utilização (uma única passada pela tabela)."""
+        if self._indices_cache is None:
+            indices = _IndicesSecundarios()
+            for documento in self._table:
+                indices.adicionar(documento.doc_id, documento)
+            self._indices_cache = indices
+        return self._indices_cache
+
+    def _flush(self) -> None:
+        """Grava o arquivo uma única vez quando o banco usa CachingMiddleware; caso contrário, o TinyDB já gravou."""
+        flush = getattr(self._db.storage, 'flush', None)
+        if flush is not None:
+            flush()
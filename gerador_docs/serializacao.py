@@ -0,0 +1,57 @@
+"""
+Codec JSON Lines para DadosPessoais.
+
+Cada linha do arquivo contém um único registro no formato de `DadosPessoais.to_dict()`.
+Leitura e escrita são feitas um registro por vez (geradores), de modo que o consumo de
+memória não depende do tamanho do arquivo.
+"""
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Union
+
+from gerador_docs.tipos import DadosPessoais
+
+Destino = Union[str, Path, IO[str]]
+
+@contextmanager
+def _abrir(arquivo: Destino, modo: str) -> Iterator[IO[str]]:
+    """Abre caminhos em UTF-8; objetos de arquivo já abertos são usados como estão (e não são fechados)."""
+    if isinstance(arquivo, (str, Path)):
+        with open(arquivo, modo, encoding='utf-8', newline='\n') as fp:
+            yield fp
+    else:
+        yield arquivo
+
+def escrever_jsonl(pessoas: Iterable[DadosPessoais], destino: Destino) -> int:
+    """Escreve as pessoas em JSON Lines, uma por linha, à medida que são consumidas.
+    :param pessoas: Iterável (pode ser um gerador) de DadosPessoais.
+    :param destino: Caminho do arquivo ou objeto de arquivo em modo texto.
+    :return: Quantidade de registros escritos.
+    """
+    quantidade = 0
+    with _abrir(destino, 'w') as fp:
+        for pessoa in pessoas:
+            fp.write(json.dumps(pessoa.to_dict(), ensure_ascii=False, separators=(',', ':')))
+            fp.write('\n')
+            quantidade += 1
+    return quantidade
+
+def ler_jsonl(origem: Destino, *, confiavel: bool = False) -> Iterator[DadosPessoais]:
+    """Lê pessoas de um arquivo JSON Lines, uma por vez.
+    :param origem: Caminho do arquivo ou objeto de arquivo em modo texto.
+    :param confiavel: Se True, usa `DadosPessoais.from_trusted_dict` (sem revalidação);
+        use apenas com arquivos gerados por `escrever_jsonl` a partir de dados já validados.
+    :return: Gerador de DadosPessoais.
+    :raises ValueError: Se alguma linha não contiver um JSON válido.
+    """
+    construir = DadosPessoais.from_trusted_dict if confiavel else DadosPessoais.from_dict
+    with _abrir(origem, 'r') as fp:
+        for numero_linha, linha in enumerate(fp, start=1):
+            if not linha.strip():
+                continue
+            try:
+                registro = json.loads(linha)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Linha {numero_linha} inválida: {e}") from e
+            yield construir(registro)
@@ -0,0 +1,114 @@
+"""
+Gerador de cadastros sintéticos para testes de carga.
+
+Produz, de forma determinística a partir de uma semente, pessoas que passam pela validação
+dos tipos: CPFs com dígitos verificadores corretos (e sem repetição dentro de uma mesma
+geração), RGs, endereços em bairros e sítios de Feira Nova e números de CAR. Tudo é gerado
+sob demanda (geradores), então o consumo de memória não depende da quantidade.
+"""
+import random
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+from gerador_docs.tipos import CPF, DadosPessoais, Endereco, RG
+
+BAIRROS = (
+    'Centro', 'Alto do Cruzeiro', 'Alto da Boa Vista', 'Cohab', 'Loteamento Santa Luzia',
+    'Loteamento São José', 'Vila Nova', 'Rua Nova', 'Sítio Lagoa do Félix', 'Sítio Cruzes',
+    'Sítio Chã de Alegria', 'Sítio Pau Ferro', 'Sítio Ribeiro', 'Sítio Bizarra', 'Sítio Lagoa Comprida',
+)
+LOGRADOUROS = (
+    'Rua Joaquim Correia', 'Rua São Sebastião', 'Rua Vereador José Severino', 'Rua do Rosário',
+    'Avenida Getúlio Vargas', 'Rua Nossa Senhora da Conceição', 'Travessa da Matriz', 'Rua Projetada',
+    'Estrada Vicinal', 'Rua da Feira',
+)
+NOMES_M = ('José', 'João', 'Antônio', 'Francisco', 'Severino', 'Manoel', 'Luiz', 'Pedro', 'Paulo', 'Carlos')
+NOMES_F = ('Maria', 'Ana', 'Francisca', 'Josefa', 'Antônia', 'Luzia', 'Rita', 'Joana', 'Cícera', 'Edileuza')
+SOBRENOMES = (
+    'da Silva', 'dos Santos', 'de Oliveira', 'de Souza', 'Pereira', 'Ferreira', 'de Lima', 'Alves',
+    'Barbosa', 'Cavalcanti', 'de Albuquerque', 'do Nascimento', 'Gomes', 'Bezerra', 'de Andrade',
+)
+PROFISSOES_M = ('Agricultor', 'Pescador', 'Trabalhador Rural', 'Avicultor')
+PROFISSOES_F = ('Agricultora', 'Pescadora', 'Trabalhadora Rural', 'Avicultora')
+ESTADOS_CIVIS = ('solteiro', 'casado', 'divorciado', 'viuvo')
+
+_PESOS_PRIMEIRO = tuple(range(10, 1, -1))
+_PESOS_SEGUNDO = tuple(range(11, 1, -1))
+_ALFABETO_CAR = '0123456789ABCDEF'
+# Tamanho (em caracteres) das 7 partes do CAR após o prefixo 'PE-2605707-' (UF e código IBGE de Feira Nova)
+_PARTES_CAR = (5, 5, 5, 5, 5, 4, 4)
+
+
+def digitos_verificadores(base: str) -> str:
+    """Calcula os dois dígitos verificadores dos 9 primeiros dígitos do CPF (mesma regra de `validar_cpf`)."""
+    digitos = [int(d) for d in base]
+    for pesos in (_PESOS_PRIMEIRO, _PESOS_SEGUNDO):
+        resto = sum(d * p for d, p in zip(digitos, pesos)) * 10 % 11
+        digitos.append(0 if resto == 10 else resto)
+    return f'{digitos[9]}{digitos[10]}'
+
+def gerar_cpfs(rnd: random.Random) -> Iterator[str]:
+    """CPFs válidos (apenas dígitos), sem repetição nos primeiros 10^9 valores.
+    As bases percorrem uma permutação afim de 0..10^9-1 (multiplicador coprimo com 10), sem precisar
+    guardar os CPFs já gerados.
+    """
+    multiplicador = rnd.randrange(1, 10**9) | 1
+    while multiplicador % 5 == 0:
+        multiplicador += 2
+    deslocamento = rnd.randrange(10**9)
+    for i in range(10**9):
+        base = f'{(i * multiplicador + deslocamento) % 10**9:09d}'
+        cpf = base + digitos_verificadores(base)
+        if len(set(cpf)) > 1:
+            yield cpf
+
+def gerar_rg(rnd: random.Random) -> RG:
+    emissor = 'SSP' if rnd.random() < 0.9 else 'SDS'
+    return RG.intern(str(rnd.randrange(1_000_000, 10_000_000)), emissor, 'PE')
+
+def gerar_car(rnd: random.Random) -> str:
+    """Número de CAR com 7 partes separadas por '.' e 50 caracteres, o formato verificado por `CAR._validar`."""
+    partes = (''.join(rnd.choices(_ALFABETO_CAR, k=tamanho)) for tamanho in _PARTES_CAR)
+    return 'PE-2605707-' + '.'.join(partes)
+
+def gerar_endereco(rnd: random.Random, tag: str = 'residencial') -> Endereco:
+    bairro = rnd.choice(BAIRROS)
+    if bairro.startswith('Sítio'):
+        return Endereco.intern(tag=tag, bairro=bairro, logradouro='Zona Rural')
+    numero = str(rnd.randrange(1, 1500)) if rnd.random() < 0.85 else 'S/N'
+    return Endereco.intern(tag=tag, bairro=bairro, logradouro=rnd.choice(LOGRADOUROS), numero=numero)
+
+def gerar_cars(pessoas: Iterable[DadosPessoais], semente: int = 0) -> Iterator[Tuple[DadosPessoais, str]]:
+    """Associa um número de CAR a cada pessoa; os CARs usam um gerador próprio, de modo que as pessoas
+    geradas com a mesma semente são as mesmas com ou sem CAR."""
+    rnd = random.Random(f'car-{semente}')
+    for pessoa in pessoas:
+        yield pessoa, gerar_car(rnd)
+
+def gerar_nome(rnd: random.Random, genero: str) -> str:
+    nome = rnd.choice(NOMES_M if genero == 'M' else NOMES_F)
+    return ' '.join((nome, *rnd.sample(SOBRENOMES, k=rnd.choice((1, 2, 2, 3)))))
+
+def gerar_pessoas(quantidade: int, semente: int = 0) -> Iterator[DadosPessoais]:
+    """Gera `quantidade` pessoas válidas e distintas (por CPF); a mesma semente produz a mesma sequência."""
+    rnd = random.Random(semente)
+    for cpf in islice(gerar_cpfs(random.Random(rnd.random())), quantidade):
+        genero = rnd.choice('MF')
+        enderecos = [gerar_endereco(rnd)]
+        if rnd.random() < 0.2:
+            enderecos.append(gerar_endereco(rnd, 'trabalho'))
+        yield DadosPessoais(
+            nome_completo=gerar_nome(rnd, genero),
+            cpf=CPF(cpf),
+            rg=gerar_rg(rnd),
+            genero=genero,
+            estado_civil=rnd.choice(ESTADOS_CIVIS),
+            profissao=rnd.choice(PROFISSOES_M if genero == 'M' else PROFISSOES_F),
+            endereco=enderecos,
+        )
+
+def em_lotes(pessoas: Iterable[DadosPessoais], tamanho: int) -> Iterator[List[DadosPessoais]]:
+    """Agrupa as pessoas em listas de até `tamanho` itens (ex.: para `IRepository.add_many`)."""
+    iterador = iter(pessoas)
+    while lote := list(islice(iterador, tamanho)):
+        yield lote
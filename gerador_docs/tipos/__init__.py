@@ -1,4 +1,4 @@
-from gerador_docs.tipos.documents import CPF, RG
-from gerador_docs.tipos.endereco import Endereco
+from gerador_docs.tipos.documents import CPF, RG, CPFErro, validar_cpf, validate_cpf_array
+from gerador_docs.tipos.endereco import Endereco, EnderecosPorTag
 from gerador_docs.tipos.dados_pessoais import DadosPessoais
 from gerador_docs.tipos._typing import EnderecoDict, DadosPessoaisDict
\ No newline at end of file
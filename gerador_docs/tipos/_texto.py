@@ -0,0 +1,10 @@
+"Funções auxiliares de normalização de texto usadas em buscas e comparações."
+import unicodedata
+
+def normalizar_texto(texto: str) -> str:
+    """Normaliza um texto para comparação: remove acentos, ignora maiúsculas e colapsa espaços.
+    Ex.: '  José  da Conceição ' -> 'jose da conceicao'
+    """
+    decomposto = unicodedata.normalize('NFKD', texto)
+    sem_acentos = ''.join(caractere for caractere in decomposto if not unicodedata.combining(caractere))
+    return ' '.join(sem_acentos.casefold().split())
@@ -1,13 +1,14 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Union, Literal
+from typing import List, Optional, Union, Literal, Tuple
 
 from gerador_docs.tipos.documents  import CPF, RG
-from gerador_docs.tipos.endereco import Endereco, Enderecos
+from gerador_docs.tipos.endereco import Endereco, Enderecos, ENDERECOS_VAZIOS, _enderecos_por_tag
 from gerador_docs.errors import GenderError, MaritalStatusError
 from gerador_docs.tipos._typing import DadosPessoaisDict
 
 
-@dataclass(frozen=True, init=False, kw_only=True)
+@dataclass(frozen=True, init=False, kw_only=True, slots=True)
 class DadosPessoais:
     nome_completo: str
     cpf: CPF 
@@ -15,7 +16,7 @@ class DadosPessoais:
     genero: Literal['M', 'F', 'O']  # Masculino, Feminino ou Outro
     estado_civil: Literal['solteiro', 'casado', 'divorciado', 'viuvo']
     profissao: str
-    endereco: Dict[Optional[Literal['residencial', 'trabalho']], List[Endereco]] = field(default_factory=dict)
+    endereco: Mapping[Optional[Literal['residencial', 'trabalho']], Tuple[Endereco, ...]] = field(default_factory=lambda: ENDERECOS_VAZIOS)
     nacionalidade: str = field(init=False)
 
     def __init__(self, nome_completo: str, cpf: CPF, rg: RG, genero: str, estado_civil: str, profissao: str, endereco: Enderecos):
@@ -30,9 +31,10 @@ class DadosPessoais:
         """
 
         # Processamento do endereco
-        enderecos_processados = {'residencial': [], 'trabalho': []}
+        residencial, trabalho = [], []
+        enderecos_processados = {'residencial': residencial, 'trabalho': trabalho}
         # Suporta tanto lista quanto dict para o argumento endereco
-        if isinstance(endereco, dict):
+        if isinstance(endereco, Mapping):
             for tag, lista in endereco.items():
                 if tag not in enderecos_processados:
                     continue
@@ -42,7 +44,7 @@ class DadosPessoais:
                     else:
                         end = item
                     enderecos_processados[tag].append(end)
-        elif isinstance(endereco, list):
+        elif isinstance(endereco, (list, tuple)):
             for item in endereco:
                 if isinstance(item, dict):
                     end = Endereco(**item)
@@ -52,6 +54,9 @@ class DadosPessoais:
                     enderecos_processados[end.tag].append(end)
         else:
             raise ValueError("O argumento 'endereco' deve ser uma lista ou um dicionário.")
+
+        # Mapeamento somente leitura de tuplas por tag; sem nenhum endereço, compartilha a sentinela ENDERECOS_VAZIOS
+        enderecos_processados = _enderecos_por_tag(tuple(residencial), tuple(trabalho))
         
         self._normalizar_e_validar_genero(genero)
 
@@ -75,6 +80,48 @@ class DadosPessoais:
         if self.estado_civil not in ('solteiro', 'casado', 'divorciado', 'viuvo'):
             raise MaritalStatusError(f"Valor inválido para estado civil: {self.estado_civil}. Deve ser 'solteiro', 'casado', 'divorciado' ou 'viuvo'.")
 
+    @classmethod
+    def from_dict(cls, dados: DadosPessoaisDict) -> 'DadosPessoais':
+        """Cria os dados pessoais a partir da saída de `to_dict()`, passando por todas as validações.
+        :param dados: Dados pessoais em formato de dicionário.
+        :return: Instância de DadosPessoais.
+        """
+        return cls(
+            nome_completo=dados['nome_completo'],
+            cpf=CPF.from_dict(dados['cpf']),
+            rg=RG.from_dict(dados['rg']),
+            genero=dados['genero'],
+            estado_civil=dados['estado_civil'],
+            profissao=dados['profissao'],
+            endereco=dados['endereco'],
+        )
+
+    @classmethod
+    def from_trusted_dict(cls, dados: DadosPessoaisDict) -> 'DadosPessoais':
+        """Reconstrói os dados pessoais a partir da saída de `to_dict()` sem revalidar nada.
+        Não normaliza endereços nem valida CPF, RG, gênero ou estado civil: use apenas
+        com registros que já passaram pelo construtor (ex.: lidos do banco de dados).
+        Os endereços são compartilhados através de `Endereco.intern`.
+        :param dados: Dados pessoais em formato de dicionário.
+        :return: Instância de DadosPessoais.
+        """
+        enderecos = dados['endereco']
+        residencial, trabalho = enderecos.get('residencial'), enderecos.get('trabalho')
+
+        pessoa = _nova_pessoa(cls)
+        _atribuir_nome(pessoa, dados['nome_completo'])
+        _atribuir_cpf(pessoa, CPF.from_trusted_dict(dados['cpf']))
+        _atribuir_rg(pessoa, RG.from_trusted_dict(dados['rg']))
+        _atribuir_genero(pessoa, dados['genero'])
+        _atribuir_estado_civil(pessoa, dados['estado_civil'])
+        _atribuir_profissao(pessoa, dados['profissao'])
+        _atribuir_endereco(pessoa, _enderecos_por_tag(
+            tuple([Endereco.intern(**item) for item in residencial]) if residencial else (),
+            tuple([Endereco.intern(**item) for item in trabalho]) if trabalho else (),
+        ))
+        _atribuir_nacionalidade(pessoa, dados['nacionalidade'])
+        return pessoa
+
     @property
     def numero_cpf(self) -> str:
         """Retorna o número do CPF."""
@@ -118,3 +165,15 @@ class DadosPessoais:
                 'trabalho': [endereco.to_dict() for endereco in self.endereco.get('trabalho', [])],
             },
         }
+
+
+# Atribuição direta pelos descritores dos slots, sem passar pelo __setattr__ da dataclass congelada
+# (usada por `from_trusted_dict`, o caminho quente da leitura do banco de dados)
+_nova_pessoa = object.__new__
+(
+    _atribuir_nome, _atribuir_cpf, _atribuir_rg, _atribuir_genero, _atribuir_estado_civil,
+    _atribuir_profissao, _atribuir_endereco, _atribuir_nacionalidade,
+) = (
+    DadosPessoais.__dict__[campo].__set__
+    for campo in ('nome_completo', 'cpf', 'rg', 'genero', 'estado_civil', 'profissao', 'endereco', 'nacionalidade')
+)
@@ -1,19 +1,136 @@
 
-from typing import Dict
-from gerador_docs.errors import CPFInvalidError, CPFFormatError, CPFLengthError, RGFormatError
+import sys
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from gerador_docs.errors import CPFInvalidError, RGFormatError
 from gerador_docs.errors import CARNumberFormatError, CARNumberLengthError, CARNumberInvalidError
 from gerador_docs.errors import CAFNumberFormatError, CAFNumberLengthError, CAFNumberInvalidError
 
 
+class CPFErro(IntEnum):
+    """Códigos de erro retornados pela validação em lote de CPFs."""
+    VALIDO = 0
+    FORMATO = 1
+    REPETIDO = 2
+    TAMANHO = 3
+    PRIMEIRO_VERIFICADOR = 4
+    SEGUNDO_VERIFICADOR = 5
+
+class ResultadoValidacaoCPF(NamedTuple):
+    """Resultado de `validate_cpf_array`: máscara booleana e código de erro por linha."""
+    validos: List[bool]
+    erros: List[CPFErro]
+
+# Tabelas da validação: para cada peso (0-11), o valor de cada byte ASCII '0'-'9' já
+# multiplicado pelo peso; o dígito verificador de cada soma ponderada também é tabelado.
+_POR_PESO = tuple(
+    tuple((byte - 48) * peso if 48 <= byte <= 57 else 0 for byte in range(256)) for peso in range(12)
+)
+_VERIFICADOR_POR_SOMA = tuple((soma * 10) % 11 % 10 for soma in range(9 * sum(range(2, 12)) + 1))
+
+_MENSAGENS_ERRO_CPF = {
+    CPFErro.FORMATO: "O CPF deve conter apenas dígitos.",
+    CPFErro.REPETIDO: "CPF inválido: {numero}. O CPF não pode conter todos os dígitos iguais.",
+    CPFErro.TAMANHO: "O CPF deve ter 11 dígitos.",
+    CPFErro.PRIMEIRO_VERIFICADOR: "O primeiro dígito verificador é inválido.",
+    CPFErro.SEGUNDO_VERIFICADOR: "O segundo dígito verificador é inválido.",
+}
+
+def validar_cpf(numero: str) -> CPFErro:
+    """
+    Valida um CPF (apenas dígitos) sem lançar exceções.
+    Os dígitos são lidos diretamente dos bytes ASCII e as somas ponderadas usam as tabelas
+    pré-calculadas, sem conversões com int() nem objetos intermediários por dígito.
+    :param numero: CPF a ser validado.
+    :return: CPFErro.VALIDO ou o código do primeiro erro encontrado (mesma ordem de `CPF._validate`).
+    """
+    if not (numero.isascii() and numero.isdigit()):
+        return CPFErro.FORMATO
+    if numero.count(numero[0]) == len(numero):
+        return CPFErro.REPETIDO
+    if len(numero) != 11:
+        return CPFErro.TAMANHO
+
+    _, _, p2, p3, p4, p5, p6, p7, p8, p9, p10, p11 = _POR_PESO
+    d0, d1, d2, d3, d4, d5, d6, d7, d8, d9, d10 = numero.encode('ascii')
+    soma = p10[d0] + p9[d1] + p8[d2] + p7[d3] + p6[d4] + p5[d5] + p4[d6] + p3[d7] + p2[d8]
+    if _VERIFICADOR_POR_SOMA[soma] != d9 - 48:
+        return CPFErro.PRIMEIRO_VERIFICADOR
+    soma = p11[d0] + p10[d1] + p9[d2] + p8[d3] + p7[d4] + p6[d5] + p5[d6] + p4[d7] + p3[d8] + p2[d9]
+    if _VERIFICADOR_POR_SOMA[soma] != d10 - 48:
+        return CPFErro.SEGUNDO_VERIFICADOR
+    return CPFErro.VALIDO
+
+def validate_cpf_array(numeros: Iterable[str]) -> ResultadoValidacaoCPF:
+    """
+    Valida um lote de CPFs sem lançar exceções (ver `validar_cpf`).
+    :param numeros: CPFs (apenas dígitos) a serem validados.
+    :return: ResultadoValidacaoCPF com a máscara de válidos e o código de erro de cada linha.
+    """
+    erros = list(map(validar_cpf, numeros))
+    return ResultadoValidacaoCPF([erro is CPFErro.VALIDO for erro in erros], erros)
+
+
+def formatar_cpf(numero: str) -> str:
+    """Normaliza um CPF (com ou sem pontuação) para o formato '000.000.000-00', sem validá-lo.
+    É a chave usada pelos repositórios para identificar uma pessoa.
+    """
+    numero = numero.replace('.', '').replace('-', '')
+    return f"{numero[:3]}.{numero[3:6]}.{numero[6:9]}-{numero[9:]}"
+
+
+MAX_EMISSORES_INTERNADOS = 256
+
+@lru_cache(maxsize=MAX_EMISSORES_INTERNADOS)
+def _emissor_compartilhado(emissor: str, uf: str) -> Tuple[str, str]:
+    """Pool (LRU) de pares emissor/UF: cada par distinto é armazenado uma única vez."""
+    return sys.intern(emissor), sys.intern(uf)
+
+def _separar_rg(numero: str) -> Tuple[str, str, str]:
+    """Separa a representação de RG.to_dict() ('1047991 SSP/PE') em número, emissor e UF."""
+    registro_geral, _, orgao = numero.partition(' ')
+    emissor, _, uf = orgao.rpartition('/')
+    return registro_geral, emissor, uf
+
+
 class RG:
     """
     Representa um RG (Registro Geral) brasileiro.
     """
+    __slots__ = ('_num_rg', '_emissor', '_uf')
+
     def __init__(self, registro_geral: str, emissor: str, uf: str) -> None:
         self._num_rg = self._validar_digitos(registro_geral)
         self._emissor = emissor
         self._uf = uf
 
+    @classmethod
+    def intern(cls, registro_geral: str, emissor: str, uf: str) -> 'RG':
+        """Cria o RG compartilhando as strings de emissor/UF através do pool de emissores.
+        Útil em importações em massa, onde quase todos os RGs são "SSP"/"PE".
+        """
+        return cls(registro_geral, *_emissor_compartilhado(emissor, uf))
+
+    @classmethod
+    def from_dict(cls, dados: Dict[str, str]) -> 'RG':
+        """Cria o RG a partir da saída de `to_dict()`, validando os dígitos.
+        :raises RGFormatError: Se o número do RG for inválido.
+        """
+        return cls(*_separar_rg(dados['numero']))
+
+    @classmethod
+    def from_trusted_dict(cls, dados: Dict[str, str]) -> 'RG':
+        """Reconstrói o RG a partir da saída de `to_dict()` sem revalidar os dígitos.
+        Use apenas com dados já validados (ex.: lidos do banco de dados).
+        """
+        registro_geral, emissor, uf = _separar_rg(dados['numero'])
+        rg = cls.__new__(cls)
+        rg._num_rg = registro_geral
+        rg._emissor, rg._uf = _emissor_compartilhado(emissor, uf)
+        return rg
+
     @property
     def num_rg(self) -> str:
         return self.__str__()
@@ -42,9 +159,36 @@ class CPF:
     """
     Representa um CPF (Cadastro de Pessoas Físicas) brasileiro.
     """
+    __slots__ = ('_numero',)
+
     def __init__(self, numero: str):
         self._numero = self._validate(numero)
 
+    @classmethod
+    def validate_many(cls, numeros: Iterable[str]) -> ResultadoValidacaoCPF:
+        """
+        Valida vários CPFs de uma vez, sem lançar exceções.
+        :param numeros: CPFs a serem validados.
+        :return: ResultadoValidacaoCPF (ver `validate_cpf_array`).
+        """
+        return validate_cpf_array(numeros)
+
+    @classmethod
+    def from_dict(cls, dados: Dict[str, str]) -> 'CPF':
+        """Cria o CPF a partir da saída de `to_dict()` (formatado ou não), validando-o.
+        :raises CPFInvalidError: Se o CPF for inválido.
+        """
+        return cls(dados['numero'].replace('.', '').replace('-', ''))
+
+    @classmethod
+    def from_trusted_dict(cls, dados: Dict[str, str]) -> 'CPF':
+        """Reconstrói o CPF a partir da saída de `to_dict()` sem revalidar os dígitos verificadores.
+        Use apenas com dados já validados (ex.: lidos do banco de dados).
+        """
+        cpf = cls.__new__(cls)
+        cpf._numero = dados['numero']
+        return cpf
+
     @property
     def numero(self) -> str:
         return self._numero
@@ -63,14 +207,9 @@ class CPF:
         :return: CPF validado.
         :raises CPFInvalidError: Se o CPF for inválido.
         """
-        try:
-            self._verificar_digitos(numero)
-            self._verificar_repetidos(numero)
-            self._verificar_tamanho(numero)
-            self._validar_primeiro_verificador(numero)
-            self._validar_segundo_verificador(numero)
-        except (CPFLengthError, CPFFormatError, CPFInvalidError) as e:
-            raise CPFInvalidError(f"CPF inválido: {numero}. Erro: {str(e)}")            
+        erro = validar_cpf(numero)
+        if erro is not CPFErro.VALIDO:
+            raise CPFInvalidError(f"CPF inválido: {numero}. Erro: {_MENSAGENS_ERRO_CPF[erro].format(numero=numero)}")
         return self._formatar(numero)
     
     def _formatar(self, numero: str) -> str:
@@ -80,64 +219,6 @@ class CPF:
         """
         return f"{numero[:3]}.{numero[3:6]}.{numero[6:9]}-{numero[9:]}"
     
-    def _validar_primeiro_verificador(self, cpf: str) -> bool:
-        """
-        Valida o dígito verificador do CPF.
-        :return: True se o dígito verificador for válido, False caso contrário.
-        :raises CPFInvalidError: Se o dígito verificador for inválido.
-        """
-        # Verifica o primeiro dígito verificador
-        soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
-        resto = (soma * 10) % 11
-        primeiro_digito = 0 if resto == 10 else resto
-        if primeiro_digito != int(cpf[9]):
-            raise CPFInvalidError(f"O primeiro dígito verificador é inválido.")
-        return True
-    
-    def _validar_segundo_verificador(self, cpf: str) -> bool:
-        """
-        Valida o segundo dígito verificador do CPF.
-        :return: True se o segundo dígito verificador for válido, False caso contrário.
-        :raises CPFInvalidError: Se o dígito verificador for inválido.
-        """
-        # Verifica o segundo dígito verificador
-        soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
-        resto = (soma * 10) % 11
-        segundo_digito = 0 if resto == 10 else resto
-        if segundo_digito != int(cpf[10]):
-            raise CPFInvalidError(f"O segundo dígito verificador é inválido.")
-        return True
-    
-    def _verificar_tamanho(self, cpf: str) -> bool:
-        """
-        Verifica o tamanho do CPF.
-        :return: True se o tamanho do CPF for válido, False caso contrário.
-        :raises CPFLengthError: Se o tamanho do CPF for inválido.
-        """
-        if len(cpf) != 11:
-            raise CPFLengthError(f"O CPF deve ter 11 dígitos.")
-        return True
-    
-    def _verificar_digitos(self, cpf: str) -> bool:
-        """
-        Verifica se o CPF contém apenas dígitos.
-        :return: True se o CPF contiver apenas dígitos, False caso contrário.
-        :raises CPFFormatError: Se o CPF contiver caracteres não numéricos.
-        """
-        if not cpf.isdigit():
-            raise CPFFormatError(f"O CPF deve conter apenas dígitos.")
-        return True
-    
-    def _verificar_repetidos(self, numero: str) -> bool:
-        """
-        Verifica se o CPF contém todos os dígitos iguais.
-        :return: True se o CPF contiver todos os dígitos iguais, False caso contrário.
-        :raises CPFInvalidError: Se o CPF contiver todos os dígitos iguais.
-        """
-        if len(set(numero)) == 1:
-            raise CPFInvalidError(f"CPF inválido: {numero}. O CPF não pode conter todos os dígitos iguais.")
-        return True
-    
     def to_dict(self) -> Dict[str, str]:
         """Exporta o CPF como um dicionário.
         :return: CPF em formato de dicionário.
@@ -147,6 +228,7 @@ class CPF:
         }
     
 class CAR:
+    __slots__ = ('_numero',)
 
     def __init__(self, numero: str) -> None:
         self._numero = self._validar(numero)
@@ -177,9 +259,11 @@ class CAR:
             raise CARNumberFormatError(f"Númeoro do CAR contém apenas digitos.")
         if tam_numero != 50:
             raise CARNumberLengthError(f"Deve ter 50 dígitos.")
-        if tam_numero in (13, 50):
+        # código após 'UF-IBGE-', sem os pontos; ex.: 'PE-2605707-00000.00000...' é inválido
+        if len(set(numero.rpartition('-')[2].replace('.', ''))) == 1:
             raise CARNumberInvalidError(f"Número do CAR contém muitos digitos repetidos.")
         
         return numero
 
-class CAF: pass
\ No newline at end of file
+class CAF:
+    __slots__ = ()
\ No newline at end of file
@@ -1,11 +1,14 @@
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Dict, List, Literal, Optional, Union
+from functools import lru_cache
+from typing import Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 from gerador_docs.tipos._typing import EnderecoDict
 
 Enderecos = Union[List['Endereco'], Dict[Optional[Literal['residencial', 'trabalho']], List['Endereco']]]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Endereco:
     """
     Representa um endereço.
@@ -19,6 +22,25 @@ class Endereco:
     estado: str = 'PE'
     cep: str = '55715-000'
 
+    @classmethod
+    def intern(
+        cls,
+        tag: Literal['residencial', 'trabalho'],
+        bairro: str,
+        logradouro: str,
+        numero: str = 'S/N',
+        complemento: Optional[str] = None,
+        cidade: str = 'Feira Nova',
+        estado: str = 'PE',
+        cep: str = '55715-000',
+    ) -> 'Endereco':
+        """Retorna uma instância compartilhada (flyweight) do endereço.
+        Endereços idênticos passam a ser o mesmo objeto, o que economiza memória e torna
+        as comparações por igualdade/hash triviais ao agrupar pessoas por endereço.
+        O cache é limitado (LRU) a `MAX_ENDERECOS_INTERNADOS` endereços distintos.
+        """
+        return _internar_endereco(tag, bairro, logradouro, numero, complemento, cidade, estado, cep)
+
     def __str__(self) -> str:
         return f'{self.logradouro}, {self.numero}, {self.bairro}, {self.cidade}/{self.estado} CEP: {self.cep}'
     
@@ -50,4 +72,63 @@ class Endereco:
             'cidade': self.cidade,
             'estado': self.estado,
             'cep': self.cep
-        }
\ No newline at end of file
+        }
+
+class EnderecosPorTag(Mapping):
+    """
+    Endereços de uma pessoa por tag ('residencial' e 'trabalho'), somente leitura.
+    Ao contrário de um `MappingProxyType`, pode ser serializado com pickle e copiado com deepcopy.
+    """
+    __slots__ = ('_residencial', '_trabalho')
+
+    def __init__(self, residencial: Tuple[Endereco, ...] = (), trabalho: Tuple[Endereco, ...] = ()) -> None:
+        object.__setattr__(self, '_residencial', residencial)
+        object.__setattr__(self, '_trabalho', trabalho)
+
+    def __getitem__(self, tag: str) -> Tuple[Endereco, ...]:
+        if tag == 'residencial':
+            return self._residencial
+        if tag == 'trabalho':
+            return self._trabalho
+        raise KeyError(tag)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(('residencial', 'trabalho'))
+
+    def __len__(self) -> int:
+        return 2
+
+    def __setattr__(self, nome: str, valor) -> None:
+        raise AttributeError(f"'{type(self).__name__}' é somente leitura")
+
+    def __reduce__(self):
+        return _enderecos_por_tag, (self._residencial, self._trabalho)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(residencial={self._residencial!r}, trabalho={self._trabalho!r})'
+
+def _enderecos_por_tag(residencial: Tuple[Endereco, ...], trabalho: Tuple[Endereco, ...]) -> EnderecosPorTag:
+    """Endereços por tag; sem nenhum endereço, devolve a sentinela compartilhada (também ao desserializar)."""
+    if residencial or trabalho:
+        return EnderecosPorTag(residencial, trabalho)
+    return ENDERECOS_VAZIOS
+
+# Sentinela imutável compartilhada por todas as pessoas sem endereço cadastrado.
+ENDERECOS_VAZIOS = EnderecosPorTag()
+
+MAX_ENDERECOS_INTERNADOS = 4096
+
+@lru_cache(maxsize=MAX_ENDERECOS_INTERNADOS)
+def _internar_endereco(
+    tag: str, bairro: str, logradouro: str, numero: str, complemento: Optional[str], cidade: str, estado: str, cep: str
+) -> Endereco:
+    return Endereco(
+        sys.intern(tag),
+        sys.intern(bairro),
+        sys.intern(logradouro),
+        sys.intern(numero),
+        complemento if complemento is None else sys.intern(complemento),
+        sys.intern(cidade),
+        sys.intern(estado),
+        sys.intern(cep),
+    )
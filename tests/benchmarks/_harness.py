@@ -0,0 +1,73 @@
+"""
+Harness mínimo de benchmarks baseado em `timeit`.
+
+Cada medição é o melhor tempo entre `REPETICOES` execuções, normalizado em nanossegundos
+por registro, e é identificada por '<nome>[<tamanho>]'. As medições podem ser gravadas como
+baseline (JSON) e comparadas com uma baseline anterior:
+
+    DOCGEN_BENCH_SALVAR=baseline.json   grava as medições ao final da sessão
+    DOCGEN_BENCH_COMPARAR=baseline.json falha as medições mais lentas que a baseline além do limite
+    DOCGEN_BENCH_LIMITE=0.10            limite de regressão aceito (padrão: 10%)
+"""
+import json
+import os
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence
+
+TAMANHOS = tuple(int(tamanho) for tamanho in os.environ.get('DOCGEN_BENCH_TAMANHOS', '1000,100000').split(','))
+REPETICOES = int(os.environ.get('DOCGEN_BENCH_REPETICOES', 3))
+LIMITE = float(os.environ.get('DOCGEN_BENCH_LIMITE', 0.10))
+
+
+class RegressaoDesempenho(AssertionError):
+    """Medição mais lenta que a baseline além do limite aceito."""
+
+
+class Benchmarks:
+    """Coleta as medições de uma sessão e as compara com a baseline, se houver."""
+
+    def __init__(self, baseline: Optional[Dict[str, float]] = None, limite: float = LIMITE) -> None:
+        self.baseline = baseline or {}
+        self.limite = limite
+        self.medicoes: Dict[str, float] = {}
+
+    def medir(self, nome: str, funcao: Callable[[object], object], dados: Sequence) -> float:
+        """Aplica `funcao` a cada item de `dados` e registra o tempo por item (ns).
+        :raises RegressaoDesempenho: Se a medição regredir além do limite em relação à baseline.
+        """
+        def executar() -> None:
+            for item in dados:
+                funcao(item)
+
+        segundos = min(timeit.repeat(executar, number=1, repeat=REPETICOES))
+        chave = f'{nome}[{len(dados)}]'
+        ns_por_item = self.medicoes[chave] = segundos * 1e9 / max(len(dados), 1)
+
+        anterior = self.baseline.get(chave)
+        relatorio = f'{chave}: {ns_por_item:,.0f} ns/item'
+        if anterior:
+            relatorio += f' (baseline {anterior:,.0f} ns/item, {ns_por_item / anterior - 1:+.1%})'
+        print(f'\n{relatorio}')
+        if anterior and ns_por_item > anterior * (1 + self.limite):
+            raise RegressaoDesempenho(f'{relatorio}: regressão acima de {self.limite:.0%}.')
+        return ns_por_item
+
+    def gravar(self, caminho: Path) -> None:
+        """Grava as medições como baseline, mescladas às de uma baseline existente no mesmo arquivo."""
+        medicoes = {}
+        if caminho.exists():
+            medicoes = carregar_baseline(caminho)
+        medicoes.update(self.medicoes)
+        conteudo = {
+            'python': sys.version.split()[0],
+            'plataforma': platform.platform(),
+            'medicoes': dict(sorted(medicoes.items())),
+        }
+        caminho.write_text(json.dumps(conteudo, indent=2, ensure_ascii=False), encoding='utf-8')
+
+def carregar_baseline(caminho: Path) -> Dict[str, float]:
+    with open(caminho, encoding='utf-8') as arquivo:
+        return json.load(arquivo)['medicoes']
@@ -0,0 +1,4 @@
+"Parâmetros dos dados sintéticos usados pelos benchmarks (gerados por `gerador_docs.sintetico`)."
+import os
+
+TAMANHO = int(os.environ.get('DOCGEN_BENCH_TAMANHO', 100_000))
@@ -0,0 +1,32 @@
+"""
+Benchmarks dos tipos de gerador_docs.
+
+São lentos por natureza, então só rodam quando a variável de ambiente DOCGEN_BENCH
+estiver definida:
+
+    DOCGEN_BENCH=1 python -m pytest tests/benchmarks -s
+
+O número de registros sintéticos pode ser ajustado com DOCGEN_BENCH_TAMANHO (padrão: 100000)
+e os tamanhos da suíte de tipos com DOCGEN_BENCH_TAMANHOS (padrão: 1000,100000; ex.:
+1000,100000,1000000). Baseline e comparação: ver `_harness.py`.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from ._harness import Benchmarks, carregar_baseline
+
+@pytest.fixture(autouse=True)
+def _somente_com_docgen_bench():
+    if not os.environ.get('DOCGEN_BENCH'):
+        pytest.skip('benchmarks desativados (defina DOCGEN_BENCH=1 para executá-los)')
+
+@pytest.fixture(scope='session')
+def benchmarks():
+    """Medições da sessão; grava a baseline em DOCGEN_BENCH_SALVAR e compara com DOCGEN_BENCH_COMPARAR."""
+    comparar = os.environ.get('DOCGEN_BENCH_COMPARAR')
+    sessao = Benchmarks(carregar_baseline(Path(comparar)) if comparar else None)
+    yield sessao
+    if os.environ.get('DOCGEN_BENCH_SALVAR') and sessao.medicoes:
+        sessao.gravar(Path(os.environ['DOCGEN_BENCH_SALVAR']))
@@ -0,0 +1,31 @@
+import timeit
+
+from gerador_docs import CPF, DadosPessoais, RG
+
+from gerador_docs.sintetico import gerar_pessoas
+
+from ._sinteticos import TAMANHO
+
+
+def _construtor_normal(linha) -> DadosPessoais:
+    registro_geral, _, orgao = linha['rg']['numero'].partition(' ')
+    emissor, _, uf = orgao.rpartition('/')
+    return DadosPessoais(
+        nome_completo=linha['nome_completo'],
+        cpf=CPF(linha['cpf']['numero'].replace('.', '').replace('-', '')),
+        rg=RG(registro_geral, emissor, uf),
+        genero=linha['genero'],
+        estado_civil=linha['estado_civil'],
+        profissao=linha['profissao'],
+        endereco=linha['endereco'],
+    )
+
+def test_from_trusted_dict_vs_construtor():
+    """Compara a reconstrução de linhas já validadas pelo construtor normal e por from_trusted_dict."""
+    linhas = [pessoa.to_dict() for pessoa in gerar_pessoas(TAMANHO)]
+
+    normal = min(timeit.repeat(lambda: [_construtor_normal(linha) for linha in linhas], number=1, repeat=3))
+    confiavel = min(timeit.repeat(lambda: [DadosPessoais.from_trusted_dict(linha) for linha in linhas], number=1, repeat=3))
+
+    print(f'\n{TAMANHO} linhas: construtor={normal:.3f}s, from_trusted_dict={confiavel:.3f}s ({normal / confiavel:.1f}x)')
+    assert confiavel < normal
@@ -0,0 +1,35 @@
+import random
+import time
+from dataclasses import replace
+from itertools import islice
+
+from gerador_docs.deduplicacao import sugerir_mesclagens
+from gerador_docs.sintetico import gerar_cpfs, gerar_pessoas
+from gerador_docs.tipos import CPF
+
+from ._sinteticos import TAMANHO
+
+DUPLICADAS = 1000
+
+
+def test_deduplicacao_200k():
+    """200 mil cadastros (2x DOCGEN_BENCH_TAMANHO) com 1000 duplicatas plantadas devem levar menos de 1 minuto."""
+    pessoas = list(gerar_pessoas(2 * TAMANHO, semente=11))
+    rnd = random.Random(11)
+    cpfs_novos = islice(gerar_cpfs(random.Random(-1)), DUPLICADAS)
+    plantadas = {}
+    for cpf in cpfs_novos:
+        indice = rnd.randrange(len(pessoas))
+        original = pessoas[indice]
+        plantadas[len(pessoas)] = indice
+        pessoas.append(replace(original, nome_completo=original.nome_completo.upper(), cpf=CPF(cpf)))
+
+    inicio = time.perf_counter()
+    resultado = sugerir_mesclagens(pessoas)
+    segundos = time.perf_counter() - inicio
+    print(f'\ndeduplicação[{len(pessoas)}]: {segundos:.1f}s, {resultado.pares_comparados:,} pares comparados, '
+          f'{len(resultado.sugestoes)} sugestões')
+
+    encontradas = {sugestao.indices for sugestao in resultado.sugestoes}
+    assert all((original, copia) in encontradas for copia, original in plantadas.items())
+    assert segundos < 60
@@ -0,0 +1,47 @@
+import gc
+import tracemalloc
+
+from gerador_docs import DadosPessoais
+
+from gerador_docs.sintetico import gerar_pessoas
+
+from ._sinteticos import TAMANHO
+
+
+class _Legado:
+    """Réplica do layout anterior (instâncias com __dict__ e endereços em listas), usada como referência."""
+
+    def __init__(self, **atributos) -> None:
+        self.__dict__.update(atributos)
+
+def _como_legado(pessoa: DadosPessoais) -> _Legado:
+    return _Legado(
+        nome_completo=pessoa.nome_completo,
+        cpf=_Legado(_numero=pessoa.cpf.numero),
+        rg=_Legado(_num_rg=pessoa.rg._num_rg, _emissor=pessoa.rg._emissor, _uf=pessoa.rg._uf),
+        genero=pessoa.genero,
+        estado_civil=pessoa.estado_civil,
+        profissao=pessoa.profissao,
+        endereco={
+            'residencial': [_Legado(**end.to_dict()) for end in pessoa.endereco['residencial']],
+            'trabalho': [_Legado(**end.to_dict()) for end in pessoa.endereco['trabalho']],
+        },
+        nacionalidade=pessoa.nacionalidade,
+    )
+
+def _bytes_por_pessoa(fabrica) -> float:
+    gc.collect()
+    tracemalloc.start()
+    registros = fabrica()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(registros) == TAMANHO
+    return atual / TAMANHO
+
+def test_memoria_por_pessoa():
+    """Compara os bytes por pessoa do layout com __slots__ contra o layout antigo com __dict__."""
+    depois = _bytes_por_pessoa(lambda: list(gerar_pessoas(TAMANHO)))
+    antes = _bytes_por_pessoa(lambda: [_como_legado(p) for p in gerar_pessoas(TAMANHO)])
+
+    print(f'\n{TAMANHO} pessoas: antes={antes:.0f} B/pessoa, depois={depois:.0f} B/pessoa ({depois / antes:.0%})')
+    assert depois < antes
@@ -0,0 +1,81 @@
+"""Suíte de benchmarks dos objetos de valor e validadores de gerador_docs.tipos."""
+import random
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Tuple
+
+import pytest
+
+from gerador_docs import CPF, DadosPessoais, Endereco, RG
+from gerador_docs.tipos.documents import CAR
+
+from gerador_docs.sintetico import BAIRROS, gerar_car, gerar_cpfs, gerar_pessoas
+
+from ._harness import TAMANHOS
+
+pytestmark = pytest.mark.parametrize('tamanho', TAMANHOS)
+
+
+@lru_cache(maxsize=None)
+def _cpfs(tamanho: int) -> List[str]:
+    return list(islice(gerar_cpfs(random.Random(tamanho)), tamanho))
+
+@lru_cache(maxsize=None)
+def _rgs(tamanho: int) -> List[str]:
+    rnd = random.Random(tamanho)
+    return [f'{rnd.randrange(1_000, 9_999)}.{rnd.randrange(100, 999)}-{rnd.randrange(10)}' for _ in range(tamanho)]
+
+@lru_cache(maxsize=None)
+def _cars(tamanho: int) -> List[str]:
+    rnd = random.Random(tamanho)
+    return [gerar_car(rnd) for _ in range(tamanho)]
+
+@lru_cache(maxsize=None)
+def _enderecos(tamanho: int) -> List[Dict[str, str]]:
+    rnd = random.Random(tamanho)
+    return [
+        {'tag': 'residencial', 'bairro': rnd.choice(BAIRROS), 'logradouro': f'Rua {i % 50}', 'numero': str(i % 300)}
+        for i in range(tamanho)
+    ]
+
+@lru_cache(maxsize=None)
+def _pessoas(tamanho: int) -> Tuple[DadosPessoais, ...]:
+    return tuple(gerar_pessoas(tamanho, semente=tamanho))
+
+def _argumentos(pessoa: DadosPessoais, enderecos) -> dict:
+    return {
+        'nome_completo': pessoa.nome_completo, 'cpf': pessoa.cpf, 'rg': pessoa.rg, 'genero': pessoa.genero,
+        'estado_civil': pessoa.estado_civil, 'profissao': pessoa.profissao, 'endereco': enderecos,
+    }
+
+
+def test_cpf(benchmarks, tamanho):
+    benchmarks.medir('CPF', CPF, _cpfs(tamanho))
+
+def test_rg_validar_digitos(benchmarks, tamanho):
+    benchmarks.medir('RG._validar_digitos', RG.__new__(RG)._validar_digitos, _rgs(tamanho))
+
+def test_car_validar(benchmarks, tamanho):
+    benchmarks.medir('CAR._validar', CAR.__new__(CAR)._validar, _cars(tamanho))
+
+def test_endereco(benchmarks, tamanho):
+    benchmarks.medir('Endereco', lambda campos: Endereco(**campos), _enderecos(tamanho))
+
+@pytest.mark.parametrize('formato', ['default', 'short'])
+def test_endereco_format(benchmarks, tamanho, formato):
+    enderecos = [Endereco(**campos) for campos in _enderecos(tamanho)]
+    benchmarks.medir(f'Endereco.__format__({formato})', lambda endereco: format(endereco, formato), enderecos)
+
+def test_dados_pessoais_lista(benchmarks, tamanho):
+    argumentos = [_argumentos(pessoa, list(pessoa.endereco['residencial'])) for pessoa in _pessoas(tamanho)]
+    benchmarks.medir('DadosPessoais(lista)', lambda kwargs: DadosPessoais(**kwargs), argumentos)
+
+def test_dados_pessoais_dict(benchmarks, tamanho):
+    argumentos = [
+        _argumentos(pessoa, {'residencial': list(pessoa.endereco['residencial']), 'trabalho': []})
+        for pessoa in _pessoas(tamanho)
+    ]
+    benchmarks.medir('DadosPessoais(dict)', lambda kwargs: DadosPessoais(**kwargs), argumentos)
+
+def test_to_dict(benchmarks, tamanho):
+    benchmarks.medir('DadosPessoais.to_dict', DadosPessoais.to_dict, _pessoas(tamanho))
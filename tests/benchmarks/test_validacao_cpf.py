@@ -0,0 +1,36 @@
+import random
+import timeit
+from itertools import islice
+
+from gerador_docs.sintetico import gerar_cpfs
+from gerador_docs.tipos import CPF, CPFErro, validar_cpf
+
+from ._sinteticos import TAMANHO
+
+
+def _validar_legado(cpf: str) -> bool:
+    """Réplica da validação anterior (somas ponderadas com int() por caractere), usada como referência."""
+    if not cpf.isdigit() or len(set(cpf)) == 1 or len(cpf) != 11:
+        return False
+    soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
+    resto = (soma * 10) % 11
+    if (0 if resto == 10 else resto) != int(cpf[9]):
+        return False
+    soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
+    resto = (soma * 10) % 11
+    return (0 if resto == 10 else resto) == int(cpf[10])
+
+def test_validar_cpf_vs_legado():
+    """A validação com tabelas pré-calculadas deve ser ao menos 5x mais rápida que a anterior."""
+    numeros = list(islice(gerar_cpfs(random.Random(0)), TAMANHO))
+    assert [validar_cpf(n) is CPFErro.VALIDO for n in numeros] == [_validar_legado(n) for n in numeros]
+
+    legado = min(timeit.repeat(lambda: [_validar_legado(n) for n in numeros], number=1, repeat=3))
+    tabelas = min(timeit.repeat(lambda: [validar_cpf(n) for n in numeros], number=1, repeat=3))
+    construtor = min(timeit.repeat(lambda: [CPF(n) for n in numeros], number=1, repeat=3))
+
+    print(
+        f'\n{TAMANHO} CPFs: legado={legado:.3f}s, validar_cpf={tabelas:.3f}s ({legado / tabelas:.1f}x), '
+        f'CPF(...)={construtor:.3f}s'
+    )
+    assert legado / tabelas >= 5
@@ -1,6 +1,7 @@
 import pytest
 
 from gerador_docs import CPF
+from gerador_docs.tipos import CPFErro, validar_cpf
 from gerador_docs.errors import CPFInvalidError
 
 @pytest.mark.parametrize(
@@ -53,4 +54,51 @@ def test_cpf_invalid_format(cpf_format_invalid):
 def test_cpf_valid(cpf_valid):
     '''Testa se o cpf é valido.'''
     cpf = CPF(cpf_valid)
-    assert cpf.numero == f"{cpf_valid[:3]}.{cpf_valid[3:6]}.{cpf_valid[6:9]}-{cpf_valid[9:]}"
\ No newline at end of file
+    assert cpf.numero == f"{cpf_valid[:3]}.{cpf_valid[3:6]}.{cpf_valid[6:9]}-{cpf_valid[9:]}"
+
+def test_cpf_validate_many():
+    '''Testa a validação em lote, que retorna máscara e códigos de erro sem lançar exceções.'''
+    numeros = [
+        "12345678909",
+        "11111111111",
+        "1254321",
+        "1235as456sd",
+        "12345678919",
+        "12345678900",
+        "52998224725",
+    ]
+    resultado = CPF.validate_many(numeros)
+
+    assert resultado.validos == [True, False, False, False, False, False, True]
+    assert resultado.erros == [
+        CPFErro.VALIDO,
+        CPFErro.REPETIDO,
+        CPFErro.TAMANHO,
+        CPFErro.FORMATO,
+        CPFErro.PRIMEIRO_VERIFICADOR,
+        CPFErro.SEGUNDO_VERIFICADOR,
+        CPFErro.VALIDO,
+    ]
+
+def test_cpf_validate_many_agrees_with_constructor():
+    '''Testa se a validação em lote concorda com a validação individual.'''
+    numeros = [f"{n:011d}" for n in range(12345678900, 12345679000)]
+    resultado = CPF.validate_many(numeros)
+
+    for numero, valido in zip(numeros, resultado.validos):
+        try:
+            CPF(numero)
+        except CPFInvalidError:
+            assert not valido, numero
+        else:
+            assert valido, numero
+
+def test_validar_cpf():
+    '''Testa o validador individual, que retorna o código de erro sem lançar exceções.'''
+    assert validar_cpf("52998224725") is CPFErro.VALIDO
+    assert validar_cpf("") is CPFErro.FORMATO
+    assert validar_cpf("５２９９８２２４７２５") is CPFErro.FORMATO
+    assert validar_cpf("00000000000") is CPFErro.REPETIDO
+    assert validar_cpf("529982247") is CPFErro.TAMANHO
+    assert validar_cpf("52998224735") is CPFErro.PRIMEIRO_VERIFICADOR
+    assert validar_cpf("52998224726") is CPFErro.SEGUNDO_VERIFICADOR
@@ -1,8 +1,12 @@
+import copy
+import pickle
+
 import pytest
 
 from dataclasses import replace
 
 from gerador_docs import DadosPessoais
+from gerador_docs.tipos.endereco import ENDERECOS_VAZIOS, EnderecosPorTag
 from gerador_docs.errors import MaritalStatusError, GenderError
 
 def test_dados_pessoais(dados_pessoais: DadosPessoais):
@@ -48,4 +52,47 @@ def test_exception_GenderError(dados_pessoais: DadosPessoais):
     """Testa a exceção de gênero inválido."""
 
     with pytest.raises(GenderError, match="Valor inválido para gênero"):
-        replace(dados_pessoais, genero='X')
\ No newline at end of file
+        replace(dados_pessoais, genero='X')
+
+def test_dados_pessoais_sem_endereco_compartilha_sentinela(dados_pessoais: DadosPessoais):
+    """Testa se pessoas sem endereço compartilham a mesma sentinela imutável."""
+    sem_endereco = replace(dados_pessoais, endereco=[])
+    outro = replace(dados_pessoais, nome_completo='Maria da Silva', endereco={})
+
+    assert sem_endereco.endereco is ENDERECOS_VAZIOS
+    assert outro.endereco is ENDERECOS_VAZIOS
+    assert sem_endereco.to_dict()['endereco'] == {'residencial': [], 'trabalho': []}
+
+def test_dados_pessoais_endereco_somente_leitura(dados_pessoais: DadosPessoais):
+    """Testa se os endereços são imutáveis, com ou sem endereço cadastrado."""
+    for pessoa in (dados_pessoais, replace(dados_pessoais, endereco=[])):
+        assert isinstance(pessoa.endereco, EnderecosPorTag)
+        with pytest.raises(TypeError):
+            pessoa.endereco['residencial'] = ()
+    assert isinstance(DadosPessoais.from_trusted_dict(dados_pessoais.to_dict()).endereco, EnderecosPorTag)
+
+def test_dados_pessoais_pickle_e_deepcopy(dados_pessoais: DadosPessoais):
+    """Testa se os dados pessoais podem ir para outro processo (pickle) e ser copiados (deepcopy)."""
+    sem_endereco = replace(dados_pessoais, endereco=[])
+    for pessoa in (dados_pessoais, sem_endereco):
+        for copia in (pickle.loads(pickle.dumps(pessoa)), copy.deepcopy(pessoa)):
+            assert copia.to_dict() == pessoa.to_dict()
+            assert copia.endereco['residencial'] == pessoa.endereco['residencial']
+    assert pickle.loads(pickle.dumps(sem_endereco)).endereco is ENDERECOS_VAZIOS
+
+def test_dados_pessoais_usa_slots(dados_pessoais: DadosPessoais):
+    """Testa se os tipos de valor não alocam um __dict__ por instância."""
+    for valor in (dados_pessoais, dados_pessoais.cpf, dados_pessoais.rg, dados_pessoais.endereco['residencial'][0]):
+        assert not hasattr(valor, '__dict__')
+
+def test_dados_pessoais_from_trusted_dict(dados_pessoais: DadosPessoais):
+    """Testa se from_trusted_dict reconstrói exatamente os dados exportados por to_dict."""
+    reconstruido = DadosPessoais.from_trusted_dict(dados_pessoais.to_dict())
+
+    assert reconstruido.to_dict() == dados_pessoais.to_dict()
+    assert reconstruido.numero_cpf == '123.456.789-09'
+    assert reconstruido.numero_rg == '1047991 SSP/PE'
+    assert reconstruido.endereco == dados_pessoais.endereco
+    # os endereços são internados: registros com o mesmo endereço compartilham a instância
+    outro = DadosPessoais.from_trusted_dict(dados_pessoais.to_dict())
+    assert outro.endereco['residencial'][0] is reconstruido.endereco['residencial'][0]
@@ -0,0 +1,68 @@
+from dataclasses import replace
+from unittest.mock import patch
+
+from gerador_docs import CPF, RG, Endereco
+from gerador_docs.deduplicacao import BlocoIgnorado, chave_fonetica, pontuar, sugerir_mesclagens
+from gerador_docs.sintetico import gerar_pessoas
+
+def test_chave_fonetica():
+    assert chave_fonetica('José da Conceição') == chave_fonetica('JOSE DA CONCEICAO') == chave_fonetica('Jose da Conseiçao')
+    assert chave_fonetica('Luiz Felipe de Souza') == chave_fonetica('Luis Phelipe Sousa')
+    assert chave_fonetica('Maria da Silva') != chave_fonetica('Mario da Silva Santos')
+
+def test_sugerir_mesclagens():
+    pessoas = list(gerar_pessoas(300, semente=3))
+    original = pessoas[10]
+    # mesma pessoa cadastrada com outro CPF, com o nome digitado sem acentos e em maiúsculas
+    copia = replace(original, nome_completo=original.nome_completo.upper().replace('É', 'E').replace('Ô', 'O'), cpf=CPF('52998224725'))
+    # mesmo CPF com o nome abreviado
+    mesmo_cpf = replace(pessoas[20], nome_completo='Fulano de Tal', rg=RG.intern('1234567', 'SSP', 'PE'))
+    pessoas += [copia, mesmo_cpf]
+
+    resultado = sugerir_mesclagens(pessoas)
+    pares = {sugestao.indices: sugestao for sugestao in resultado.sugestoes}
+
+    assert resultado.pessoas == 302
+    assert pares[(20, 301)].pontuacao == 1.0
+    assert pares[(20, 301)].motivos == ('mesmo CPF',)
+    assert pares[(10, 300)].motivos == ('mesmo nome', 'mesmo RG', 'mesmo bairro')
+    assert resultado.pares_comparados < 300 * 299 // 2
+
+def test_sugerir_mesclagens_limiar_e_blocos_grandes():
+    pessoas = list(gerar_pessoas(50, semente=5))
+    pessoas.append(replace(pessoas[0], cpf=CPF('52998224725'), rg=RG.intern('1234567', 'SSP', 'PE')))
+
+    # sem o RG em comum, nome e bairro somam 0.70
+    assert (0, 50) in {sugestao.indices for sugestao in sugerir_mesclagens(pessoas, limiar=0.7).sugestoes}
+    assert (0, 50) not in {sugestao.indices for sugestao in sugerir_mesclagens(pessoas, limiar=0.8).sugestoes}
+    assert sugerir_mesclagens(pessoas, limiar=0.7, max_tamanho_bloco=1).sugestoes == []
+
+def test_sugerir_mesclagens_divide_blocos_grandes():
+    # 30 homônimos em bairros diferentes, 4 a mais no 'Bairro 0' e uma duplicata no 'Bairro 7'
+    bairros = [f'Bairro {indice}' for indice in range(30)] + ['Bairro 0'] * 4
+    pessoas = [
+        replace(pessoa, nome_completo='Maria da Silva', endereco=[Endereco.intern('residencial', bairro, 'Rua A')])
+        for pessoa, bairro in zip(gerar_pessoas(34, semente=9), bairros)
+    ]
+    pessoas.append(replace(pessoas[7], cpf=CPF('52998224725')))
+
+    resultado = sugerir_mesclagens(pessoas, max_tamanho_bloco=3)
+
+    # o bloco do nome (35 registros) é dividido por bairro e a duplicata ainda é encontrada
+    assert (7, 34) in {sugestao.indices for sugestao in resultado.sugestoes}
+    # a parte do 'Bairro 0' (5 registros) continua grande demais e é informada
+    assert {bloco.chave[0] for bloco in resultado.blocos_ignorados} == {'nome', 'bairro'}
+    assert all(isinstance(bloco, BlocoIgnorado) and bloco.tamanho == 5 for bloco in resultado.blocos_ignorados)
+
+def test_sugerir_mesclagens_pontua_cada_par_uma_vez():
+    pessoas = list(gerar_pessoas(40, semente=2))
+    pessoas.append(replace(pessoas[3], cpf=CPF('52998224725')))
+
+    resultado = sugerir_mesclagens(pessoas)
+
+    # o par (3, 40) está nos blocos do nome e do bairro, mas é comparado uma única vez
+    assert [sugestao.indices for sugestao in resultado.sugestoes].count((3, 40)) == 1
+    with patch('gerador_docs.deduplicacao.pontuar', wraps=pontuar) as contado:
+        sugerir_mesclagens(pessoas)
+    pares = [(a.cpf, b.cpf) for (a, b, _), _ in contado.call_args_list]
+    assert len(pares) == len(set(pares)) == resultado.pares_comparados
@@ -20,4 +20,14 @@ def test_endereco_to_dict(endereco: Endereco):
         'cep': '55715-000'
     }
     
-    assert endereco.to_dict() == expected_dict
\ No newline at end of file
+    assert endereco.to_dict() == expected_dict
+
+def test_endereco_intern():
+    """Testa se endereços idênticos criados via intern são o mesmo objeto."""
+    primeiro = Endereco.intern('residencial', 'Centro', 'Rua ' + 'das Flores', '123')
+    segundo = Endereco.intern('residencial', 'Centro', ''.join(['Rua das ', 'Flores']), '123')
+    outro = Endereco.intern('residencial', 'Centro', 'Rua das Flores', '124')
+
+    assert primeiro is segundo
+    assert primeiro is not outro
+    assert primeiro == Endereco('residencial', 'Centro', 'Rua das Flores', '123')
@@ -0,0 +1,64 @@
+import pytest
+
+from gerador_docs.errors import RecordFormatError
+from gerador_docs.esquemas import ESQUEMA_PESSOAS, obter_esquema, separar_dados
+
+PESSOA = {
+    'Nome': ' José  da Silva ', 'cpf': '529.982.247-25', 'RG': '1047991', 'Gênero': 'm',
+    'Estado Civil': 'Casado', 'profissao': 'Agricultor', 'logradouro': 'Rua A, 10', 'bairro': 'Centro',
+}
+
+def test_separar_dados():
+    registros, identificadores = separar_dados([
+        ['nome:José', 'logradouro:Rua A, 10'],
+        ['nome:Ana,cpf:11144477735,logradouro:Rua B, 20,bairro:Centro'],
+        ['52998224725', '11144477735,12345678909'],
+    ])
+
+    assert registros == [
+        {'nome': 'José', 'logradouro': 'Rua A, 10'},
+        {'nome': 'Ana', 'cpf': '11144477735', 'logradouro': 'Rua B, 20', 'bairro': 'Centro'},
+    ]
+    assert identificadores == ['52998224725', '11144477735', '12345678909']
+
+@pytest.mark.parametrize('dados, erro', [
+    ([['nome:José', 'nome:Ana']], 'repetido'),
+    ([['SDS/PE,genero:F']], 'sem o nome do campo'),
+])
+def test_separar_dados_invalidos(dados, erro):
+    with pytest.raises(RecordFormatError, match=erro):
+        separar_dados(dados)
+
+def test_esquema_pessoas_registro():
+    pessoa = ESQUEMA_PESSOAS.registro(PESSOA)
+
+    assert pessoa.nome_completo == 'José da Silva'
+    assert pessoa.numero_cpf == '529.982.247-25'
+    assert pessoa.numero_rg == '1047991 SSP/PE'
+    assert (pessoa.genero, pessoa.estado_civil) == ('M', 'casado')
+    assert pessoa.endereco['residencial'][0].logradouro == 'Rua A, 10'
+    assert ESQUEMA_PESSOAS.registro(ESQUEMA_PESSOAS.achatar(pessoa)).to_dict() == pessoa.to_dict()
+
+@pytest.mark.parametrize('alteracao, erro', [
+    ({'idade': '30'}, "Campo desconhecido para a tabela 'pessoas': 'idade'"),
+    ({'RG': ''}, 'obrigatório.*rg'),
+    ({'rg': '1047991'}, "'rg' informado mais de uma vez"),
+    ({'cpf': '12345678900'}, 'CPF inválido'),
+    ({'Gênero': 'X'}, 'gênero'),
+])
+def test_esquema_pessoas_invalido(alteracao, erro):
+    with pytest.raises(RecordFormatError, match=erro):
+        ESQUEMA_PESSOAS.registro({**PESSOA, **alteracao})
+
+def test_esquema_atualizar_preserva_enderecos(dados_pessoais):
+    atualizada = ESQUEMA_PESSOAS.atualizar(dados_pessoais, {'bairro': 'Cohab'})
+
+    assert atualizada.endereco['residencial'][0].bairro == 'Cohab'
+    assert atualizada.endereco['residencial'][1:] == dados_pessoais.endereco['residencial'][1:]
+    assert atualizada.endereco['trabalho'] == dados_pessoais.endereco['trabalho']
+    assert atualizada.nome_completo == dados_pessoais.nome_completo
+
+def test_obter_esquema():
+    assert obter_esquema('pessoas') is ESQUEMA_PESSOAS
+    with pytest.raises(RecordFormatError, match="Tabela desconhecida: 'users'"):
+        obter_esquema('users')
@@ -0,0 +1,112 @@
+import csv
+
+import pytest
+
+from gerador_docs import CPF
+from gerador_docs.importacao import importar_planilha, ler_planilha
+from gerador_docs.repository import create_engine
+
+CABECALHO = 'Nome Completo;CPF;RG;Gênero;Estado Civil;Profissão;Bairro;Logradouro;Número'
+
+@pytest.fixture
+def repo(tmp_path):
+    with create_engine(f'sqlite:///{tmp_path}/dados.db') as repo:
+        yield repo
+
+def test_ler_planilha_csv(tmp_path):
+    planilha = tmp_path / 'agricultores.csv'
+    planilha.write_text(f'{CABECALHO}\n;;;;;;;;\nJosé;529.982.247-25;1047991;m;Casado;Agricultor;Centro;Rua A;10\n', encoding='utf-8')
+
+    assert list(ler_planilha(planilha)) == [(3, {
+        'Nome Completo': 'José', 'CPF': '529.982.247-25', 'RG': '1047991', 'Gênero': 'm', 'Estado Civil': 'Casado',
+        'Profissão': 'Agricultor', 'Bairro': 'Centro', 'Logradouro': 'Rua A', 'Número': '10',
+    })]
+
+def test_ler_planilha_formato_invalido(tmp_path):
+    with pytest.raises(ValueError, match='.ods'):
+        ler_planilha(tmp_path / 'planilha.ods')
+
+def test_importar_planilha(tmp_path, repo, dados_pessoais):
+    repo.add(dados_pessoais)
+    planilha = tmp_path / 'agricultores.csv'
+    planilha.write_text('\n'.join([
+        CABECALHO,
+        'José  da Silva;529.982.247-25;1047991;m;Casado;Agricultor;Centro;Rua A;10',
+        'Maria;11144477735;2233445 SDS/PE;F;viúvo;Agricultora;;;',
+        'Repetida;52998224725;1047991;F;solteiro;Agricultora;;;',
+        'Já cadastrado;123.456.789-09;1047991;M;solteiro;Agricultor;;;',
+        'CPF inválido;12345678900;1047991;M;solteiro;Agricultor;;;',
+        'Gênero inválido;39053344705;1047991;X;solteiro;Agricultor;;;',
+        # CPF numérico que perdeu o zero à esquerda na planilha
+        'Zero à esquerda;1234567890;1047991;M;solteiro;Agricultor;;;',
+    ]), encoding='utf-8')
+
+    relatorio = importar_planilha(planilha, repo, tamanho_lote=3)
+
+    assert (relatorio.lidas, relatorio.gravadas, relatorio.rejeitadas) == (7, 3, 4)
+    jose = repo.get('529.982.247-25')
+    assert jose.nome_completo == 'José da Silva' and jose.genero == 'M' and jose.estado_civil == 'casado'
+    assert jose.endereco['residencial'][0].logradouro == 'Rua A'
+    assert str(repo.get('111.444.777-35').rg) == '2233445 SDS/PE'
+    assert repo.get('012.345.678-90') is not None
+
+    assert relatorio.arquivo_rejeitadas == tmp_path / 'agricultores.rejeitadas.csv'
+    with open(relatorio.arquivo_rejeitadas, encoding='utf-8') as arquivo:
+        rejeitadas = list(csv.DictReader(arquivo))
+    assert [(linha['linha'], linha['Nome Completo']) for linha in rejeitadas] == [
+        ('4', 'Repetida'), ('5', 'Já cadastrado'), ('6', 'CPF inválido'), ('7', 'Gênero inválido'),
+    ]
+    assert rejeitadas[0]['motivo'] == 'CPF repetido no arquivo'
+    assert rejeitadas[1]['motivo'] == 'CPF já cadastrado'
+    assert 'dígito verificador' in rejeitadas[2]['motivo']
+
+def test_importar_planilha_sem_rejeitadas(tmp_path, repo):
+    planilha = tmp_path / 'agricultores.csv'
+    planilha.write_text(f'{CABECALHO}\nJosé;529.982.247-25;1047991;M;casado;Agricultor;;;\n', encoding='utf-8')
+
+    relatorio = importar_planilha(planilha, repo)
+
+    assert relatorio.gravadas == 1
+    assert relatorio.arquivo_rejeitadas is None
+    assert not (tmp_path / 'agricultores.rejeitadas.csv').exists()
+
+def test_importar_planilha_colunas_das_rejeitadas(tmp_path, repo):
+    cabecalho = CABECALHO.replace(';', ',')
+    planilha = tmp_path / 'agricultores.csv'
+    planilha.write_text('\n'.join([
+        f'{cabecalho},Observação',
+        # linha rejeitada sem as últimas colunas
+        'CPF inválido,12345678900,1047991,M,solteiro,Agricultor',
+        'Gênero inválido,39053344705,1047991,X,solteiro,Agricultor,Centro,Rua A,10,ligar antes',
+    ]), encoding='utf-8')
+
+    relatorio = importar_planilha(planilha, repo, tamanho_lote=1)
+
+    with open(relatorio.arquivo_rejeitadas, encoding='utf-8') as arquivo:
+        rejeitadas = list(csv.reader(arquivo))
+    assert rejeitadas[0] == ['linha', 'motivo', *cabecalho.split(','), 'Observação']
+    assert rejeitadas[1][-4:] == ['', '', '', '']
+    assert rejeitadas[2][-1] == 'ligar antes'
+
+def test_importar_planilha_nao_revalida_cpf(tmp_path, repo, monkeypatch):
+    planilha = tmp_path / 'agricultores.csv'
+    planilha.write_text(f'{CABECALHO}\nJosé;52998224725;1047991;M;casado;Agricultor;;;\n', encoding='utf-8')
+    # os CPFs já passaram pela validação em lote; a montagem da pessoa não deve validá-los de novo
+    monkeypatch.setattr(CPF, '_validate', lambda self, numero: pytest.fail('CPF revalidado'))
+
+    relatorio = importar_planilha(planilha, repo)
+
+    assert relatorio.gravadas == 1
+    assert str(repo.get('529.982.247-25').cpf) == '529.982.247-25'
+
+def test_importar_xlsx(tmp_path, repo):
+    openpyxl = pytest.importorskip('openpyxl')
+    livro = openpyxl.Workbook()
+    livro.active.append(CABECALHO.split(';'))
+    livro.active.append(['José', 52998224725, 1047991, 'M', 'casado', 'Agricultor', 'Centro', 'Rua A', 10])
+    livro.save(tmp_path / 'agricultores.xlsx')
+
+    relatorio = importar_planilha(tmp_path / 'agricultores.xlsx', repo)
+
+    assert relatorio.gravadas == 1
+    assert repo.get('529.982.247-25').endereco['residencial'][0].numero == '10'
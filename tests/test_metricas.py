@@ -0,0 +1,90 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+import pytest
+
+from gerador_docs import CPF
+from gerador_docs.errors import CPFInvalidError
+from gerador_docs.importacao import validar_lote
+from gerador_docs.logger import configurar_log, obter_logger, registrar_metricas
+from gerador_docs.metricas import METRICAS, RegistroMetricas
+from gerador_docs.repository import create_engine
+from gerador_docs.sintetico import gerar_pessoas
+
+@pytest.fixture
+def metricas():
+    METRICAS.zerar()
+    yield METRICAS
+    METRICAS.zerar()
+
+def test_contadores_com_rotulos():
+    registro = RegistroMetricas()
+    registro.incrementar('documentos.gerados', tipo='caf')
+    registro.incrementar('documentos.gerados', 2, tipo='caf')
+    registro.incrementar('documentos.bytes', 0, tipo='dec')
+
+    assert registro.contador('documentos.gerados', tipo='caf') is registro.contador('documentos.gerados', tipo='caf')
+    assert registro.instantaneo() == {'documentos.bytes{tipo=dec}': 0, 'documentos.gerados{tipo=caf}': 3}
+    assert registro.registros()[1] == {'nome': 'documentos.gerados', 'rotulos': {'tipo': 'caf'}, 'valor': 3}
+
+def test_contadores_entre_threads():
+    registro = RegistroMetricas()
+
+    def incrementar(_):
+        for _ in range(10_000):
+            registro.incrementar('eventos')
+            registro.incrementar('bytes', 3)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(incrementar, range(8)))
+    assert registro.instantaneo() == {'bytes': 240_000, 'eventos': 80_000}
+
+def test_falhas_de_validacao_e_cache(metricas):
+    # exceções criadas e descartadas não são contadas; só as linhas rejeitadas
+    with pytest.raises(Exception):
+        CPF('123')
+    CPFInvalidError('descartada')
+    pessoa = {'nome': 'José', 'rg': '1047991', 'genero': 'M', 'estado_civil': 'casado', 'profissao': 'Agricultor'}
+    _, rejeitadas = validar_lote([
+        (2, {**pessoa, 'cpf': '111.111.111-11'}),
+        (3, {**pessoa, 'cpf': '123'}),
+        (4, {**pessoa, 'cpf': '52998224725', 'rg': 'abc'}),
+        (5, {'cpf': '52998224725'}),
+    ])
+    assert len(rejeitadas) == 4
+
+    with create_engine('sqlite:///:memory:', cache_size=10) as repositorio:
+        pessoa = next(gerar_pessoas(1))
+        repositorio.add(pessoa)
+        repositorio.get(pessoa.numero_cpf)
+        repositorio.get_many([pessoa.numero_cpf, '529.982.247-25'])
+
+    assert metricas.instantaneo() == {
+        'repositorio.cache.hits': 1,
+        'repositorio.cache.misses': 2,
+        'validacao.falhas{erro=CPFInvalidError}': 2,
+        'validacao.falhas{erro=RGFormatError}': 1,
+        'validacao.falhas{erro=RecordFormatError}': 1,
+    }
+
+def test_log_json(metricas):
+    fluxo = StringIO()
+    configurar_log('json', fluxo=fluxo)
+    try:
+        obter_logger('cli').info('comando concluído', extra={'dados': {'comando': 'caf', 'segundos': 1.5}})
+        metricas.incrementar('documentos.gerados', 2, tipo='caf')
+        registrar_metricas('json')
+    finally:
+        logger = obter_logger()
+        logger.handlers[:] = [logging.NullHandler()]
+
+    eventos = [json.loads(linha) for linha in fluxo.getvalue().splitlines()]
+    assert eventos[0]['mensagem'] == 'comando concluído'
+    assert eventos[0]['logger'] == 'gerador_docs.cli'
+    assert (eventos[0]['comando'], eventos[0]['segundos']) == ('caf', 1.5)
+    assert eventos[1]['metricas'] == [{'nome': 'documentos.gerados', 'rotulos': {'tipo': 'caf'}, 'valor': 2}]
+
+    with pytest.raises(ValueError):
+        configurar_log('xml')
@@ -0,0 +1,72 @@
+import json
+import pstats
+from io import StringIO
+
+import pytest
+
+from gerador_docs import perfil
+from gerador_docs.repository import MeasuredRepository, create_engine
+from gerador_docs.sintetico import gerar_pessoas
+
+def test_medir_desativado():
+    assert perfil.ativo() is None
+    with perfil.medir('nada'):
+        pass
+    assert list(perfil.medir_iteracao('nada', iter([1, 2]))) == [1, 2]
+
+def test_perfilar_resumo_e_repositorio():
+    resumo = StringIO()
+    with perfil.perfilar(arquivo_resumo=resumo) as perfilador:
+        with create_engine('sqlite:///:memory:') as repositorio:
+            assert isinstance(repositorio, MeasuredRepository)
+            repositorio.add_many(gerar_pessoas(20))
+            assert len(list(repositorio.list())) == 20
+            with perfil.medir('etapa'):
+                pass
+    assert perfil.ativo() is None
+
+    chamadas = {linha.nome: linha.chamadas for linha in perfilador.resumo()}
+    assert chamadas == {'repositorio.add_many': 1, 'repositorio.list': 1, 'repositorio.close': 1, 'etapa': 1}
+    assert 'repositorio.add_many' in resumo.getvalue()
+    assert not isinstance(create_engine('sqlite:///:memory:'), MeasuredRepository)
+
+def test_instrumentar():
+    @perfil.instrumentar('cli')
+    class Runner:
+        def db(self, args):
+            return args
+
+        def _interno(self):
+            pass
+
+    with perfil.perfilar(arquivo_resumo=StringIO()) as perfilador:
+        assert Runner().db(1) == 1
+        Runner()._interno()
+    assert [span.nome for span in perfilador.spans] == ['cli.db']
+
+def test_perfilar_arquivos(tmp_path):
+    with perfil.perfilar(tmp_path / 'perfil.json', arquivo_resumo=StringIO()):
+        with perfil.medir('externo'):
+            with perfil.medir('interno'):
+                sum(range(1000))
+
+    eventos = json.loads((tmp_path / 'perfil.json').read_text(encoding='utf-8'))['traceEvents']
+    assert [evento['name'] for evento in eventos] == ['interno', 'externo']
+    interno, externo = eventos
+    assert externo['ts'] <= interno['ts'] and interno['ts'] + interno['dur'] <= externo['ts'] + externo['dur']
+
+    with perfil.perfilar(tmp_path / 'perfil.pstats', arquivo_resumo=StringIO()):
+        sum(range(1000))
+    assert pstats.Stats(str(tmp_path / 'perfil.pstats')).total_calls > 0
+
+    with pytest.raises(ValueError):
+        with perfil.perfilar(tmp_path / 'perfil.txt'):
+            pass
+
+def test_destino_do_ambiente(monkeypatch):
+    monkeypatch.delenv('DOCGEN_PROFILE', raising=False)
+    assert perfil.destino_do_ambiente() is None
+    monkeypatch.setenv('DOCGEN_PROFILE', '1')
+    assert perfil.destino_do_ambiente() == ''
+    monkeypatch.setenv('DOCGEN_PROFILE', 'perfil.json')
+    assert perfil.destino_do_ambiente() == 'perfil.json'
@@ -5,4 +5,13 @@ def test_rg():
     rg = RG("123456789", "SSP", "SP")
     assert rg.num_rg == "123456789 SSP/SP"
     assert rg._emissor == "SSP"
-    assert rg._uf == "SP"
\ No newline at end of file
+    assert rg._uf == "SP"
+
+def test_rg_intern_compartilha_emissor():
+    """Testa se RGs criados via intern compartilham as strings de emissor/UF."""
+    primeiro = RG.intern("123456789", "".join(["S", "SP"]), "PE")
+    segundo = RG.intern("987654321", "".join(["SS", "P"]), "PE")
+
+    assert primeiro._emissor is segundo._emissor
+    assert primeiro._uf is segundo._uf
+    assert segundo.num_rg == "987654321 SSP/PE"
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from gerador_docs import DadosPessoais
+from gerador_docs.errors import CPFInvalidError
+from gerador_docs.serializacao import escrever_jsonl, ler_jsonl
+
+@pytest.mark.parametrize("confiavel", [False, True])
+def test_jsonl_round_trip(tmp_path, dados_pessoais: DadosPessoais, confiavel):
+    """Testa se os registros escritos em JSON Lines voltam idênticos."""
+    arquivo = tmp_path / 'pessoas.jsonl'
+
+    assert escrever_jsonl((dados_pessoais for _ in range(3)), arquivo) == 3
+    assert len(arquivo.read_text(encoding='utf-8').splitlines()) == 3
+
+    lidos = list(ler_jsonl(arquivo, confiavel=confiavel))
+    assert len(lidos) == 3
+    assert all(pessoa.to_dict() == dados_pessoais.to_dict() for pessoa in lidos)
+
+def test_jsonl_leitura_incremental(dados_pessoais: DadosPessoais):
+    """Testa se a leitura é preguiçosa e valida os registros."""
+    buffer = io.StringIO()
+    escrever_jsonl([dados_pessoais], buffer)
+    buffer.write(buffer.getvalue().replace('123.456.789-09', '123.456.789-00'))
+    buffer.seek(0)
+
+    leitor = ler_jsonl(buffer)
+    assert next(leitor).numero_cpf == '123.456.789-09'
+    with pytest.raises(CPFInvalidError):
+        next(leitor)
+
+def test_jsonl_linha_invalida():
+    """Testa a mensagem de erro para linhas que não são JSON."""
+    with pytest.raises(ValueError, match="Linha 2 inválida"):
+        list(ler_jsonl(io.StringIO('\n{nao e json\n')))
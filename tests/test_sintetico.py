@@ -0,0 +1,47 @@
+import random
+from itertools import islice
+
+import pytest
+
+from gerador_docs import CPF, DadosPessoais
+from gerador_docs.errors import CARNumberInvalidError
+from gerador_docs.sintetico import BAIRROS, em_lotes, gerar_car, gerar_cars, gerar_cpfs, gerar_pessoas
+from gerador_docs.tipos.documents import CAR
+
+def test_gerar_cpfs_validos_e_distintos():
+    cpfs = list(islice(gerar_cpfs(random.Random(1)), 5000))
+
+    assert len(set(cpfs)) == len(cpfs)
+    assert all(CPF.validate_many(cpfs).validos)
+
+def test_gerar_pessoas_deterministico():
+    primeira = [pessoa.to_dict() for pessoa in gerar_pessoas(50, semente=7)]
+    segunda = [pessoa.to_dict() for pessoa in gerar_pessoas(50, semente=7)]
+    outra = [pessoa.to_dict() for pessoa in gerar_pessoas(50, semente=8)]
+
+    assert primeira == segunda
+    assert primeira != outra
+    # os registros passam pela validação completa
+    assert all(DadosPessoais.from_dict(registro).to_dict() == registro for registro in primeira)
+    assert {registro['endereco']['residencial'][0]['bairro'] for registro in primeira} <= set(BAIRROS)
+
+def test_gerar_car():
+    numero = gerar_car(random.Random(0))
+
+    assert len(numero) == 50
+    assert len(numero.split('.')) == 7
+    assert CAR(numero).numero == numero
+    with pytest.raises(CARNumberInvalidError):
+        CAR('PE-2605707-' + '.'.join('0' * tamanho for tamanho in (5, 5, 5, 5, 5, 4, 4)))
+
+def test_gerar_cars_deterministico():
+    primeira = [(pessoa.numero_cpf, car) for pessoa, car in gerar_cars(gerar_pessoas(20, semente=3), semente=3)]
+    segunda = [(pessoa.numero_cpf, car) for pessoa, car in gerar_cars(gerar_pessoas(20, semente=3), semente=3)]
+
+    assert primeira == segunda
+    assert [cpf for cpf, _ in primeira] == [pessoa.numero_cpf for pessoa in gerar_pessoas(20, semente=3)]
+    assert len({car for _, car in primeira}) == 20
+    assert all(CAR(car) for _, car in primeira)
+
+def test_em_lotes():
+    assert [len(lote) for lote in em_lotes(gerar_pessoas(12), 5)] == [5, 5, 2]
@@ -0,0 +1,97 @@
+import json
+import shlex
+from argparse import ArgumentParser
+
+import pytest
+
+from gerador_docs.cli.batch import executar_manifesto
+from gerador_docs.cli.runners import DefaultRunner
+
+class RunnerFalso:
+    """Runner que apenas registra os comandos recebidos."""
+
+    def __init__(self) -> None:
+        self.chamadas = []
+
+    def __getattr__(self, comando: str):
+        def executar(args: dict) -> None:
+            if comando == 'poco':
+                raise RuntimeError('falha simulada')
+            self.chamadas.append((comando, args))
+        return executar
+
+def test_commands_batch(parser: ArgumentParser):
+    args = parser.parse_args(shlex.split("batch manifesto.jsonl --parar-no-erro"))
+
+    assert args.command == 'batch'
+    assert args.manifesto == 'manifesto.jsonl'
+    assert args.parar_no_erro is True
+
+def test_batch_jsonl(tmp_path, parser: ArgumentParser):
+    manifesto = tmp_path / 'manifesto.jsonl'
+    manifesto.write_text('\n'.join([
+        json.dumps(["caf"]),
+        json.dumps({"command": "db", "args": ["pessoas", "--action", "list"]}),
+        '',
+        json.dumps(["db", "pessoas", "--action", "invalida"]),
+        json.dumps(["poco"]),
+        json.dumps(["batch", "outro.jsonl"]),
+    ]), encoding='utf-8')
+    runner = RunnerFalso()
+
+    resultados = executar_manifesto(manifesto, parser=parser, runner=runner)
+
+    assert [(r.linha, r.comando, r.sucesso) for r in resultados] == [
+        (1, 'caf', True), (2, 'db', True), (4, 'db', False), (5, 'poco', False), (6, 'batch', False),
+    ]
+    assert 'invalid choice' in resultados[2].erro
+    assert resultados[3].erro == 'RuntimeError: falha simulada'
+    assert [comando for comando, _ in runner.chamadas] == ['caf', 'db']
+    assert runner.chamadas[1][1]['table'] == 'pessoas'
+
+def test_batch_csv_parar_no_erro(tmp_path, parser: ArgumentParser):
+    manifesto = tmp_path / 'manifesto.csv'
+    manifesto.write_text('dec,,\npoco,,\ndb,pessoas,--action=list\n', encoding='utf-8')
+
+    resultados = executar_manifesto(manifesto, parser=parser, runner=RunnerFalso(), parar_no_erro=True)
+
+    assert [(r.comando, r.sucesso) for r in resultados] == [('dec', True), ('poco', False)]
+
+def test_batch_linhas_mal_formadas(tmp_path, parser: ArgumentParser):
+    manifesto = tmp_path / 'manifesto.jsonl'
+    manifesto.write_text('\n'.join([
+        '["caf"',
+        json.dumps({"args": []}),
+        json.dumps({"command": "db", "args": "pessoas"}),
+        json.dumps([]),
+        json.dumps("caf"),
+        json.dumps(["dec"]),
+    ]), encoding='utf-8')
+    runner = RunnerFalso()
+
+    resultados = executar_manifesto(manifesto, parser=parser, runner=runner)
+
+    assert [(r.linha, r.sucesso) for r in resultados] == [(1, False), (2, False), (3, False), (4, False), (5, False), (6, True)]
+    assert resultados[0].erro.startswith('JSON inválido')
+    assert resultados[1].erro == "objeto sem o campo 'command'"
+    assert resultados[2].erro == "o campo 'args' deve ser uma lista"
+    assert resultados[3].erro == 'linha sem comando'
+    assert [comando for comando, _ in runner.chamadas] == ['dec']
+
+def test_batch_manifesto_inexistente(tmp_path, parser: ArgumentParser):
+    with pytest.raises(FileNotFoundError):
+        executar_manifesto(tmp_path / 'nao_existe.jsonl', parser=parser, runner=RunnerFalso())
+
+def test_batch_status_de_saida(tmp_path, capsys):
+    runner = DefaultRunner()
+    with pytest.raises(SystemExit) as saida:
+        runner.batch({'manifesto': str(tmp_path / 'nao_existe.jsonl'), 'parar_no_erro': False})
+    assert saida.value.code == 1
+    assert 'Erro: não foi possível ler o manifesto' in capsys.readouterr().out
+
+    manifesto = tmp_path / 'manifesto.jsonl'
+    manifesto.write_text('{"args": []}\n', encoding='utf-8')
+    with pytest.raises(SystemExit) as saida:
+        runner.batch({'manifesto': str(manifesto), 'parar_no_erro': False})
+    assert saida.value.code == 1
+    assert "[linha 1] -: falhou (objeto sem o campo 'command')" in capsys.readouterr().out
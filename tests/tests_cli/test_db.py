@@ -0,0 +1,49 @@
+import pytest
+
+from gerador_docs.cli.db import executar_acao
+from gerador_docs.errors import RecordFormatError
+from gerador_docs.esquemas import ESQUEMA_PESSOAS
+from gerador_docs.repository import create_engine
+
+JOSE = ['nome:José da Silva', 'cpf:52998224725', 'rg:1047991', 'genero:M', 'estado_civil:casado', 'profissao:Agricultor', 'bairro:Centro']
+ANA = ['nome:Ana,cpf:11144477735,rg:2233445 SDS/PE,genero:F,estado_civil:viúvo,profissao:Pescadora,bairro:Cohab']
+
+@pytest.fixture
+def repo(tmp_path):
+    with create_engine(f'sqlite:///{tmp_path}/dados.db') as repo:
+        yield repo
+
+def test_db_acoes(repo):
+    assert executar_acao(ESQUEMA_PESSOAS, 'add', [JOSE, ANA], repo) == ["2 registro(s) adicionado(s) em 'pessoas'."]
+
+    listagem = executar_acao(ESQUEMA_PESSOAS, 'list', [['bairro:centro']], repo)
+    assert listagem == ['529.982.247-25 | José da Silva | 1047991 SSP/PE | Centro', "1 registro(s) em 'pessoas'."]
+
+    assert executar_acao(ESQUEMA_PESSOAS, 'update', [['cpf:529.982.247-25', 'profissao:Pescador']], repo)[-1] == (
+        "1 registro(s) atualizado(s) em 'pessoas'."
+    )
+    assert repo.get('529.982.247-25').profissao == 'Pescador'
+    # campos informados pelo apelido ('nome' = 'nome_completo')
+    assert executar_acao(ESQUEMA_PESSOAS, 'update', [['cpf:52998224725', 'nome:Jose Silva']], repo)[-1] == (
+        "1 registro(s) atualizado(s) em 'pessoas'."
+    )
+    assert repo.get('529.982.247-25').nome_completo == 'Jose Silva'
+    assert executar_acao(ESQUEMA_PESSOAS, 'update', [['cpf:12345678909', 'profissao:Pescador']], repo) == [
+        'Registro não encontrado: 123.456.789-09.', "0 registro(s) atualizado(s) em 'pessoas'.",
+    ]
+
+    assert executar_acao(ESQUEMA_PESSOAS, 'remove', [['11144477735']], repo) == ["1 registro(s) removido(s) de 'pessoas'."]
+    assert executar_acao(ESQUEMA_PESSOAS, 'list', None, repo)[-1] == "1 registro(s) em 'pessoas'."
+
+@pytest.mark.parametrize('acao, dados, erro', [
+    (None, None, '--action'),
+    ('add', [JOSE[:2]], 'nº 1: Campo.*obrigatório'),
+    ('add', [['52998224725']], 'campo:valor'),
+    ('update', [['profissao:Pescador']], "'cpf'"),
+    ('update', [['cpf:52998224725', 'nome:Jose', 'nome_completo:José']], 'mais de uma vez'),
+    ('list', [['profissao:Pescador']], 'filtros aceitos'),
+    ('remove', None, 'identificadores'),
+])
+def test_db_acoes_invalidas(repo, acao, dados, erro):
+    with pytest.raises(RecordFormatError, match=erro):
+        executar_acao(ESQUEMA_PESSOAS, acao, dados, repo)
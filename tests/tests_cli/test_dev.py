@@ -0,0 +1,20 @@
+from gerador_docs.cli.runners import DefaultRunner
+from gerador_docs.repository import create_engine
+from gerador_docs.sintetico import gerar_cars, gerar_pessoas
+
+def test_dev_fake_com_car(tmp_path, parser, capsys):
+    uri = f'sqlite:///{tmp_path}/dados.db'
+    args = parser.parse_args(['dev', 'fake', '-n', '25', '--lote', '10', '--db', uri, '--car'])
+    DefaultRunner().dev(vars(args))
+
+    assert capsys.readouterr().out.strip().endswith('25 beneficiário(s) sintético(s) gravado(s) em ' + uri + ', com 25 CAR(s).')
+    pessoa, car = next(gerar_cars(gerar_pessoas(1)))
+    with create_engine(uri) as repo:
+        assert repo.get_por_documento('CAR', car).numero_cpf == pessoa.numero_cpf
+
+def test_dev_fake_car_requer_db(tmp_path, parser, capsys):
+    args = parser.parse_args(['dev', 'fake', '-n', '5', '--saida', str(tmp_path / 'pessoas.jsonl'), '--car'])
+    DefaultRunner().dev(vars(args))
+
+    assert '--car requer --db' in capsys.readouterr().out
+    assert not (tmp_path / 'pessoas.jsonl').exists()
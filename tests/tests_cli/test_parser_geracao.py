@@ -0,0 +1,25 @@
+import shlex
+from argparse import ArgumentParser
+
+import pytest
+
+@pytest.mark.parametrize("jobs, esperado", [("0", 0), ("4", 4)])
+def test_jobs_valido(parser: ArgumentParser, jobs, esperado):
+    args = parser.parse_args(shlex.split(f"caf --pessoas p.jsonl --jobs {jobs}"))
+    assert args.jobs == esperado
+
+@pytest.mark.parametrize("jobs", ["-1", "dois"])
+def test_jobs_invalido(parser: ArgumentParser, capsys, jobs):
+    with pytest.raises(SystemExit):
+        parser.parse_args(["caf", "--pessoas", "p.jsonl", "--jobs", jobs])
+    assert "--jobs" in capsys.readouterr().err
+
+@pytest.mark.parametrize("saida", ["perfil.pstats", "perfil.JSON"])
+def test_profile_saida_valida(parser: ArgumentParser, saida):
+    args = parser.parse_args(["--profile-saida", saida, "caf", "--pessoas", "p.jsonl"])
+    assert args.profile_saida == saida
+
+def test_profile_saida_formato_invalido(parser: ArgumentParser, capsys):
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--profile-saida", "perfil.txt", "caf", "--pessoas", "p.jsonl"])
+    assert "formato de perfil não suportado" in capsys.readouterr().err
@@ -0,0 +1,72 @@
+"""
+Benchmark de inicialização da CLI.
+
+Usa `python -X importtime` num processo novo (cold start) para medir o custo de importar
+a CLI e analisar os argumentos de um comando. O limite pode ser ajustado com a variável
+de ambiente DOCGEN_STARTUP_LIMITE_MS.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+LIMITE_MS = float(os.environ.get('DOCGEN_STARTUP_LIMITE_MS', 100))
+
+def _importtime(codigo: str) -> dict:
+    """Executa o código num interpretador novo e retorna {módulo: tempo cumulativo em µs}."""
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        capture_output=True, text=True, check=True,
+    )
+    tempos = {}
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith('import time:') or 'cumulative' in linha:
+            continue
+        _, cumulativo, modulo = linha.removeprefix('import time:').split('|')
+        tempos[modulo.strip()] = int(cumulativo)
+    return tempos
+
+@pytest.mark.parametrize("argv", [["db", "pessoas", "--action", "list"], ["caf"]])
+def test_startup_sem_rich_nem_tipos(argv):
+    """A análise dos argumentos não deve importar o rich nem os tipos do pacote."""
+    tempos = _importtime(f"from gerador_docs.cli import _create_parser; _create_parser().parse_args({argv!r})")
+
+    assert 'gerador_docs.cli' in tempos
+    assert not [modulo for modulo in tempos if modulo.split('.')[0] in ('rich', 'rich_argparse')]
+    assert 'gerador_docs.tipos' not in tempos
+
+def test_startup_tempo_de_importacao():
+    """O cold start da CLI (importação de gerador_docs.cli) deve ficar abaixo de LIMITE_MS."""
+    tempos = _importtime("import gerador_docs.cli")
+
+    assert tempos['gerador_docs.cli'] / 1000 < LIMITE_MS
+
+def test_main_sem_rich_por_padrao(tmp_path):
+    """Sem --log-format, executar um comando não deve importar o rich (os logs ficam desativados)."""
+    codigo = (
+        "import sys; from gerador_docs.cli import main; "
+        f"sys.argv = ['docgen', 'db', 'pessoas', '--action', 'list', '--db', {f'sqlite:///{tmp_path}/dados.db'!r}]; "
+        "main(); print(sorted(m for m in sys.modules if m.split('.')[0] in ('rich', 'rich_argparse')))"
+    )
+    resultado = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True)
+
+    assert resultado.stdout.splitlines()[-1] == '[]'
+    assert 'comando iniciado' not in resultado.stderr
+
+@pytest.mark.parametrize("argv, mensagem", [
+    (["caf"], "Nenhum beneficiário informado"),
+    (["caf", "--pessoas", "inexistente.jsonl"], "Erro: não foi possível ler o arquivo de beneficiários 'inexistente.jsonl'"),
+])
+def test_gerar_valida_pessoas_antes_do_pipeline(argv, mensagem):
+    """Sem um arquivo --pessoas legível, o comando falha sem importar o pipeline de geração."""
+    codigo = (
+        "import sys; from gerador_docs.cli import main; "
+        f"sys.argv = ['docgen', *{argv!r}]; "
+        "main(); print('gerador_docs.docx.pipeline' in sys.modules)"
+    )
+    resultado = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True)
+
+    saida = resultado.stdout.splitlines()
+    assert saida[-1] == 'False'
+    assert saida[-2].startswith(mensagem)
@@ -0,0 +1,47 @@
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/></Relationships>'
+)
+DOCUMENTO = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+    '<w:p><w:r><w:t>Declaro que {{nome_completo}}, CPF {{ cpf }}, reside em {{endereco}}.</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t>Feira Nova/PE, {{data_extenso}}.</w:t></w:r></w:p>'
+    '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/></w:sectPr>'
+    '</w:body></w:document>'
+)
+
+@pytest.fixture(autouse=True)
+def cache_templates(tmp_path, monkeypatch):
+    """Isola o cache de templates (memória e disco) de cada teste."""
+    from gerador_docs.docx import template
+
+    monkeypatch.setenv('DOCGEN_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(template, '_CACHE', {})
+    return tmp_path / 'cache'
+
+@pytest.fixture
+def template_docx(tmp_path):
+    """Fixture que cria um template .docx mínimo com campos {{...}}."""
+    caminho = tmp_path / 'template.docx'
+    with ZipFile(caminho, 'w', ZIP_DEFLATED) as docx:
+        docx.writestr('[Content_Types].xml', CONTENT_TYPES)
+        docx.writestr('_rels/.rels', RELS)
+        docx.writestr('word/document.xml', DOCUMENTO)
+        docx.writestr('word/media/imagem.bin', bytes(range(256)) * 64)
+    return caminho
@@ -0,0 +1,85 @@
+import csv
+import re
+from dataclasses import replace
+from datetime import date
+from zipfile import ZipFile
+
+import pytest
+
+from gerador_docs import CPF, DadosPessoais
+from gerador_docs.docx.merge import QUEBRA_DE_PAGINA, mesclar_docx
+from gerador_docs.docx.pipeline import TEMPLATES_PADRAO, gerar_documento_mesclado
+from gerador_docs.errors import TemplateFieldError
+
+def _texto(caminho) -> str:
+    with ZipFile(caminho) as docx:
+        return docx.read('word/document.xml').decode('utf-8')
+
+def test_gerar_documento_mesclado(tmp_path, template_docx, dados_pessoais: DadosPessoais):
+    pessoas = [
+        replace(dados_pessoais, cpf=CPF('52998224725'), nome_completo='Maria da Silva'),
+        dados_pessoais,
+        replace(dados_pessoais, cpf=CPF('11144477735'), nome_completo='José & Filhos'),
+    ]
+
+    resultados = gerar_documento_mesclado(pessoas, template_docx, tmp_path, prefixo='dec', data=date(2025, 3, 28), indice=True)
+
+    destino = tmp_path / 'dec_lote.docx'
+    assert [(r.indice, r.caminho, r.sucesso) for r in resultados] == [(0, destino, True), (1, destino, True), (2, destino, True)]
+
+    texto = _texto(destino)
+    assert texto.count('<w:body>') == 1 and texto.count('<w:sectPr>') == 1
+    assert texto.count(QUEBRA_DE_PAGINA.decode()) == 2
+    assert texto.index('Maria da Silva') < texto.index(dados_pessoais.nome_completo) < texto.index('José &amp; Filhos')
+    assert texto.index('José &amp; Filhos') < texto.index('<w:sectPr>')
+    assert texto.endswith('</w:sectPr></w:body></w:document>')
+
+    with open(tmp_path / 'dec_lote.csv', encoding='utf-8') as arquivo:
+        linhas = list(csv.reader(arquivo))
+    assert linhas[0] == ['ordem', 'cpf', 'nome_completo']
+    assert linhas[1] == ['1', '529.982.247-25', 'Maria da Silva']
+    assert linhas[3] == ['3', '111.444.777-35', 'José & Filhos']
+
+def test_mesclar_campo_ausente(tmp_path, template_docx):
+    with pytest.raises(TemplateFieldError, match='nome_completo'):
+        mesclar_docx(template_docx, [{}], tmp_path / 'lote.docx')
+    assert not (tmp_path / 'lote.docx').exists()
+
+def test_mesclar_template_real(tmp_path):
+    total = mesclar_docx(TEMPLATES_PADRAO['dec'], [{}] * 3, tmp_path / 'lote.docx')
+
+    assert total == 3
+    with ZipFile(tmp_path / 'lote.docx') as docx:
+        assert docx.testzip() is None
+    texto = _texto(tmp_path / 'lote.docx')
+    assert texto.count('Atenciosamente,') == 3
+    assert texto.count('<w:sectPr>') == 1
+    # os marcadores de cada cópia não colidem com os das demais
+    ids = re.findall(r'<w:bookmarkStart [^>]*w:id="(\d+)"', texto)
+    assert len(ids) == 15 and len(set(ids)) == len(set(ids[:5])) * 3
+
+def test_mesclar_renumera_marcadores_e_desenhos(tmp_path, template_docx):
+    documento = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+        '<w:bookmarkStart w:id="0" w:name="_heading=h.gjdgxs"/><w:p><w:r><w:t>{{nome_completo}}</w:t></w:r></w:p>'
+        '<w:bookmarkEnd w:id="0"/>'
+        '<w:bookmarkStart w:id="3" w:name="um_nome_de_marcador_com_quarenta_chars_"/><w:bookmarkEnd w:id="3"/>'
+        '<w:p><w:r><w:drawing><wp:inline><wp:docPr id="7" name="Imagem 1"/></wp:inline></w:drawing></w:r></w:p>'
+        '<w:sectPr/></w:body></w:document>'
+    )
+    template = tmp_path / 'marcadores.docx'
+    with ZipFile(template_docx) as origem, ZipFile(template, 'w') as docx:
+        for nome in origem.namelist():
+            docx.writestr(nome, documento if nome == 'word/document.xml' else origem.read(nome))
+
+    mesclar_docx(template, [{'nome_completo': nome} for nome in ('Ana', 'Bia', 'Caio')], tmp_path / 'lote.docx')
+
+    texto = _texto(tmp_path / 'lote.docx')
+    inicios = re.findall(r'<w:bookmarkStart w:id="(\d+)" w:name="([^"]*)"/>', texto)
+    assert [id for id, _ in inicios] == ['0', '3', '8', '11', '16', '19']
+    assert re.findall(r'<w:bookmarkEnd w:id="(\d+)"/>', texto) == ['0', '3', '8', '11', '16', '19']
+    assert re.findall(r'<wp:docPr id="(\d+)"', texto) == ['7', '15', '23']
+    nomes = [nome for _, nome in inicios]
+    assert len(set(nomes)) == 6 and nomes[2] == '_heading=h.gjdgxs_1'
+    assert all(len(nome) <= 40 for nome in nomes)
@@ -0,0 +1,97 @@
+from dataclasses import replace
+from datetime import date
+from zipfile import ZipFile
+
+import pytest
+
+from gerador_docs import CPF, DadosPessoais
+from gerador_docs.docx.pipeline import TEMPLATES_PADRAO, gerar_documentos
+from gerador_docs.docx.render import renderizar_docx
+from gerador_docs.errors import TemplateFieldError
+from gerador_docs.metricas import METRICAS
+
+def _texto(caminho) -> str:
+    with ZipFile(caminho) as docx:
+        return docx.read('word/document.xml').decode('utf-8')
+
+def test_renderizar_docx(tmp_path, template_docx):
+    destino = renderizar_docx(template_docx, {
+        'nome_completo': 'José & Maria', 'cpf': '123.456.789-09', 'endereco': 'Centro', 'data_extenso': '1 de Maio de 2025',
+    }, tmp_path / 'saida.docx')
+
+    texto = _texto(destino)
+    assert 'Declaro que José &amp; Maria, CPF 123.456.789-09, reside em Centro.' in texto
+    with ZipFile(destino) as docx, ZipFile(template_docx) as origem:
+        assert docx.namelist() == origem.namelist()
+        assert docx.read('word/media/imagem.bin') == origem.read('word/media/imagem.bin')
+
+def test_renderizar_docx_campo_ausente(tmp_path, template_docx):
+    with pytest.raises(TemplateFieldError, match='nome_completo'):
+        renderizar_docx(template_docx, {}, tmp_path / 'saida.docx')
+    assert not (tmp_path / 'saida.docx').exists()
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_gerar_documentos(tmp_path, template_docx, dados_pessoais: DadosPessoais, jobs):
+    pessoas = [
+        replace(dados_pessoais, cpf=CPF('52998224725'), nome_completo='Maria da Silva'),
+        dados_pessoais,
+        replace(dados_pessoais, cpf=CPF('11144477735')),
+    ]
+    # um diretório no lugar do arquivo de saída provoca a falha apenas deste documento
+    (tmp_path / 'saida' / 'dec_11144477735.docx').mkdir(parents=True)
+
+    METRICAS.zerar()
+    resultados = gerar_documentos(pessoas, template_docx, tmp_path / 'saida', prefixo='dec', jobs=jobs, data=date(2025, 3, 28))
+
+    # as métricas são contabilizadas no processo principal, mesmo com jobs > 1
+    metricas = METRICAS.instantaneo()
+    assert (metricas['documentos.gerados{tipo=dec}'], metricas['documentos.falhas{tipo=dec}']) == (2, 1)
+    assert metricas['documentos.bytes{tipo=dec}'] == sum(r.caminho.stat().st_size for r in resultados if r.sucesso)
+    assert [r.indice for r in resultados] == [0, 1, 2]
+    assert [r.sucesso for r in resultados] == [True, True, False]
+    assert resultados[0].caminho == tmp_path / 'saida' / 'dec_52998224725.docx'
+    assert 'Maria da Silva, CPF 529.982.247-25' in _texto(resultados[0].caminho)
+    assert 'Feira Nova/PE, 28 de Março de 2025.' in _texto(resultados[1].caminho)
+    assert resultados[2].caminho is None and resultados[2].erro
+
+def test_gerar_documentos_incremental(tmp_path, template_docx, dados_pessoais: DadosPessoais):
+    outra = replace(dados_pessoais, cpf=CPF('52998224725'), nome_completo='Maria da Silva')
+    saida = tmp_path / 'saida'
+
+    primeira = gerar_documentos([dados_pessoais, outra], template_docx, saida, prefixo='dec', incremental=True)
+    assert [(r.sucesso, r.em_dia) for r in primeira] == [(True, False), (True, False)]
+    assert (saida / '.docgen-manifesto.json').is_file()
+
+    # sem mudanças: nada é gerado novamente
+    segunda = gerar_documentos([dados_pessoais, outra], template_docx, saida, prefixo='dec', incremental=True)
+    assert [r.em_dia for r in segunda] == [True, True]
+    assert [r.caminho for r in segunda] == [r.caminho for r in primeira]
+
+    # apenas a pessoa alterada e o documento removido são gerados novamente
+    primeira[0].caminho.unlink()
+    alterada = replace(outra, nome_completo='Maria da Silva Santos')
+    terceira = gerar_documentos([dados_pessoais, alterada], template_docx, saida, prefixo='dec', incremental=True)
+    assert [r.em_dia for r in terceira] == [False, False]
+    assert 'Maria da Silva Santos' in _texto(terceira[1].caminho)
+
+    # uma nova versão do template invalida todos os documentos
+    with ZipFile(template_docx, 'a') as docx:
+        docx.writestr('word/extra.xml', '<extra/>')
+    quarta = gerar_documentos([dados_pessoais, alterada], template_docx, saida, prefixo='dec', incremental=True)
+    assert [r.em_dia for r in quarta] == [False, False]
+
+@pytest.mark.parametrize("comando", ["dec", "caf"])
+def test_gerar_documentos_template_sem_campos(tmp_path, dados_pessoais: DadosPessoais, comando):
+    """Os templates padrão ainda não têm campos {{...}}: gerar cópias idênticas é um erro, não um sucesso."""
+    with pytest.raises(TemplateFieldError, match='não possui campos'):
+        gerar_documentos([dados_pessoais], TEMPLATES_PADRAO[comando], tmp_path / 'saida', prefixo=comando)
+    assert not list((tmp_path / 'saida').glob('*.docx'))
+
+def test_gerar_documentos_cpf_repetido(tmp_path, template_docx, dados_pessoais: DadosPessoais):
+    repetida = replace(dados_pessoais, nome_completo='Outro Nome')
+
+    resultados = gerar_documentos([dados_pessoais, repetida], template_docx, tmp_path / 'saida', prefixo='dec', jobs=2, incremental=True)
+
+    assert [r.sucesso for r in resultados] == [True, False]
+    assert 'posição 1' in resultados[1].erro
+    assert 'Outro Nome' not in _texto(resultados[0].caminho)
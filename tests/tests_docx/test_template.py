@@ -0,0 +1,37 @@
+import pytest
+
+from gerador_docs.docx import template as modulo_template
+from gerador_docs.docx.template import carregar_template, compilar_template
+from gerador_docs.errors import TemplateFieldError
+
+def test_compilar_template(template_docx):
+    compilado = compilar_template(template_docx)
+
+    assert compilado.campos == ('nome_completo', 'cpf', 'endereco', 'data_extenso')
+    assert len(compilado.trechos) == len(compilado.campos) + 1
+    assert compilado.trechos[0].endswith('<w:t>Declaro que ')
+    assert [parte.nome for parte in compilado.partes] == [
+        '[Content_Types].xml', '_rels/.rels', 'word/document.xml', 'word/media/imagem.bin',
+    ]
+
+def test_renderizar_documento(template_docx):
+    compilado = compilar_template(template_docx)
+    valores = {'nome_completo': 'A < B', 'cpf': '1', 'endereco': 'Centro', 'data_extenso': 'hoje'}
+
+    assert 'Declaro que A &lt; B, CPF 1, reside em Centro.' in compilado.renderizar_documento(valores)
+    del valores['data_extenso']
+    with pytest.raises(TemplateFieldError, match='data_extenso'):
+        compilado.renderizar_documento(valores)
+
+def test_carregar_template_usa_cache(template_docx, cache_templates, mocker):
+    compilar = mocker.spy(modulo_template, 'compilar_template')
+
+    primeiro = carregar_template(template_docx)
+    assert carregar_template(template_docx) is primeiro
+    assert compilar.call_count == 1
+    assert (cache_templates / f'{primeiro.hash}.v{modulo_template.VERSAO_CACHE}.pickle').exists()
+
+    # um novo processo (cache em memória vazio) reaproveita o cache em disco
+    modulo_template._CACHE.clear()
+    assert carregar_template(template_docx) == primeiro
+    assert compilar.call_count == 1
@@ -0,0 +1,39 @@
+import io
+from zipfile import ZipFile
+
+from gerador_docs.docx.render import renderizar_docx
+
+class SomenteEscrita:
+    """Objeto de arquivo sem seek/tell, como um pipe ou socket."""
+
+    def __init__(self) -> None:
+        self.buffer = io.BytesIO()
+
+    def write(self, dados: bytes) -> int:
+        return self.buffer.write(dados)
+
+CAMPOS = {'nome_completo': 'João', 'cpf': '123.456.789-09', 'endereco': 'Centro', 'data_extenso': 'hoje'}
+
+def test_renderizar_docx_em_fluxo(template_docx):
+    saida = SomenteEscrita()
+    renderizar_docx(template_docx, CAMPOS, saida)
+
+    with ZipFile(io.BytesIO(saida.buffer.getvalue())) as gerado, ZipFile(template_docx) as origem:
+        assert gerado.testzip() is None
+        assert gerado.namelist() == origem.namelist()
+        assert 'Declaro que João, CPF 123.456.789-09' in gerado.read('word/document.xml').decode('utf-8')
+
+        # as partes inalteradas são copiadas já comprimidas, sem recompressão
+        for nome in ('[Content_Types].xml', '_rels/.rels', 'word/media/imagem.bin'):
+            assert gerado.getinfo(nome).compress_size == origem.getinfo(nome).compress_size
+            assert gerado.getinfo(nome).CRC == origem.getinfo(nome).CRC
+            assert gerado.read(nome) == origem.read(nome)
+
+def test_renderizar_template_real(tmp_path):
+    from gerador_docs.docx.pipeline import TEMPLATES_PADRAO
+
+    destino = renderizar_docx(TEMPLATES_PADRAO['dec'], {}, tmp_path / 'dec.docx')
+
+    with ZipFile(destino) as gerado, ZipFile(TEMPLATES_PADRAO['dec']) as origem:
+        assert gerado.testzip() is None
+        assert {nome: gerado.read(nome) for nome in gerado.namelist()} == {nome: origem.read(nome) for nome in origem.namelist()}
@@ -0,0 +1,13 @@
+import pytest
+
+from gerador_docs.repository import create_engine
+
+@pytest.fixture(params=['sqlite', 'tinydb'])
+def repo(request, tmp_path):
+    """Fixture que cria um repositório vazio de cada backend suportado."""
+    uris = {
+        'sqlite': f'sqlite:///{tmp_path}/dados.db',
+        'tinydb': f'tinydb://{tmp_path}/dados.json',
+    }
+    with create_engine(uris[request.param]) as repo:
+        yield repo
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from dataclasses import replace
+
+import pytest
+
+from gerador_docs import CPF, DadosPessoais
+from gerador_docs.errors import DuplicateRecordError
+from gerador_docs.repository import AsyncRepository, TinyDbRepository, create_engine
+
+def test_create_engine_aiotinydb(tmp_path):
+    repo = create_engine(f'tinydb+aiotinydb://{tmp_path}/dados.json')
+    assert isinstance(repo, AsyncRepository)
+    assert isinstance(repo._repository, TinyDbRepository)
+    asyncio.run(repo.close())
+
+@pytest.mark.parametrize("esquema", ["tinydb+aiotinydb", "sqlite+aiosqlite"])
+def test_async_add_agrupa_escritas(tmp_path, mocker, dados_pessoais: DadosPessoais, esquema):
+    outra = replace(dados_pessoais, nome_completo='Maria da Silva', cpf=CPF('52998224725'), genero='F')
+
+    async def cenario():
+        async with create_engine(f'{esquema}:///{tmp_path}/dados') as repo:
+            add_many = mocker.spy(repo._repository, 'add_many')
+            await asyncio.gather(repo.add(dados_pessoais), repo.add(outra))
+            assert add_many.call_count == 1
+
+            with pytest.raises(DuplicateRecordError):
+                await repo.add(outra)
+
+            assert (await repo.get('52998224725')).nome_completo == 'Maria da Silva'
+            assert [p.numero_cpf for p in await repo.query(bairro='centro')] == ['123.456.789-09', '529.982.247-25']
+            assert len(await repo.list()) == 2
+
+    asyncio.run(cenario())
+
+def test_async_add_conflito_afeta_so_quem_causou(tmp_path, dados_pessoais: DadosPessoais):
+    outra = replace(dados_pessoais, cpf=CPF('52998224725'))
+
+    async def cenario():
+        async with create_engine(f'tinydb+aiotinydb:///{tmp_path}/dados.json') as repo:
+            await repo.add(dados_pessoais)
+            resultados = await asyncio.gather(repo.add(dados_pessoais), repo.add(outra), return_exceptions=True)
+            assert isinstance(resultados[0], DuplicateRecordError)
+            assert resultados[1] is None
+            assert set(await repo.get_many(['12345678909', '52998224725'])) == {'123.456.789-09', '529.982.247-25'}
+
+    asyncio.run(cenario())
+
+def test_async_close_aguarda_regravacao_apos_conflito(tmp_path, dados_pessoais: DadosPessoais):
+    outra = replace(dados_pessoais, cpf=CPF('52998224725'))
+
+    async def cenario():
+        repo = create_engine(f'tinydb+aiotinydb:///{tmp_path}/dados.json')
+        await repo.add(dados_pessoais)
+
+        lote_iniciado = threading.Event()
+        add_many = repo._repository.add_many
+
+        def add_many_sinalizado(pessoas):
+            lote_iniciado.set()
+            return add_many(pessoas)
+
+        repo._repository.add_many = add_many_sinalizado
+        # o lote conflita e é regravado um a um; close() não pode fechar o banco no meio disso
+        tarefas = [asyncio.ensure_future(repo.add(dados_pessoais)), asyncio.ensure_future(repo.add(outra))]
+        await asyncio.get_running_loop().run_in_executor(None, lote_iniciado.wait)
+        await repo.close()
+        await asyncio.gather(*tarefas, return_exceptions=True)
+        assert isinstance(tarefas[0].exception(), DuplicateRecordError)
+        assert tarefas[1].exception() is None
+
+    asyncio.run(cenario())
+    with create_engine(f'tinydb:///{tmp_path}/dados.json') as repo:
+        assert set(repo.get_many(['12345678909', '52998224725'])) == {'123.456.789-09', '529.982.247-25'}
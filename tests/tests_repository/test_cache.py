@@ -0,0 +1,40 @@
+from dataclasses import replace
+
+from gerador_docs import CPF, DadosPessoais
+from gerador_docs.repository import CachedRepository, create_engine
+
+def test_create_engine_com_cache(tmp_path):
+    with create_engine(f'sqlite:///{tmp_path}/dados.db', cache_size=10) as repo:
+        assert isinstance(repo, CachedRepository)
+
+def test_cache_hits_misses(tmp_path, mocker, dados_pessoais: DadosPessoais):
+    with create_engine(f'tinydb://{tmp_path}/dados.json', cache_size=10) as repo:
+        repo.add(dados_pessoais)
+        get = mocker.spy(repo._repository, 'get')
+
+        for _ in range(3):
+            assert repo.get('123.456.789-09').nome_completo == 'João da Silva'
+
+        assert get.call_count == 1
+        assert repo.stats.to_dict() == {'hits': 2, 'misses': 1, 'evictions': 0, 'invalidations': 0}
+
+def test_cache_invalida_nas_escritas(tmp_path, dados_pessoais: DadosPessoais):
+    with create_engine(f'tinydb://{tmp_path}/dados.json', cache_size=10) as repo:
+        repo.add(dados_pessoais)
+        repo.get('12345678909')
+
+        repo.update(replace(dados_pessoais, profissao='Agricultor'))
+        assert repo.get('12345678909').profissao == 'Agricultor'
+
+        repo.remove('12345678909')
+        assert repo.get('12345678909') is None
+        assert repo.stats.invalidations == 2
+
+def test_cache_lru_limitado(tmp_path, dados_pessoais: DadosPessoais):
+    outra = replace(dados_pessoais, cpf=CPF('52998224725'))
+    with create_engine(f'sqlite:///{tmp_path}/dados.db', cache_size=1) as repo:
+        repo.add_many([dados_pessoais, outra])
+
+        assert set(repo.get_many(['12345678909', '52998224725'])) == {'123.456.789-09', '529.982.247-25'}
+        assert len(repo._cache) == 1
+        assert repo.stats.evictions == 1
@@ -0,0 +1,83 @@
+from dataclasses import replace
+
+import pytest
+
+from gerador_docs import CPF, DadosPessoais
+from gerador_docs.errors import DuplicateRecordError
+from gerador_docs.repository import IRepository, create_engine
+
+@pytest.fixture
+def pessoas(dados_pessoais: DadosPessoais):
+    return [
+        dados_pessoais,
+        replace(dados_pessoais, nome_completo='Maria da Silva', cpf=CPF('52998224725'), genero='F', endereco=[]),
+    ]
+
+def test_repository_crud(repo: IRepository, dados_pessoais: DadosPessoais):
+    assert isinstance(repo, IRepository)
+    repo.add(dados_pessoais)
+
+    assert repo.get('12345678909').to_dict() == dados_pessoais.to_dict()
+    with pytest.raises(DuplicateRecordError):
+        repo.add(dados_pessoais)
+
+    assert repo.update(replace(dados_pessoais, profissao='Agricultor'))
+    assert repo.get('123.456.789-09').profissao == 'Agricultor'
+
+    assert repo.remove('12345678909')
+    assert repo.get('12345678909') is None
+    assert not repo.update(dados_pessoais)
+    assert not repo.remove('12345678909')
+
+def test_repository_add_many(repo: IRepository, pessoas):
+    assert repo.add_many(pessoas) == 2
+    assert [pessoa.to_dict() for pessoa in repo.list()] == [pessoa.to_dict() for pessoa in pessoas]
+
+def test_repository_add_many_atomico(repo: IRepository, pessoas):
+    repo.add(pessoas[0])
+    with pytest.raises(DuplicateRecordError):
+        repo.add_many(reversed(pessoas))
+    assert repo.get('52998224725') is None
+
+def test_repository_upsert_get_remove_many(repo: IRepository, pessoas):
+    repo.add(pessoas[0])
+    alterada = replace(pessoas[0], estado_civil='casado')
+
+    assert repo.upsert_many([alterada, pessoas[1]]) == 2
+    encontrados = repo.get_many(['12345678909', '529.982.247-25', '11144477735'])
+    assert set(encontrados) == {'123.456.789-09', '529.982.247-25'}
+    assert encontrados['123.456.789-09'].estado_civil == 'casado'
+
+    assert repo.remove_many(['12345678909', '52998224725', '11144477735']) == 2
+    assert list(repo.list()) == []
+
+def test_tinydb_grava_uma_vez_por_lote(tmp_path, mocker, pessoas):
+    with create_engine(f'tinydb://{tmp_path}/dados.json') as repo:
+        escrita = mocker.spy(repo._db.storage.storage, 'write')
+        repo.upsert_many(pessoas)
+        repo.remove_many(['12345678909', '52998224725'])
+
+    # upsert (1) + remove (1) + close (nada pendente)
+    assert escrita.call_count == 2
+
+def test_repository_query(repo: IRepository, pessoas):
+    repo.add_many(pessoas)
+
+    assert [p.numero_cpf for p in repo.query(nome_completo='  MARIA da silva ')] == ['529.982.247-25']
+    assert [p.numero_cpf for p in repo.query(nome_completo='joao da silva', bairro='Centro')] == ['123.456.789-09']
+    assert repo.query(nome_completo='Maria da Silva', bairro='Centro') == []
+
+def test_tinydb_indices_reconstruidos_ao_abrir(tmp_path, pessoas):
+    with create_engine(f'tinydb://{tmp_path}/dados.json') as repo:
+        repo.add_many(pessoas)
+        repo.upsert_many([replace(pessoas[1], nome_completo='Maria José', endereco=pessoas[0].endereco)])
+
+    with create_engine(f'tinydb://{tmp_path}/dados.json') as repo:
+        assert repo._indices_cache is None
+        assert [p.numero_cpf for p in repo.query(bairro='CENTRO')] == ['123.456.789-09', '529.982.247-25']
+        assert repo.query(nome_completo='Maria da Silva') == []
+        assert repo.get('52998224725').nome_completo == 'Maria José'
+
+        repo.remove('12345678909')
+        assert [p.numero_cpf for p in repo.query(bairro='centro')] == ['529.982.247-25']
+        assert repo._indices_cache.por_cpf == {'529.982.247-25': 2}
@@ -0,0 +1,71 @@
+from dataclasses import replace
+
+import pytest
+
+from gerador_docs import CPF, DadosPessoais
+from gerador_docs.errors import DuplicateRecordError
+from gerador_docs.repository import SqliteRepository, create_engine
+
+@pytest.fixture
+def repo(tmp_path):
+    with create_engine(f'sqlite:///{tmp_path}/dados.db') as repo:
+        yield repo
+
+def test_create_engine_sqlite(repo: SqliteRepository):
+    assert isinstance(repo, SqliteRepository)
+    assert repo._conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+def test_sqlite_add_get(repo, dados_pessoais: DadosPessoais):
+    repo.add(dados_pessoais)
+
+    for chave in ('12345678909', '123.456.789-09'):
+        pessoa = repo.get(chave)
+        assert pessoa is not None
+        assert pessoa.to_dict() == dados_pessoais.to_dict()
+
+    assert repo.get('52998224725') is None
+
+def test_sqlite_cpf_unico(repo, dados_pessoais: DadosPessoais):
+    repo.add(dados_pessoais)
+    with pytest.raises(DuplicateRecordError):
+        repo.add(dados_pessoais)
+
+def test_sqlite_update_remove(repo, dados_pessoais: DadosPessoais):
+    assert not repo.update(dados_pessoais)
+    repo.add(dados_pessoais)
+    assert repo.update(replace(dados_pessoais, estado_civil='casado', endereco=[]))
+
+    atualizado = repo.get('12345678909')
+    assert atualizado.estado_civil == 'casado'
+    assert atualizado.endereco == {'residencial': (), 'trabalho': ()}
+
+    assert repo.remove('123.456.789-09')
+    assert not repo.remove('123.456.789-09')
+    assert list(repo.list()) == []
+
+def test_sqlite_list(repo, dados_pessoais: DadosPessoais):
+    outra = replace(dados_pessoais, cpf=CPF('52998224725'), endereco=[])
+    repo.add(outra)
+    repo.add(dados_pessoais)
+
+    assert [pessoa.to_dict() for pessoa in repo.list()] == [outra.to_dict(), dados_pessoais.to_dict()]
+
+def test_sqlite_documentos(repo, dados_pessoais: DadosPessoais):
+    repo.add(dados_pessoais)
+    repo.add_documento('12345678909', 'CAF', 'PE102024.01.002163587CAF')
+
+    assert repo.get_por_documento('CAF', 'PE102024.01.002163587CAF').numero_cpf == '123.456.789-09'
+    assert repo.get_por_documento('CAR', 'PE102024.01.002163587CAF') is None
+    with pytest.raises(DuplicateRecordError):
+        repo.add_documento('12345678909', 'CAF', 'PE102024.01.002163587CAF')
+
+def test_sqlite_add_documentos(repo, dados_pessoais: DadosPessoais):
+    outra = replace(dados_pessoais, cpf=CPF('52998224725'))
+    repo.add_many([dados_pessoais, outra])
+
+    assert repo.add_documentos([('12345678909', 'CAR', 'CAR-1'), ('529.982.247-25', 'CAR', 'CAR-2')]) == 2
+    assert repo.get_por_documento('CAR', 'CAR-2').numero_cpf == '529.982.247-25'
+    # a transação é desfeita inteira se algum documento falhar
+    with pytest.raises(DuplicateRecordError):
+        repo.add_documentos([('12345678909', 'CAR', 'CAR-3'), ('52998224725', 'CAR', 'CAR-1')])
+    assert repo.get_por_documento('CAR', 'CAR-3') is None